@@ -1,9 +1,61 @@
 import dbPool from "../config/mysqldb.js";
 import { inngest } from '../inggest/index.js';
 
+// (user, Idempotency-Key) -> response đã trả: client gửi lại (retry sau timeout) nhận lại đúng
+// đơn cũ thay vì tạo thêm một đơn pending giữ ghế 15 phút. Key gắn với user nên đơn của
+// người này không bao giờ bị trả cho người khác dù client gửi trùng key
+const IDEMPOTENCY_TTL_MS = 15 * 60 * 1000;
+const idempotentBookings = new Map();
+
+const startIdempotentBooking = (key, res) => {
+  const now = Date.now();
+  for (const [storedKey, entry] of idempotentBookings) {
+    if (entry.expiresAt <= now) idempotentBookings.delete(storedKey);
+  }
+
+  const previous = idempotentBookings.get(key);
+  if (previous) {
+    if (previous.body) {
+      res.status(previous.status).json(previous.body);
+    } else {
+      res.status(409).json({ success: false, message: 'Đơn hàng đang được xử lý, vui lòng chờ' });
+    }
+    return false;
+  }
+
+  idempotentBookings.set(key, { expiresAt: now + IDEMPOTENCY_TTL_MS, status: null, body: null });
+
+  // Chỉ nhớ response thành công; thất bại thì xóa để client có thể thử lại
+  const sendJson = res.json.bind(res);
+  res.json = (body) => {
+    if (body && body.success) {
+      idempotentBookings.set(key, { expiresAt: now + IDEMPOTENCY_TTL_MS, status: res.statusCode, body });
+    } else {
+      idempotentBookings.delete(key);
+    }
+    return sendJson(body);
+  };
+  return true;
+};
+
+// User đã đăng nhập (protectRoute) hoặc user_id trong body (chatbot, khách)
+const idempotencyScope = (req) => {
+  const clientKey = req.get('Idempotency-Key');
+  if (!clientKey) return null;
+  const owner = req.user?.id ?? req.body?.user_id ?? 'guest';
+  return `${owner}:${clientKey}`;
+};
+
 export const createBooking = async (req, res) => {
-  const connection = await dbPool.getConnection();
+  const idempotencyKey = idempotencyScope(req);
+  if (idempotencyKey && !startIdempotentBooking(idempotencyKey, res)) {
+    return;
+  }
+
+  let connection;
   try {
+    connection = await dbPool.getConnection();
+
     // Kiểm tra Inngest keys
     if (!process.env.INNGEST_EVENT_KEY || !process.env.INNGEST_SIGNING_KEY) {
       console.error('Missing Inngest keys:', {
@@ -284,11 +336,13 @@ export const createBooking = async (req, res) => {
     });
 
   } catch (error) {
-    await connection.rollback();
+    if (connection) await connection.rollback();
     console.error('Error creating booking:', error);
     return res.status(500).json({ success: false, message: `Lỗi server: ${error.message}` });
   } finally {
-    connection.release();
+    if (connection) connection.release();
+    // Chưa trả response nào (vd: rollback lỗi) thì bỏ đánh dấu "đang xử lý" để client thử lại được
+    if (idempotencyKey && !res.headersSent) idempotentBookings.delete(idempotencyKey);
   }
 };
 export const getDetailOrder = async (req, res) => {
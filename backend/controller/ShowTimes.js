@@ -480,6 +480,48 @@ export const getAllSeatsWithStatus = async (req, res) => {
   }
 };
 
+export const getShowtimeDetail = async (req, res) => {
+  try {
+    const { showtimeId } = req.params;
+
+    if (!showtimeId || isNaN(showtimeId)) {
+      return res.status(400).json({
+        success: false,
+        message: "showtimeId không hợp lệ",
+      });
+    }
+
+    const [rows] = await dbPool.query(
+      `SELECT 
+         s.id,
+         s.movie_id,
+         m.title AS movie_title,
+         s.room_id,
+         r.name AS room_name,
+         r.cinema_clusters_id AS cinema_id,
+         c.name AS cinema_name,
+         s.start_time,
+         s.end_time,
+         s.status
+       FROM showtimes s
+       JOIN movies m ON s.movie_id = m.id
+       JOIN rooms r ON s.room_id = r.id
+       JOIN cinema_clusters c ON r.cinema_clusters_id = c.id
+       WHERE s.id = ?`,
+      [showtimeId]
+    );
+
+    if (rows.length === 0) {
+      return res.status(404).json({ success: false, message: "Không tìm thấy suất chiếu" });
+    }
+
+    res.status(200).json({ success: true, showtime: rows[0] });
+  } catch (error) {
+    console.error("❌ Lỗi getShowtimeDetail:", error);
+    res.status(500).json({ success: false, message: "Lỗi server" });
+  }
+};
+
 export const getOccupieSeat = async (req, res) => {
   try {
     const { showtimeId } = req.params;
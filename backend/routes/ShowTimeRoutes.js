@@ -1,5 +1,5 @@
 import express from "express"
-import { createShowTime, deleteShowTime, getAllSeatsWithStatus, getAllShow, getCinemaByMovie, getOccupieSeat, getShow, getShowTimeByCine, getShowTimeOnCinema, updateShowTime } from "../controller/ShowTimes.js";
+import { createShowTime, deleteShowTime, getAllSeatsWithStatus, getAllShow, getCinemaByMovie, getOccupieSeat, getShow, getShowtimeDetail, getShowTimeByCine, getShowTimeOnCinema, updateShowTime } from "../controller/ShowTimes.js";
 
 
 const ShowTimeRoute = express.Router()
@@ -8,6 +8,7 @@ ShowTimeRoute.get("/all",getAllShow);
 ShowTimeRoute.get("/movies/:movie_id",getShow);
 ShowTimeRoute.get("/seat/:showtimeId",getOccupieSeat)
 ShowTimeRoute.get("/seats-status/:showtimeId", getAllSeatsWithStatus);
+ShowTimeRoute.get("/detail/:showtimeId", getShowtimeDetail);
 
 ShowTimeRoute.get("/datve/:cinema_Id/:date",getShowTimeByCine)
 ShowTimeRoute.post("/", createShowTime);
@@ -0,0 +1,388 @@
+from typing import Any, Text, Dict, List
+from rasa_sdk import Action, Tracker
+from rasa_sdk.executor import CollectingDispatcher
+from rasa_sdk.events import SlotSet
+from datetime import datetime
+import logging
+
+from . import http_client, metrics
+from .booking_submissions import idempotency_key
+from .catalog import find_cinema_by_name
+from .http_client import BackendError, BackendTimeout
+from .latency_budget import BOOKING_LATENCY_BUDGET, budgeted
+from .metrics import instrumented
+from .payload_log import log_payload
+from .preflight import Preflight
+from .seat_parser import MAX_SEATS_PER_BOOKING, has_range_syntax, parse_seat_expression
+from .stores import booking_submissions, price_cache, seat_snapshots, showtime_store
+
+logger = logging.getLogger(__name__)
+
+
+class ActionCreateBooking(Action):
+    def name(self) -> Text:
+        return "action_create_booking"
+
+    @instrumented
+    @budgeted(BOOKING_LATENCY_BUDGET)
+    async def run(self, dispatcher: CollectingDispatcher,
+            tracker: Tracker,
+            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+        
+        showtime_id = tracker.get_slot("showtime_id")
+        seat_numbers = tracker.get_slot("seat_numbers")
+        user_id = tracker.get_slot("user_id") or "guest_user"
+        logger.info(f"Retrieved user_id: {user_id} (type: {type(user_id)})")
+        latest_message = tracker.latest_message.get('text', '')
+        # Lấy từ latest message nếu slot trống
+        if not showtime_id:
+            logger.info(f"Latest message: {latest_message}")
+            import re
+            showtime_match = re.search(r'suất\s+(\d+)', latest_message, re.IGNORECASE)
+            if showtime_match:
+                showtime_id = showtime_match.group(1)
+                logger.info(f"Extracted showtime_id: {showtime_id}")
+        
+        if not showtime_id:
+            dispatcher.utter_message(
+                text="❌ Thiếu **mã suất chiếu**.\n"
+                     "Vui lòng nói lại với format: 'Đặt vé suất [ID], ghế [A1 A2]'"
+            )
+            return []
+        
+        # Đọc danh sách ghế (kể cả range "A1-A8", "hàng C từ 5 đến 10")
+        selection = self.select_seats(seat_numbers, latest_message)
+        
+        if selection.invalid:
+            dispatcher.utter_message(
+                text=f"❌ Không hiểu cách chọn ghế: **{', '.join(selection.invalid)}**\n"
+                     f"Mỗi range chỉ trong một hàng và tối đa {MAX_SEATS_PER_BOOKING} ghế, ví dụ: 'A1-A8' hoặc 'hàng C từ 5 đến 10'."
+            )
+            return []
+        
+        if selection.duplicates:
+            dispatcher.utter_message(
+                text=f"❌ Ghế **{', '.join(selection.duplicates)}** bị chọn trùng.\n"
+                     "Vui lòng nói lại danh sách ghế, mỗi ghế một lần."
+            )
+            return []
+        
+        seat_numbers = selection.seats
+        
+        if not seat_numbers:
+            dispatcher.utter_message(
+                text="❌ Bạn chưa chọn **ghế ngồi**.\n"
+                     "Vui lòng nói lại: 'Đặt vé suất " + str(showtime_id) + ", ghế A1 A2'"
+            )
+            return []
+        
+        if len(seat_numbers) > MAX_SEATS_PER_BOOKING:
+            dispatcher.utter_message(
+                text=f"❌ Mỗi lần chỉ đặt được tối đa {MAX_SEATS_PER_BOOKING} ghế "
+                     f"(bạn đã chọn {len(seat_numbers)} ghế)."
+            )
+            return []
+        
+        # User nói lại cùng yêu cầu sau khi đã đặt thành công -> trả lại đúng đơn đó
+        # (chỉ trong cùng hội thoại)
+        booking_key = idempotency_key(tracker.sender_id, user_id, showtime_id, seat_numbers)
+        previous = booking_submissions.completed(booking_key)
+        if previous:
+            logger.info(f"Booking {booking_key} already created, replaying its result")
+            return self.handle_booking_response(dispatcher, previous, showtime_id, seat_numbers)
+        
+        preflight = Preflight()
+        try:
+            # ========================================
+            # BƯỚC 1: Pre-flight song song
+            # ========================================
+            # Ghế, thông tin suất chiếu (cinema_id + date) và rạp theo slot không
+            # phụ thuộc nhau nên fetch cùng lúc, mỗi resource chỉ fetch một lần
+            seats_task = preflight.fetch(
+                "seats", lambda: seat_snapshots.get(showtime_id)
+            )
+            showtime_task = preflight.fetch(
+                "showtime", lambda: showtime_store.get(showtime_id)
+            )
+            cinema_name = tracker.get_slot("cinema_name")
+            if cinema_name:
+                preflight.fetch(
+                    "cinema_from_name", lambda: self.find_cinema_id_from_name(cinema_name)
+                )
+            
+            status_code, snapshot = await seats_task
+            
+            if status_code != 200:
+                dispatcher.utter_message(
+                    text=f"❌ Không thể lấy thông tin ghế cho suất chiếu ID {showtime_id}"
+                )
+                return []
+            
+            if not snapshot:
+                dispatcher.utter_message(text="❌ Không thể lấy thông tin ghế")
+                return []
+            
+            # Kiểm tra mọi ghế một lượt trên snapshot, báo hết ghế không khả dụng
+            seat_infos, unavailable = snapshot.validate(seat_numbers)
+            if unavailable:
+                dispatcher.utter_message(
+                    text=f"❌ Ghế **{', '.join(unavailable)}** không khả dụng hoặc đã được đặt!"
+                )
+                return []
+            
+            seat_data = snapshot.data
+            
+            # Thử lấy cinema_id từ roomInfo hoặc các field khác
+            room_info = seat_data.get('roomInfo', {})
+            cinema_id = (
+                seat_data.get('cinema_id') or 
+                seat_data.get('cinemaId') or 
+                seat_data.get('cinema_cluster_id') or
+                room_info.get('cinema_id') or
+                room_info.get('cinema_cluster_id')
+            )
+            
+            logger.info(f"Seat data keys: {seat_data.keys()}")
+            log_payload(logger, "Room info", room_info)
+            logger.info(f"Extracted cinema_id: {cinema_id}")
+            
+            showtime_info = await showtime_task
+            
+            # Nếu không tìm thấy cinema_id, lấy từ thông tin suất chiếu
+            if not cinema_id and showtime_info:
+                cinema_id = showtime_info.cinema_id
+                logger.info(f"Extracted cinema_id from showtime: {cinema_id}")
+            
+            # Nếu vẫn không có cinema_id, lấy từ conversation context
+            # (cinema được chọn trước đó)
+            if not cinema_id and cinema_name:
+                cinema_id = await preflight.fetch(
+                    "cinema_from_name", lambda: self.find_cinema_id_from_name(cinema_name)
+                )
+                logger.info(f"Found cinema_id from name: {cinema_id}")
+            
+            if not cinema_id:
+                dispatcher.utter_message(
+                    text="❌ Không thể xác định rạp chiếu.\n\n"
+                         "Vui lòng thử lại bằng cách:\n"
+                         "1. Xem lịch chiếu phim tại rạp trước\n"
+                         "2. Sau đó đặt vé với ID suất chiếu\n\n"
+                         "Ví dụ: 'Lịch chiếu tại BAC Quang Trung' → sau đó 'Đặt vé suất 7, ghế A1 A2'"
+                )
+                return []
+            
+            logger.info(f"Final cinema_id: {cinema_id} for showtime {showtime_id}")
+            
+            # Cần date để lấy giá vé từ /ticket-prices/getprice/:cinemaId/:date
+            showtime_date = self.get_showtime_date(showtime_info)
+            
+            # Fallback to today if can't find date
+            if not showtime_date:
+                showtime_date = datetime.now().strftime('%Y-%m-%d')
+                logger.info(f"Using today as fallback date: {showtime_date}")
+            
+            # ========================================
+            # BƯỚC 2: Lấy giá vé (phụ thuộc cinema_id + date)
+            # ========================================
+            # Không lấy được bảng giá thì price_cache trả bảng giá mặc định
+            price_table = await preflight.fetch(
+                ("prices", cinema_id, showtime_date),
+                lambda: price_cache.get(cinema_id, showtime_date)
+            )
+            
+            # ========================================
+            # BƯỚC 3: Chuẩn bị tickets array với đúng format
+            # ========================================
+            tickets = []
+            for seat_number, seat_info in zip(seat_numbers, seat_infos):
+                seat_type = seat_info.seat_type
+                
+                logger.info(f"Seat {seat_number}: type = {seat_type}")
+                
+                # Lấy ticket_price từ bảng giá theo seat_type
+                ticket_price, used_fallback = price_table.price_for(seat_type)
+                
+                if used_fallback and not price_table.is_default:
+                    price_cache.record_fallback()
+                    logger.warning(f"Price not found for type {seat_type}, using default: {ticket_price}")
+                
+                # Ensure ticket_price is number
+                ticket_price = float(ticket_price)
+                
+                # Backend expects seat_id to be seat_number (A1, A2, etc)
+                tickets.append({
+                    "seat_id": seat_number,  # seat_number như A1, A2
+                    "ticket_price": ticket_price  # Phải là number
+                })
+            
+            log_payload(logger, "Prepared tickets", tickets)
+            
+            # Validate tickets trước khi gửi
+            for ticket in tickets:
+                if not ticket.get('seat_id'):
+                    dispatcher.utter_message(text="❌ Lỗi: seat_id bị thiếu")
+                    return []
+                if not ticket.get('ticket_price') or not isinstance(ticket['ticket_price'], (int, float)):
+                    dispatcher.utter_message(
+                        text=f"❌ Lỗi: Không lấy được giá vé cho ghế {ticket.get('seat_id')}\n"
+                             f"ticket_price = {ticket.get('ticket_price')} (type: {type(ticket.get('ticket_price'))})"
+                    )
+                    return []
+            
+            # ========================================
+            # BƯỚC 4: Chuẩn bị dữ liệu booking với đầy đủ trường
+            # ========================================
+            booking_data = {
+                "cinema_id": cinema_id,
+                "user_id": user_id,
+                "showtime_id": int(showtime_id),
+                "tickets": tickets,
+                "services": [],
+                "payment_method": "qr code",  # Mặc định QR code
+                "status": "pending"  # Mặc định pending
+            }
+            
+            log_payload(logger, "Creating booking", booking_data)
+            
+            # ========================================
+            # BƯỚC 5: Gọi API tạo booking
+            # ========================================
+            # Cùng key -> cùng đơn: retry / request trùng không tạo đơn thứ hai
+            response = await booking_submissions.submit(
+                booking_key,
+                lambda: http_client.post(
+                    "/bookings/create-booking",
+                    json=booking_data,
+                    timeout=10,
+                    headers={"Idempotency-Key": booking_key}
+                )
+            )
+            
+            logger.info(f"Booking response status: {response.status_code}")
+            
+            # Trạng thái ghế đã thay đổi (hoặc snapshot đã cũ nếu đặt thất bại)
+            seat_snapshots.invalidate(showtime_id)
+            
+            return self.handle_booking_response(dispatcher, response, showtime_id, seat_numbers)
+                
+        except BackendTimeout:
+            dispatcher.utter_message(text="⏱️ Timeout khi đặt vé. Vui lòng thử lại.")
+        except BackendError as e:
+            logger.error(f"Request error in booking: {str(e)}")
+            dispatcher.utter_message(text="❌ Lỗi kết nối API khi đặt vé.")
+        except Exception as e:
+            logger.error(f"Error in booking: {str(e)}", exc_info=True)
+            dispatcher.utter_message(
+                text=f"❌ Có lỗi xảy ra khi đặt vé: {str(e)}"
+            )
+        finally:
+            preflight.cancel()
+        
+        return []
+    
+    def handle_booking_response(self, dispatcher, response, showtime_id, seat_numbers):
+        """Báo kết quả tạo booking (cả khi trả lại đơn đã tạo trước đó)"""
+        if response.status_code == 201 or response.status_code == 200:
+            result = response.json()
+
+            if not result.get('success'):
+                error_msg = result.get('message', 'Lỗi không xác định')
+                dispatcher.utter_message(
+                    text=f"❌ **Đặt vé thất bại!**\n\nLý do: {error_msg}"
+                )
+                return []
+
+            data = result.get('data', {})
+            order_id = data.get('order_id')
+
+            if order_id:
+                seats_display = ', '.join(seat_numbers) if isinstance(seat_numbers, list) else seat_numbers
+                grand_total = data.get('grand_total', 0)
+
+                message = "✅ **ĐẶT VÉ THÀNH CÔNG!**\n\n"
+                message += f"📋 **Mã đơn hàng:** {order_id}\n"
+                message += f"🎬 **Suất chiếu:** ID {showtime_id}\n"
+                message += f"🪑 **Ghế đã đặt:** {seats_display}\n"
+                message += f"💰 **Tổng tiền:** {grand_total:,} VND\n\n"
+                message += "⏰ Vui lòng **thanh toán trong 15 phút** để giữ vé!\n\n"
+                message += "💳 Bạn có thể hỏi: 'Thanh toán như thế nào?' để được hướng dẫn."
+
+                dispatcher.utter_message(text=message)
+                return [
+                    SlotSet("order_id", order_id),
+                    SlotSet("grand_total", float(grand_total)),  # Add this line
+                    SlotSet("showtime_id", None),
+                    SlotSet("seat_numbers", None)
+                ]
+            else:
+                dispatcher.utter_message(
+                    text="✅ Đặt vé thành công nhưng không nhận được mã đơn hàng."
+                )
+        else:
+            try:
+                error_data = response.json()
+                error_msg = error_data.get('message', '') or error_data.get('error', 'Lỗi không xác định')
+            except:
+                error_msg = f"HTTP {response.status_code}"
+
+            logger.error(f"Booking failed: {error_msg}")
+            metrics.count_error("action_create_booking", "booking_rejected")
+            logger.error(f"Response body: {response.text}")
+
+            dispatcher.utter_message(
+                text=f"❌ **Đặt vé thất bại!**\n\n"
+                     f"Lý do: {error_msg}\n\n"
+                     f"Có thể:\n"
+                     f"• Ghế đã được đặt\n"
+                     f"• Suất chiếu không còn khả dụng\n"
+                     f"• Mã ghế không đúng"
+            )
+        
+        return []
+    
+    def get_showtime_date(self, showtime_info):
+        """Ngày chiếu (YYYY-MM-DD) từ thông tin suất chiếu"""
+        if not showtime_info:
+            return None
+        
+        # Parse ISO date: "2025-10-11T23:10:00.000Z"
+        start = showtime_info.start
+        if start is None:
+            return None
+        
+        showtime_date = start.strftime('%Y-%m-%d')
+        logger.info(f"Extracted showtime date: {showtime_date}")
+        return showtime_date
+    
+    def select_seats(self, slot_value, latest_message):
+        """
+        Ghế theo slot seat_numbers, hoặc theo câu gần nhất khi slot trống, câu có
+        range / chọn theo hàng, hay câu cho nhiều ghế hơn slot: NLU có thể chỉ bắt
+        được "A1" trong "A1-A8" và đơn sẽ lặng lẽ chỉ có một ghế.
+        """
+        if isinstance(slot_value, list):
+            slot_value = ' '.join(str(s) for s in slot_value)
+        if not slot_value or has_range_syntax(latest_message):
+            return self.extract_seat_numbers(latest_message or slot_value or '')
+
+        slot_selection = self.extract_seat_numbers(slot_value)
+        text_selection = self.extract_seat_numbers(latest_message)
+        if len(text_selection.seats) > len(slot_selection.seats):
+            return text_selection
+        return slot_selection
+    
+    def extract_seat_numbers(self, text):
+        """Extract seat numbers từ text: "A1 A2", "A1-A8", "hàng C từ 5 đến 10", "AA12", ..."""
+        selection = parse_seat_expression(text)
+        logger.info(f"Extracted seats from '{text}': {selection.seats}")
+        return selection
+    
+    async def find_cinema_id_from_name(self, cinema_name):
+        """Tìm cinema_id từ tên rạp"""
+        try:
+            cinema_id, _ = await find_cinema_by_name(cinema_name)
+            return cinema_id
+            
+        except Exception as e:
+            logger.error(f"Error finding cinema: {str(e)}")
+            return None
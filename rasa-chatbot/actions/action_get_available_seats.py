@@ -0,0 +1,116 @@
+from typing import Any, Text, Dict, List
+from rasa_sdk import Action, Tracker
+from rasa_sdk.executor import CollectingDispatcher
+import logging
+
+from .http_client import BackendError, BackendTimeout
+from .latency_budget import budgeted
+from .metrics import instrumented
+from .rendering import render_seat_status, render_seat_suggestions
+from .seat_recommender import SeatGrid
+from .stores import seat_messages, seat_snapshots
+from .text_normalize import fold_text
+
+logger = logging.getLogger(__name__)
+
+# Gợi ý ghế liền nhau: loại ghế user hay gọi (đã bỏ dấu) -> seat_type
+SEAT_TYPE_KEYWORDS = {
+    'ghe vip': 'vip',
+    'vip': 'vip',
+    'ghe doi': 'couple',
+    'couple': 'couple',
+    'sweetbox': 'sweetbox',
+    'ghe thuong': 'standard',
+    'standard': 'standard',
+}
+MAX_SUGGESTED_SEATS = 10
+
+
+class ActionGetAvailableSeats(Action):
+    def name(self) -> Text:
+        return "action_get_available_seats"
+
+    @instrumented
+    @budgeted()
+    async def run(self, dispatcher: CollectingDispatcher,
+            tracker: Tracker,
+            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+        
+        showtime_id = tracker.get_slot("showtime_id")
+        
+        if not showtime_id:
+            dispatcher.utter_message(
+                text="❓ Bạn chưa cung cấp mã suất chiếu.\n\n"
+                     "📌 Vui lòng xem lịch chiếu trước, sau đó cho tôi biết **ID suất chiếu** bạn muốn xem.\n"
+                     "Ví dụ: 'Xem ghế trống suất 5' hoặc 'Kiểm tra ghế ID 7'"
+            )
+            return []
+        
+        try:
+            status_code, snapshot = await seat_snapshots.get(showtime_id)
+            
+            if status_code == 200:
+                if not snapshot:
+                    dispatcher.utter_message(
+                        text="❌ Không thể lấy thông tin ghế. Vui lòng thử lại."
+                    )
+                    return []
+                
+                summary = snapshot.data.get('summary', {})
+                logger.info(f"Showtime {showtime_id}: {summary.get('available')} available, {summary.get('booked') + summary.get('reserved')} occupied")
+                
+                num_tickets = self.get_num_tickets(tracker)
+                seat_type = self.get_requested_seat_type(tracker.latest_message.get('text', ''))
+                
+                # Key theo nội dung snapshot: fetch lại mà ghế không đổi vẫn dùng lại message
+                cache_key = ('seats', snapshot.showtime_id, snapshot.content, num_tickets, seat_type)
+                message = seat_messages.get(cache_key)
+                if not message:
+                    message = render_seat_status(showtime_id, snapshot.data)
+                    if num_tickets and summary.get('available', 0) > 0:
+                        blocks = SeatGrid(snapshot.data).recommend(num_tickets, seat_type)
+                        message += render_seat_suggestions(showtime_id, num_tickets, blocks)
+                    seat_messages.put(cache_key, message)
+                
+                dispatcher.utter_message(text=message)
+                
+            elif status_code == 404:
+                dispatcher.utter_message(
+                    text=f"❌ Không tìm thấy suất chiếu ID {showtime_id}.\n"
+                         "Vui lòng kiểm tra lại ID suất chiếu."
+                )
+            elif status_code == 400:
+                dispatcher.utter_message(
+                    text=f"❌ Mã suất chiếu '{showtime_id}' không hợp lệ."
+                )
+            else:
+                dispatcher.utter_message(
+                    text=f"❌ Lỗi khi lấy thông tin ghế (HTTP {status_code})."
+                )
+                
+        except BackendTimeout:
+            dispatcher.utter_message(text="⏱️ Timeout khi kết nối API. Vui lòng thử lại.")
+        except BackendError as e:
+            logger.error(f"Request error in get seats: {str(e)}")
+            dispatcher.utter_message(text="❌ Lỗi kết nối API. Vui lòng kiểm tra backend server.")
+        except Exception as e:
+            logger.error(f"Error in get seats: {str(e)}", exc_info=True)
+            dispatcher.utter_message(text="❌ Có lỗi xảy ra khi lấy thông tin ghế.")
+        
+        return []
+    
+    def get_num_tickets(self, tracker):
+        """Số vé user muốn đặt (slot num_tickets), None nếu chưa nói"""
+        try:
+            num_tickets = int(float(tracker.get_slot("num_tickets") or 0))
+        except (TypeError, ValueError):
+            return None
+        return num_tickets if 0 < num_tickets <= MAX_SUGGESTED_SEATS else None
+    
+    def get_requested_seat_type(self, text):
+        """Loại ghế user nhắc tới trong câu ("ghế vip", "ghế đôi", ...)"""
+        folded = f" {fold_text(text)} "
+        for keyword, seat_type in SEAT_TYPE_KEYWORDS.items():
+            if f" {keyword} " in folded:
+                return seat_type
+        return None
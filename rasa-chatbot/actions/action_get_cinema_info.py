@@ -0,0 +1,55 @@
+from typing import Any, Text, Dict, List
+from rasa_sdk import Action, Tracker
+from rasa_sdk.executor import CollectingDispatcher
+import logging
+
+from .catalog import cinema_catalog
+from .latency_budget import budgeted
+from .metrics import instrumented
+
+logger = logging.getLogger(__name__)
+
+
+class ActionGetCinemaInfo(Action):
+    def name(self) -> Text:
+        return "action_get_cinema_info"
+
+    @instrumented
+    @budgeted()
+    async def run(self, dispatcher: CollectingDispatcher,
+            tracker: Tracker,
+            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+        
+        cinema_name = tracker.get_slot("cinema_name")
+        
+        try:
+            index = await cinema_catalog.index()
+            
+            if index:
+                cinemas = index.find_all(cinema_name) if cinema_name else index.items
+                
+                if cinemas:
+                    message = "🎬 **THÔNG TIN RẠP CHIẾU PHIM**\n\n"
+                    
+                    for cinema in cinemas[:5]:
+                        message += f"🏢 **{cinema.name or 'N/A'}**\n"
+                        message += f"📍 Địa chỉ: {cinema.address or 'N/A'}\n"
+                        message += f"☎️ Hotline: {cinema.phone or 'N/A'}\n"
+                        message += f"🆔 ID: {cinema.id}\n\n"
+                    
+                    message += "💡 Bạn có thể hỏi: 'Lịch chiếu tại [tên rạp]' để xem lịch chiếu!"
+                    
+                    dispatcher.utter_message(text=message)
+                else:
+                    dispatcher.utter_message(
+                        text="❌ Không tìm thấy rạp phù hợp.\n"
+                             "Vui lòng thử lại với tên rạp khác."
+                    )
+            else:
+                dispatcher.utter_message(text="Không thể lấy thông tin rạp.")
+                
+        except Exception as e:
+            logger.error(f"Error in cinema info: {str(e)}")
+            dispatcher.utter_message(text="Có lỗi xảy ra.")
+        
+        return []
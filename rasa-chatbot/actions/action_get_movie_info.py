@@ -0,0 +1,86 @@
+from typing import Any, Text, Dict, List
+from rasa_sdk import Action, Tracker
+from rasa_sdk.executor import CollectingDispatcher
+from datetime import datetime
+import logging
+
+from .catalog import movie_catalog
+from .latency_budget import budgeted
+from .metrics import instrumented
+
+logger = logging.getLogger(__name__)
+
+
+class ActionGetMovieInfo(Action):
+    def name(self) -> Text:
+        return "action_get_movie_info"
+
+    @instrumented
+    @budgeted()
+    async def run(self, dispatcher: CollectingDispatcher,
+            tracker: Tracker,
+            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+        
+        movie_name = tracker.get_slot("movie_name")
+        
+        try:
+            index = await movie_catalog.index()
+            
+            if index:
+                movies = index.find_all(movie_name) if movie_name else index.items
+                
+                if movies:
+                    message = "🎬 **THÔNG TIN PHIM**\n\n"
+                    
+                    for movie in movies[:3]:
+                        release = movie.release_date or 'N/A'
+                        duration = movie.runtime or 'N/A'
+                        genre = ', '.join(movie.genres)
+                        desc = movie.description
+                        vote_avg = movie.vote_average
+                        movie_id = movie.id
+                        
+                        message += f"🎬 **{movie.title or 'N/A'}**\n"
+                        
+                        if release != 'N/A':
+                            try:
+                                release_date = datetime.fromisoformat(release.replace('Z', '+00:00'))
+                                release = release_date.strftime('%d/%m/%Y')
+                            except:
+                                pass
+                            message += f"📅 Khởi chiếu: {release}\n"
+                        
+                        if duration != 'N/A':
+                            message += f"⏱️ Thời lượng: {duration} phút\n"
+                        
+                        if genre:
+                            message += f"🎭 Thể loại: {genre}\n"
+                        
+                        if vote_avg:
+                            message += f"⭐ Đánh giá: {vote_avg}/10\n"
+                        
+                        if movie_id:
+                            message += f"🆔 ID: {movie_id}\n"
+                        
+                        if desc and len(desc) > 10:
+                            desc_short = desc[:200] + "..." if len(desc) > 200 else desc
+                            message += f"📝 Mô tả: {desc_short}\n"
+                        
+                        message += "\n"
+                    
+                    message += "💡 Bạn có thể hỏi: 'Lịch chiếu phim [tên phim]' để xem suất chiếu!"
+                    
+                    dispatcher.utter_message(text=message)
+                else:
+                    dispatcher.utter_message(
+                        text="❌ Không tìm thấy phim phù hợp.\n"
+                             "Vui lòng thử lại với tên phim khác."
+                    )
+            else:
+                dispatcher.utter_message(text="Không thể lấy thông tin phim.")
+                
+        except Exception as e:
+            logger.error(f"Error in movie info: {str(e)}")
+            dispatcher.utter_message(text="Có lỗi xảy ra.")
+        
+        return []
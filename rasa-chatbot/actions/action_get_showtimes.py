@@ -0,0 +1,382 @@
+from typing import Any, Text, Dict, List
+from rasa_sdk import Action, Tracker
+from rasa_sdk.executor import CollectingDispatcher
+from datetime import datetime, timedelta
+import asyncio
+import logging
+
+from . import http_client
+from .catalog import cinema_catalog, find_cinema_by_name, get_entity_extractor, movie_catalog
+from .http_client import BackendTimeout, CircuitOpenError
+from .latency_budget import budgeted
+from .metrics import instrumented
+from .records import Showtime
+from .rendering import data_version, render_cinema_showtimes, render_movie_showtimes
+from .showtime_index import ShowtimeIndex
+from .stores import cinema_showtimes_of, rendered_messages, showtime_store
+from .text_normalize import fold_text
+
+logger = logging.getLogger(__name__)
+
+
+class ActionGetShowtimes(Action):
+    def name(self) -> Text:
+        return "action_get_showtimes"
+
+    @instrumented
+    @budgeted()
+    async def run(self, dispatcher: CollectingDispatcher,
+            tracker: Tracker,
+            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+        
+        # Có thể hỏi nhiều phim/rạp một lúc: "lịch chiếu Avatar và Venom"
+        movie_names = self.get_entity_values(tracker, "movie_name")
+        cinema_names = self.get_entity_values(tracker, "cinema_name")
+        date = tracker.get_slot("date")
+        
+        # Nếu NLU miss entities, thử extract từ text
+        if not movie_names and not cinema_names:
+            movie_names, cinema_names = await self.extract_from_text(
+                tracker.latest_message.get('text', '')
+            )
+        
+        logger.info(f"Slots - movies: {movie_names}, cinemas: {cinema_names}, date: {date}")
+        
+        if date:
+            parsed_date = self.parse_date(date)
+        else:
+            parsed_date = datetime.now().strftime("%Y-%m-%d")
+        
+        try:
+            if movie_names:
+                return await self.run_for_each(
+                    dispatcher, movie_names,
+                    lambda d, movie_name: self.get_showtimes_by_movie(
+                        d, movie_name, cinema_names, parsed_date
+                    )
+                )
+            elif cinema_names:
+                return await self.run_for_each(
+                    dispatcher, cinema_names,
+                    lambda d, cinema_name: self.get_showtimes_by_cinema(
+                        d, cinema_name, parsed_date
+                    )
+                )
+            else:
+                dispatcher.utter_message(
+                    text="Bạn muốn xem lịch chiếu của phim nào? Hoặc bạn muốn xem lịch chiếu tại rạp nào?"
+                )
+                return []
+                
+        except (CircuitOpenError, BackendTimeout) as e:
+            logger.warning(f"Showtimes unavailable: {str(e)}")
+            dispatcher.utter_message(
+                text="⏱️ Hệ thống lịch chiếu đang quá tải, vui lòng thử lại sau ít phút."
+            )
+        except Exception as e:
+            logger.error(f"Error in get_showtimes: {str(e)}", exc_info=True)
+            dispatcher.utter_message(
+                text="Xin lỗi, có lỗi xảy ra khi lấy thông tin lịch chiếu."
+            )
+        
+        return []
+    
+    def get_entity_values(self, tracker, entity):
+        """Mọi giá trị của entity trong message cuối (bỏ trùng), fallback về slot"""
+        values = list(tracker.get_latest_entity_values(entity))
+        if not values and tracker.get_slot(entity):
+            values = [tracker.get_slot(entity)]
+        
+        unique = {}
+        for value in values:
+            if value and str(value).lower() not in unique:
+                unique[str(value).lower()] = value
+        return list(unique.values())
+    
+    async def extract_from_text(self, text):
+        """Mọi tên phim/rạp trong câu user (một lượt quét), trả (movie_names, cinema_names)"""
+        extractor = await get_entity_extractor()
+        
+        found = {'movie_name': {}, 'cinema_name': {}}
+        for match in extractor.extract(text):
+            found[match.entity].setdefault(match.value.lower(), match.value)
+        
+        movie_names = list(found['movie_name'].values())
+        cinema_names = list(found['cinema_name'].values())
+        if movie_names or cinema_names:
+            logger.info(f"Extracted from text - movies: {movie_names}, cinemas: {cinema_names}")
+        return movie_names, cinema_names
+    
+    async def run_for_each(self, dispatcher, names, handler):
+        """
+        Chạy handler cho từng phim/rạp song song, nên thời gian phản hồi bằng
+        lần fetch chậm nhất chứ không tăng theo số phim/rạp. Mỗi phần ghi vào
+        dispatcher riêng rồi gộp lại theo đúng thứ tự user hỏi.
+        """
+        if len(names) == 1:
+            return await handler(dispatcher, names[0])
+        
+        # Index catalog dùng chung cho mọi phần, chỉ load một lần
+        await asyncio.gather(movie_catalog.index(), cinema_catalog.index())
+        
+        sub_dispatchers = [CollectingDispatcher() for _ in names]
+        results = await asyncio.gather(
+            *(handler(d, name) for d, name in zip(sub_dispatchers, names)),
+            return_exceptions=True
+        )
+        
+        for name, sub_dispatcher, result in zip(names, sub_dispatchers, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error getting showtimes for '{name}': {str(result)}")
+                sub_dispatcher.utter_message(
+                    text=f"Xin lỗi, có lỗi xảy ra khi lấy lịch chiếu cho '{name}'."
+                )
+            dispatcher.messages.extend(sub_dispatcher.messages)
+        
+        return []
+    
+    async def get_showtimes_by_movie(self, dispatcher, movie_name, cinema_names, date):
+        try:
+            movie_id, movie_info = await self.find_movie_id(movie_name)
+            
+            if not movie_id:
+                dispatcher.utter_message(
+                    text=f"❌ Không tìm thấy phim '{movie_name}' trong hệ thống.\n"
+                         "Vui lòng kiểm tra lại tên phim."
+                         + await self.format_suggestions(movie_catalog, movie_name)
+                )
+                return []
+            
+            # Cùng phim, ngày, rạp lọc và dữ liệu chưa đổi -> dùng lại message đã render
+            message_group = (
+                'movie', str(movie_id), date,
+                tuple(sorted(fold_text(c) for c in cinema_names))
+            )
+            try:
+                response = await http_client.get(
+                    f"/showtimes/movies/{movie_id}",
+                    timeout=5
+                )
+            except CircuitOpenError:
+                return self.reply_from_cache(dispatcher, message_group)
+            
+            logger.info(f"API Response status: {response.status_code}")
+            
+            if response.status_code != 200:
+                dispatcher.utter_message(
+                    text=f"Không thể lấy thông tin lịch chiếu cho phim '{movie_name}'."
+                )
+                return []
+            
+            cache_key = (*message_group, data_version(response.text))
+            message = rendered_messages.get(cache_key)
+            if message:
+                await self.refresh_movie_showtimes(response.json(), movie_id)
+                dispatcher.utter_message(text=message)
+                return []
+            
+            data = response.json()
+            logger.info(f"Response data keys: {data.keys() if isinstance(data, dict) else 'not dict'}")
+            
+            if not data.get('success'):
+                dispatcher.utter_message(text="Không có dữ liệu lịch chiếu.")
+                return []
+            
+            movie_data = data.get('movie', {})
+            showtimes = data.get('dateTime', [])
+            
+            index = ShowtimeIndex(showtimes, movie_id=movie_id, movie_title=movie_data.get('title'))
+            await self.remember_movie_showtimes(index.records)
+            
+            if not showtimes:
+                dispatcher.utter_message(
+                    text=f"Hiện tại chưa có lịch chiếu cho phim '{movie_name}'."
+                )
+                return []
+            
+            cinema_filter = ', '.join(cinema_names) if cinema_names else None
+            cinemas = index.cinemas
+            if cinema_names:
+                # So khớp không dấu: "go vap" khớp "Lotte Gò Vấp"
+                cinema_keys = [fold_text(c) for c in cinema_names]
+                cinemas = [
+                    cinema for cinema in cinemas
+                    if any(c in fold_text(cinema) for c in cinema_keys)
+                ]
+                
+                if not cinemas:
+                    dispatcher.utter_message(
+                        text=f"Phim '{movie_name}' không chiếu tại rạp '{cinema_filter}'."
+                    )
+                    return []
+            
+            grouped = index.group(date, cinemas)
+            
+            if not grouped:
+                logger.info(f"No showtimes on {date}, showing all available dates")
+                grouped = index.group(None, cinemas)
+            
+            if not grouped:
+                dispatcher.utter_message(
+                    text=f"Không tìm thấy lịch chiếu phù hợp."
+                )
+                return []
+            
+            dispatcher.utter_message(
+                text=rendered_messages.put(
+                    cache_key, render_movie_showtimes(movie_data, grouped), group=message_group
+                )
+            )
+            
+            return []
+            
+        except Exception as e:
+            logger.error(f"Error in get_showtimes_by_movie: {str(e)}", exc_info=True)
+            raise
+    
+    async def get_showtimes_by_cinema(self, dispatcher, cinema_name, date):
+        try:
+            cinema_id = await self.find_cinema_id(cinema_name)
+            
+            if not cinema_id:
+                dispatcher.utter_message(
+                    text=f"❌ Không tìm thấy rạp '{cinema_name}' trong hệ thống."
+                         + await self.format_suggestions(cinema_catalog, cinema_name)
+                )
+                return []
+            
+            message_group = ('cinema', str(cinema_id), date)
+            try:
+                response = await http_client.get(
+                    f"/showtimes/datve/{cinema_id}/{date}",
+                    timeout=5
+                )
+            except CircuitOpenError:
+                return self.reply_from_cache(dispatcher, message_group)
+            
+            if response.status_code != 200:
+                dispatcher.utter_message(
+                    text=f"Không thể lấy thông tin lịch chiếu cho rạp '{cinema_name}'."
+                )
+                return []
+            
+            # Nạp showtime_store cả khi message đã có sẵn: store hết hạn theo TTL
+            # riêng, bước đặt vé vẫn cần các suất chiếu này
+            showtimes = cinema_showtimes_of(response.json())
+            showtime_store.ingest(showtimes, cinema_id=cinema_id)
+            
+            cache_key = (*message_group, data_version(response.text))
+            message = rendered_messages.get(cache_key)
+            if message:
+                dispatcher.utter_message(text=message)
+                return []
+            
+            if not showtimes:
+                dispatcher.utter_message(
+                    text=f"Rạp '{cinema_name}' chưa có lịch chiếu vào ngày {date}."
+                )
+                return []
+            
+            dispatcher.utter_message(
+                text=rendered_messages.put(
+                    cache_key, render_cinema_showtimes(cinema_name, showtimes, date), group=message_group
+                )
+            )
+            
+            return []
+            
+        except Exception as e:
+            logger.error(f"Error in get_showtimes_by_cinema: {str(e)}", exc_info=True)
+            raise
+    
+    def reply_from_cache(self, dispatcher, message_group):
+        """Backend đang lỗi (circuit mở): trả lịch chiếu đã render gần nhất nếu có"""
+        message = rendered_messages.latest(message_group)
+        if not message:
+            raise CircuitOpenError(f"No cached showtimes for {message_group}")
+        
+        logger.warning(f"Serving cached showtimes for {message_group}: backend unavailable")
+        dispatcher.utter_message(
+            text=message + "\n\n⚠️ Hệ thống đang bận, lịch chiếu có thể chưa được cập nhật mới nhất."
+        )
+        return []
+    
+    async def refresh_movie_showtimes(self, data, movie_id):
+        """
+        Message lấy từ cache nhưng showtime_store hết hạn theo TTL riêng:
+        vẫn nạp lại suất chiếu của response để bước đặt vé có dữ liệu
+        """
+        if not isinstance(data, dict) or not data.get('success'):
+            return
+        movie_title = (data.get('movie') or {}).get('title')
+        records = (
+            Showtime.from_payload(payload, movie_id=movie_id, movie_title=movie_title)
+            for payload in data.get('dateTime', [])
+        )
+        await self.remember_movie_showtimes([record for record in records if record is not None])
+    
+    async def remember_movie_showtimes(self, records):
+        """Lưu suất chiếu vào showtime_store để lúc đặt vé không phải tra lại"""
+        cinema_index = await cinema_catalog.index()
+        
+        for record in records:
+            if record.cinema_id is None and cinema_index:
+                cinema = cinema_index.get_by_name(record.cinema_name)
+                record.cinema_id = cinema.id if cinema else None
+            showtime_store.put_record(record)
+    
+    async def format_suggestions(self, catalog, query):
+        """Gợi ý các tên gần đúng để user khỏi phải đoán lại"""
+        index = await catalog.index()
+        suggestions = index.suggest(query) if index else []
+        
+        if not suggestions:
+            return ""
+        
+        names = [str(index.name_of(item)) for item, _ in suggestions]
+        return "\n\n🔎 Có phải bạn muốn tìm: " + ", ".join(names) + "?"
+    
+    async def find_movie_id(self, movie_name):
+        try:
+            index = await movie_catalog.index()
+            movie = index.resolve(movie_name) if index else None
+            
+            if not movie:
+                return None, None
+            
+            return index.id_of(movie), movie
+            
+        except Exception as e:
+            logger.error(f"Error finding movie: {str(e)}")
+            return None, None
+    
+    async def find_cinema_id(self, cinema_name):
+        try:
+            cinema_id, _ = await find_cinema_by_name(cinema_name)
+            return cinema_id
+            
+        except Exception as e:
+            logger.error(f"Error finding cinema: {str(e)}")
+            return None
+    
+    def parse_date(self, date_str):
+        if not date_str or not isinstance(date_str, str):
+            return datetime.now().strftime("%Y-%m-%d")
+        
+        today = datetime.now()
+        date_str = str(date_str).strip().lower()
+        
+        if date_str in ["hôm nay", "hom nay", "today"]:
+            return today.strftime("%Y-%m-%d")
+        elif date_str in ["ngày mai", "ngay mai", "tomorrow"]:
+            return (today + timedelta(days=1)).strftime("%Y-%m-%d")
+        
+        date_formats = ["%Y-%m-%d", "%d-%m-%Y", "%d/%m/%Y"]
+        for fmt in date_formats:
+            try:
+                parsed = datetime.strptime(date_str, fmt)
+                return parsed.strftime("%Y-%m-%d")
+            except ValueError:
+                continue
+        
+        return today.strftime("%Y-%m-%d")
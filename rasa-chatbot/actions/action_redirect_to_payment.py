@@ -0,0 +1,52 @@
+from typing import Any, Text, Dict, List
+from rasa_sdk import Action, Tracker
+from rasa_sdk.executor import CollectingDispatcher
+
+from .latency_budget import budgeted
+from .metrics import instrumented
+
+
+class ActionRedirectToPayment(Action):
+    def name(self) -> Text:
+        return "action_redirect_to_payment"
+
+    @instrumented
+    @budgeted()
+    async def run(self, dispatcher: CollectingDispatcher,
+            tracker: Tracker,
+            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+        
+        order_id = tracker.get_slot("order_id")
+        grand_total = tracker.get_slot("grand_total")
+        
+        if not order_id or not grand_total:
+            dispatcher.utter_message(
+                text="❌ Thiếu thông tin đơn hàng.\n"
+                     "Bạn có thể đặt vé mới bằng cách nói: 'Đặt vé phim [tên phim]'"
+            )
+            return []
+        
+        # Tạo URL thanh toán cố định
+        payment_url = "http://localhost:5173/qr-payment"
+        
+        message = "💳 **HƯỚNG DẪN THANH TOÁN**\n\n"
+        message += f"🔗 Vui lòng truy cập link sau để thanh toán:\n"
+        message += f"<a href='{payment_url}' target='_blank'>Link thanh toán</a>\n\n"
+        message += f"📌 **Thông tin thanh toán:**\n"
+        message += f"• Mã đơn hàng: {order_id}\n"
+        message += f"• Tổng tiền: {grand_total:,} VND\n"
+        message += "• Phương thức: QR Code (VNPay, Momo, ZaloPay) hoặc chuyển khoản ngân hàng\n\n"
+        message += "⏰ Thời gian giữ vé: **15 phút**"
+        
+        dispatcher.utter_message(
+            text=message,
+            custom={
+                "bookingData": {
+                    "order_id": order_id,
+                    "grand_total": float(grand_total),
+                    "payment_url": payment_url
+                }
+            }
+        )
+        
+        return []
@@ -0,0 +1,128 @@
+import asyncio
+import hashlib
+import logging
+import os
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from .http_client import BackendError, BackendResponse
+
+logger = logging.getLogger(__name__)
+
+BOOKING_RETRY_ATTEMPTS = int(os.getenv("BOOKING_RETRY_ATTEMPTS", "3"))
+BOOKING_RETRY_BASE_DELAY = float(os.getenv("BOOKING_RETRY_BASE_DELAY", "0.5"))
+BOOKING_RETRY_MAX_DELAY = float(os.getenv("BOOKING_RETRY_MAX_DELAY", "4"))
+
+# Đơn pending giữ ghế 15 phút nên một ý định đặt vé cũng được nhớ trong 15 phút
+PENDING_SUBMISSION_TTL = float(os.getenv("PENDING_SUBMISSION_TTL", "900"))
+
+# 409: backend đang xử lý request cùng key; 502-504: lỗi ở proxy/gateway
+RETRYABLE_STATUS = frozenset({409, 502, 503, 504})
+
+
+def idempotency_key(conversation_id: Any, user_id: Any, showtime_id: Any,
+                    seat_numbers: Iterable[str]) -> str:
+    """
+    Cùng hội thoại, cùng user, cùng suất chiếu, cùng tập ghế (không phân biệt
+    thứ tự) -> cùng key. Khách chưa đăng nhập dùng chung user_id nên key luôn
+    gồm sender_id: đơn của hội thoại này không bao giờ bị trả cho hội thoại khác.
+    """
+    seats = ','.join(sorted({str(s).upper() for s in seat_numbers}))
+    raw = f"{conversation_id}|{user_id}|{showtime_id}|{seats}"
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:32]
+
+
+def is_successful(response: BackendResponse) -> bool:
+    if response.status_code not in (200, 201):
+        return False
+    try:
+        return bool(response.json().get('success'))
+    except (ValueError, AttributeError):
+        return False
+
+
+async def post_with_retry(send: Callable[[], Awaitable[BackendResponse]],
+                          attempts: int = BOOKING_RETRY_ATTEMPTS,
+                          base_delay: float = BOOKING_RETRY_BASE_DELAY,
+                          max_delay: float = BOOKING_RETRY_MAX_DELAY) -> BackendResponse:
+    """
+    Gửi lại khi timeout / lỗi kết nối / 409 / 5xx gateway, tối đa `attempts` lần,
+    chờ theo exponential backoff có jitter (full jitter) giữa các lần.
+    Chỉ an toàn vì mọi lần gửi dùng chung Idempotency-Key.
+    """
+    attempt = 1
+    while True:
+        try:
+            response = await send()
+            if response.status_code not in RETRYABLE_STATUS or attempt >= attempts:
+                return response
+            logger.warning(f"Booking attempt {attempt} got HTTP {response.status_code}, retrying")
+        except BackendError as e:
+            if attempt >= attempts:
+                raise
+            logger.warning(f"Booking attempt {attempt} failed: {e}, retrying")
+
+        await asyncio.sleep(random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1))))
+        attempt += 1
+
+
+class PendingSubmissions:
+    """
+    Bảng các lần gửi booking theo idempotency key.
+
+    - Đang gửi: request trùng (user bấm lại, Rasa chạy lại action) chờ chung
+      lần gửi đó thay vì POST thêm.
+    - Đã thành công: trả lại đúng response cũ (cùng order_id) trong TTL.
+    - Thất bại: xóa khỏi bảng để user có thể thử lại.
+    """
+
+    def __init__(self, ttl: float = PENDING_SUBMISSION_TTL):
+        self.ttl = ttl
+        self._submissions: Dict[str, Tuple[float, asyncio.Future]] = {}
+
+        self.submitted = 0
+        self.deduplicated = 0
+
+    def completed(self, key: str) -> Optional[BackendResponse]:
+        """Response thành công đã có của key, None nếu chưa có"""
+        future = self._get(key)
+        if future is None or not future.done() or future.cancelled() or future.exception():
+            return None
+        response = future.result()
+        return response if is_successful(response) else None
+
+    async def submit(self, key: str, send: Callable[[], Awaitable[BackendResponse]]) -> BackendResponse:
+        future = self._get(key)
+        if future is None:
+            self.submitted += 1
+            future = asyncio.ensure_future(post_with_retry(send))
+            self._submissions[key] = (time.monotonic(), future)
+            future.add_done_callback(lambda f: self._finish(key, f))
+        else:
+            self.deduplicated += 1
+            logger.info(f"Booking {key} already submitted, reusing its result")
+
+        # shield: user hủy/timeout action không làm hủy lần gửi đang chạy
+        return await asyncio.shield(future)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "submitted": self.submitted,
+            "deduplicated": self.deduplicated,
+            "size": len(self._submissions),
+        }
+
+    def _get(self, key: str) -> Optional[asyncio.Future]:
+        now = time.monotonic()
+        for expired in [k for k, (created_at, _) in self._submissions.items() if now - created_at >= self.ttl]:
+            del self._submissions[expired]
+
+        entry = self._submissions.get(key)
+        return entry[1] if entry else None
+
+    def _finish(self, key: str, future: asyncio.Future) -> None:
+        failed = future.cancelled() or future.exception() is not None or not is_successful(future.result())
+        entry = self._submissions.get(key)
+        if failed and entry and entry[1] is future:
+            del self._submissions[key]
@@ -0,0 +1,166 @@
+"""
+Catalog phim / rạp dùng chung cho mọi action: cache, index tên, từ vựng
+extract/normalize và entity extractor (dựng lần đầu cần tới).
+"""
+import asyncio
+import logging
+from operator import attrgetter
+from typing import List, Optional, Tuple
+
+from . import http_client, metrics, text_normalize
+from .catalog_cache import CatalogCache
+from .catalog_index import CatalogIndex
+from .entity_extractor import EntityExtractor
+from .json_stream import CINEMA_FIELDS, MOVIE_FIELDS
+from .records import Cinema, Movie, build_records
+from .vocabulary import VocabularyBuilder, cinema_variants, movie_variants
+
+logger = logging.getLogger(__name__)
+
+# Danh sách tên rạp phổ biến
+CINEMA_KEYWORDS = [
+    'cgv', 'galaxy', 'lotte', 'bhd', 'platinum', 'cinestar', 
+    'beta', 'megastar', 'bac quang trung', 'rạp bac', 'vincom',
+    'gò vấp', 'landmark', 'aeon', 'nguyễn du', 'quốc thanh'
+]
+
+# Danh sách từ khóa phim phổ biến (có thể mở rộng)
+MOVIE_KEYWORDS = [
+    'avatar', 'spider-man', 'spiderman', 'avengers', 'inception',
+    'oppenheimer', 'barbie', 'batman', 'venom', 'doraemon',
+    'the bad guys', 'bad guys', 'frozen', 'deadpool', 'transformers',
+    'kung fu panda', 'interstellar'
+]
+
+# Mapping các biến thể tên rạp
+CINEMA_MAPPINGS = {
+    'bac quang trung': 'BAC Quang Trung',
+    'rạp bac': 'BAC Quang Trung',
+    'cgv': 'CGV',
+    'cgv vincom': 'CGV Vincom',
+    'cgv landmark': 'CGV Landmark',
+    'galaxy': 'Galaxy Cinema',
+    'galaxy nguyen du': 'Galaxy Nguyễn Du',
+    'galaxy nguyễn du': 'Galaxy Nguyễn Du',
+    'lotte': 'Lotte Cinema',
+    'lotte go vap': 'Lotte Gò Vấp',
+    'lotte gò vấp': 'Lotte Gò Vấp',
+    'bhd': 'BHD Star',
+    'bhd star': 'BHD Star',
+    'platinum': 'Platinum Cineplex',
+    'cinestar': 'Cinestar',
+    'beta': 'Beta Cineplex',
+    'megastar': 'MegaStar',
+}
+
+# Normalize tên phim
+MOVIE_MAPPINGS = {
+    'the bad guys 2': 'The Bad Guys 2',
+    'bad guys 2': 'The Bad Guys 2',
+    'bad guys': 'The Bad Guys',
+    'spider-man': 'Spider-Man',
+    'spiderman': 'Spider-Man',
+    'kung fu panda': 'Kung Fu Panda',
+}
+
+
+async def load_movies() -> Optional[List[Movie]]:
+    """Tải toàn bộ danh sách phim từ backend thành Movie record, None nếu lỗi"""
+    response = await http_client.get_items("/movies", keys=('data', 'movies'), fields=MOVIE_FIELDS)
+    
+    if response.status_code != 200 or response.items is None:
+        logger.warning(f"Could not load movies: HTTP {response.status_code}")
+        return None
+    
+    return build_records(Movie, response.items)
+
+
+async def load_cinemas() -> Optional[List[Cinema]]:
+    """Tải toàn bộ danh sách rạp từ backend thành Cinema record, None nếu lỗi"""
+    response = await http_client.get_items("/cinemas", keys=('cinemas', 'data'), fields=CINEMA_FIELDS)
+    
+    if response.status_code != 200 or response.items is None:
+        logger.warning(f"Could not load cinemas: HTTP {response.status_code}")
+        return None
+    
+    return build_records(Cinema, response.items)
+
+
+# Từ vựng extract/normalize sinh từ catalog, mapping viết tay ở trên được ưu tiên
+movie_vocabulary = VocabularyBuilder(
+    attrgetter('id'), attrgetter('title'), movie_variants, MOVIE_KEYWORDS, MOVIE_MAPPINGS,
+    updated_getter=attrgetter('updated_at')
+)
+cinema_vocabulary = VocabularyBuilder(
+    attrgetter('id'), attrgetter('name'), cinema_variants, CINEMA_KEYWORDS, CINEMA_MAPPINGS,
+    updated_getter=attrgetter('updated_at')
+)
+
+
+def build_movie_index(movies: List[Movie]) -> CatalogIndex:
+    vocabulary = movie_vocabulary.update(movies)
+    return CatalogIndex(
+        movies,
+        id_getter=attrgetter('id'),
+        name_getter=attrgetter('title'),
+        aliases=vocabulary.mappings,
+    )
+
+
+def build_cinema_index(cinemas: List[Cinema]) -> CatalogIndex:
+    vocabulary = cinema_vocabulary.update(cinemas)
+    return CatalogIndex(
+        cinemas,
+        id_getter=attrgetter('id'),
+        name_getter=attrgetter('name'),
+        aliases=vocabulary.mappings,
+    )
+
+
+def build_entity_extractor() -> EntityExtractor:
+    return EntityExtractor(
+        movie_vocabulary.vocabulary.terms,
+        cinema_vocabulary.vocabulary.terms
+    )
+
+
+# Dựng lần đầu cần tới (không tốn thời gian lúc import); chỉ dựng lại khi
+# từ vựng thực sự thay đổi
+_entity_extractor: Optional[EntityExtractor] = None
+_entity_extractor_versions: Optional[Tuple[int, int]] = None
+
+
+async def get_entity_extractor() -> EntityExtractor:
+    global _entity_extractor, _entity_extractor_versions
+    
+    # Load catalog (nếu cần) để cập nhật từ vựng
+    await asyncio.gather(movie_catalog.index(), cinema_catalog.index())
+    versions = (movie_vocabulary.vocabulary.version, cinema_vocabulary.vocabulary.version)
+    if versions != _entity_extractor_versions:
+        _entity_extractor = build_entity_extractor()
+        _entity_extractor_versions = versions
+    return _entity_extractor
+
+
+# Cache catalog dùng chung cho mọi action trong process
+movie_catalog = CatalogCache("movies", load_movies, build_movie_index)
+cinema_catalog = CatalogCache("cinemas", load_cinemas, build_cinema_index)
+
+
+async def find_cinema_by_name(cinema_name):
+    """Tìm rạp theo tên qua index, trả (cinema_id, cinema) hoặc (None, None)"""
+    index = await cinema_catalog.index()
+    cinema = index.resolve(cinema_name) if index else None
+    
+    if not cinema:
+        return None, None
+    return index.id_of(cinema), cinema
+
+
+# Hit ratio / kích thước các cache, đọc khi xuất metrics
+for _name, _collector in (
+    ("movie_catalog", movie_catalog.stats),
+    ("cinema_catalog", cinema_catalog.stats),
+    ("text_normalize", lambda: text_normalize.cache_info()._asdict()),
+):
+    metrics.register_collector(_name, _collector)
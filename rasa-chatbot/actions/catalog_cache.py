@@ -0,0 +1,139 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .latency_budget import detached
+
+logger = logging.getLogger(__name__)
+
+# Thời gian (giây) dữ liệu catalog được coi là còn "tươi"
+CATALOG_CACHE_TTL = float(os.getenv("CATALOG_CACHE_TTL", "300"))
+# Sau TTL, vẫn trả dữ liệu cũ (và refresh ngầm) tối đa thêm khoảng này
+CATALOG_CACHE_MAX_STALE = float(os.getenv("CATALOG_CACHE_MAX_STALE", "3600"))
+
+
+class CatalogCache:
+    """
+    Cache dùng chung toàn process cho các danh sách catalog (/movies, /cinemas).
+
+    - Còn trong TTL: trả dữ liệu cache, không gọi backend.
+    - Quá TTL nhưng chưa quá max_stale: trả dữ liệu cũ ngay, refresh bằng task nền
+      (stale-while-revalidate).
+    - Chưa có dữ liệu hoặc quá cũ: chờ load, các request đồng thời dùng chung một lần load.
+    Nếu load lỗi thì giữ lại dữ liệu cũ (nếu có).
+
+    Nếu có builder, index (vd: CatalogIndex) được dựng một lần mỗi lần load
+    và lấy ra bằng index().
+    """
+
+    def __init__(self, name: str,
+                 loader: Callable[[], Awaitable[Optional[List[Dict[str, Any]]]]],
+                 builder: Optional[Callable[[List[Dict[str, Any]]], Any]] = None,
+                 ttl: float = CATALOG_CACHE_TTL,
+                 max_stale: float = CATALOG_CACHE_MAX_STALE):
+        self.name = name
+        self.loader = loader
+        self.builder = builder
+        self.ttl = ttl
+        self.max_stale = max_stale
+
+        self._items: Optional[List[Dict[str, Any]]] = None
+        self._index: Any = None
+        self._loaded_at = 0.0
+        self._version = 0
+        self._lock: Optional[asyncio.Lock] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.refreshes = 0
+        self.errors = 0
+
+    @property
+    def version(self) -> int:
+        """Tăng mỗi lần dữ liệu được load lại thành công"""
+        return self._version
+
+    async def get(self) -> List[Dict[str, Any]]:
+        """Lấy danh sách item, trả [] nếu không load được và chưa có cache"""
+        age = time.monotonic() - self._loaded_at
+
+        if self._items is not None and age < self.ttl:
+            self.hits += 1
+            return self._items
+
+        if self._items is not None and age < self.ttl + self.max_stale:
+            self.stale_hits += 1
+            self._refresh_in_background()
+            return self._items
+
+        self.misses += 1
+        async with self._get_lock():
+            # Có thể request khác vừa load xong trong lúc chờ lock
+            if self._items is not None and time.monotonic() - self._loaded_at < self.ttl:
+                return self._items
+            await self._load()
+        return self._items or []
+
+    async def index(self) -> Any:
+        """Index dựng từ dữ liệu hiện tại (đi qua get() nên cũng được refresh)"""
+        items = await self.get()
+        if self._index is None and self.builder:
+            self._index = self.builder(items)
+        return self._index
+
+    def invalidate(self) -> None:
+        """Đánh dấu cache hết hạn, lần get() tiếp theo sẽ load lại"""
+        self._loaded_at = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale_hits": self.stale_hits,
+            "refreshes": self.refreshes,
+            "errors": self.errors,
+            "version": self._version,
+            "size": len(self._items) if self._items is not None else 0,
+        }
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def _load(self) -> None:
+        try:
+            items = await self.loader()
+        except Exception as e:
+            items = None
+            logger.error(f"Error loading catalog '{self.name}': {str(e)}")
+
+        if items is None:
+            self.errors += 1
+            return
+
+        items = [item for item in items if item is not None]
+        # Dựng index trước rồi mới thay dữ liệu để reader không thấy trạng thái nửa vời
+        self._index = self.builder(items) if self.builder else None
+        self._items = items
+        self._loaded_at = time.monotonic()
+        self._version += 1
+        self.refreshes += 1
+        logger.info(f"Catalog '{self.name}' loaded: {len(self._items)} items (v{self._version})")
+
+    def _refresh_in_background(self) -> None:
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+
+        async def refresh():
+            # Chạy nền nên không bị giới hạn bởi latency budget của action đã tạo ra nó
+            with detached():
+                async with self._get_lock():
+                    await self._load()
+
+        self._refresh_task = asyncio.create_task(refresh())
@@ -0,0 +1,122 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .fuzzy_matcher import TrigramIndex
+from .text_normalize import fold_text
+
+# Điểm tối thiểu để tự động chọn kết quả fuzzy / để đưa vào danh sách gợi ý
+FUZZY_RESOLVE_SCORE = 0.5
+FUZZY_SUGGEST_SCORE = 0.34
+
+
+def word_ngrams(words: List[str]) -> Iterable[str]:
+    """Sinh mọi cụm từ liên tiếp, dài nhất trước"""
+    for size in range(len(words), 0, -1):
+        for start in range(len(words) - size + 1):
+            yield ' '.join(words[start:start + size])
+
+
+class CatalogIndex:
+    """
+    Index tên phim/rạp dựng một lần khi catalog được load.
+
+    Mọi lookup là tra dict thay vì duyệt cả danh sách:
+    - names:   tên đã chuẩn hóa (lowercase + bỏ dấu) -> item
+    - aliases: biến thể quen dùng (movie_mappings/cinema_mappings) -> tên chuẩn
+    - ngrams:  cụm từ liên tiếp trong tên -> các item chứa cụm đó (theo thứ tự catalog)
+    - fuzzy:   trigram index trên tên đã chuẩn hóa, dùng khi user gõ sai chính tả
+    """
+
+    def __init__(self, items: List[Any],
+                 id_getter: Callable[[Any], Any],
+                 name_getter: Callable[[Any], Any],
+                 aliases: Optional[Dict[str, str]] = None):
+        self.items = items
+        self.id_of = id_getter
+        self.name_of = name_getter
+
+        self.by_id: Dict[str, Any] = {}
+        self.names: Dict[str, Any] = {}
+        self.ngrams: Dict[str, List[Any]] = {}
+
+        for item in items:
+            item_id = id_getter(item)
+            if item_id is not None:
+                self.by_id.setdefault(str(item_id), item)
+
+            name = fold_text(name_getter(item))
+            if not name:
+                continue
+
+            self.names.setdefault(name, item)
+            for gram in set(word_ngrams(name.split())):
+                self.ngrams.setdefault(gram, []).append(item)
+
+        self.aliases = {
+            fold_text(alias): fold_text(target)
+            for alias, target in (aliases or {}).items()
+        }
+
+        self._fuzzy_items = list(self.names.values())
+        self.fuzzy = TrigramIndex(list(self.names))
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def get(self, item_id: Any) -> Optional[Any]:
+        return self.by_id.get(str(item_id))
+
+    def get_by_name(self, name: Any) -> Optional[Any]:
+        """Chỉ khớp chính xác tên (sau chuẩn hóa), không đoán"""
+        return self.names.get(fold_text(name))
+
+    def resolve(self, query: Any) -> Optional[Any]:
+        """Tìm item khớp nhất với query, None nếu không có"""
+        key = fold_text(query)
+        if not key:
+            return None
+
+        # Alias đi trước khớp theo cụm từ: "bad guys" là "The Bad Guys",
+        # không phải phim đầu tiên có cụm "bad guys" trong tên
+        alias = self.aliases.get(key)
+        candidates = [c for c in (key, alias) if c]
+
+        # Khớp chính xác tên, rồi tới tên chuẩn của alias
+        for candidate in candidates:
+            item = self.names.get(candidate)
+            if item:
+                return item
+
+        # Query (hoặc alias) là một cụm từ trong tên
+        for candidate in reversed(candidates):
+            matches = self.ngrams.get(candidate)
+            if matches:
+                return matches[0]
+
+        # Tên item nằm trong query (vd: "lịch chiếu avatar 2 tối nay")
+        for gram in word_ngrams(key.split()):
+            item = self.names.get(gram)
+            if item:
+                return item
+
+        # Gõ sai chính tả: lấy ứng viên fuzzy tốt nhất nếu đủ điểm
+        best = self.fuzzy.search(key, limit=1, min_score=FUZZY_RESOLVE_SCORE)
+        if best:
+            return self._fuzzy_items[best[0][0]]
+
+        return None
+
+    def suggest(self, query: Any, limit: int = 3) -> List[Tuple[Any, float]]:
+        """Các ứng viên gần đúng kèm điểm, dùng để gợi ý khi không tìm thấy"""
+        results = self.fuzzy.search(fold_text(query), limit=limit, min_score=FUZZY_SUGGEST_SCORE)
+        return [(self._fuzzy_items[pos], score) for pos, score in results]
+
+    def find_all(self, query: Any) -> List[Any]:
+        """Mọi item có tên chứa query (theo cụm từ)"""
+        key = fold_text(query)
+        if not key:
+            return list(self.items)
+
+        matches = self.ngrams.get(key)
+        if not matches and key in self.aliases:
+            matches = self.ngrams.get(self.aliases[key])
+        return list(matches or [])
@@ -0,0 +1,140 @@
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+BREAKER_WINDOW_SECONDS = float(os.getenv("BREAKER_WINDOW_SECONDS", "30"))
+BREAKER_MIN_CALLS = int(os.getenv("BREAKER_MIN_CALLS", "5"))
+BREAKER_FAILURE_RATIO = float(os.getenv("BREAKER_FAILURE_RATIO", "0.5"))
+BREAKER_SLOW_CALL_SECONDS = float(os.getenv("BREAKER_SLOW_CALL_SECONDS", "2"))
+BREAKER_SLOW_CALL_RATIO = float(os.getenv("BREAKER_SLOW_CALL_RATIO", "0.8"))
+BREAKER_OPEN_SECONDS = float(os.getenv("BREAKER_OPEN_SECONDS", "15"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class Permit:
+    """Quyền gọi backend do allow() cấp; probe = lần gọi thử lúc half open"""
+
+    __slots__ = ('probe',)
+
+    def __init__(self, probe: bool = False):
+        self.probe = probe
+
+
+# Lần gọi bình thường lúc breaker đóng dùng chung một permit
+_CALL = Permit()
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker cho một nhóm endpoint backend.
+
+    Giữ các lần gọi trong cửa sổ BREAKER_WINDOW_SECONDS gần nhất. Khi đủ
+    BREAKER_MIN_CALLS mà tỉ lệ lỗi hoặc tỉ lệ gọi chậm vượt ngưỡng thì mở
+    (open): mọi lần gọi bị từ chối ngay trong BREAKER_OPEN_SECONDS. Hết thời
+    gian đó chỉ cho một lần gọi thử (half open); thành công thì đóng lại,
+    thất bại thì mở tiếp. Chỉ kết quả của đúng lần gọi thử đó (permit mà
+    allow() trả) mới quyết định trạng thái: kết quả đến muộn của các lần
+    gọi bắt đầu trước khi breaker mở bị bỏ qua.
+    """
+
+    def __init__(self, name: str,
+                 window: float = BREAKER_WINDOW_SECONDS,
+                 min_calls: int = BREAKER_MIN_CALLS,
+                 failure_ratio: float = BREAKER_FAILURE_RATIO,
+                 slow_call_seconds: float = BREAKER_SLOW_CALL_SECONDS,
+                 slow_call_ratio: float = BREAKER_SLOW_CALL_RATIO,
+                 open_seconds: float = BREAKER_OPEN_SECONDS):
+        self.name = name
+        self.window = window
+        self.min_calls = min_calls
+        self.failure_ratio = failure_ratio
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_ratio = slow_call_ratio
+        self.open_seconds = open_seconds
+
+        self.state = CLOSED
+        self._opened_at = 0.0
+        self._probe: Optional[Permit] = None
+        # (thời điểm, thành công?, latency)
+        self._calls: Deque[Tuple[float, bool, float]] = deque()
+
+        self.rejected = 0
+        self.opened = 0
+
+    def allow(self) -> Optional[Permit]:
+        """
+        Permit nếu được gọi backend (truyền lại cho record/release), None nếu
+        không (trả cache hoặc báo lỗi ngay)
+        """
+        if self.state == CLOSED:
+            return _CALL
+
+        if self.state == OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self.state = HALF_OPEN
+            self._probe = None
+
+        if self.state == HALF_OPEN and self._probe is None:
+            self._probe = Permit(probe=True)
+            return self._probe
+
+        self.rejected += 1
+        return None
+
+    def record(self, success: bool, latency: float, permit: Optional[Permit] = None) -> None:
+        now = time.monotonic()
+
+        if self.state == HALF_OPEN:
+            if permit is None or permit is not self._probe:
+                # Kết quả muộn của lần gọi trước khi mở: không phải lần gọi thử
+                return
+            self._probe = None
+            if success and latency < self.slow_call_seconds:
+                self._close()
+            else:
+                self._open(now)
+            return
+
+        self._calls.append((now, success, latency))
+        while self._calls and now - self._calls[0][0] > self.window:
+            self._calls.popleft()
+
+        if self.state == CLOSED and len(self._calls) >= self.min_calls:
+            total = len(self._calls)
+            failures = sum(1 for _, ok, _ in self._calls if not ok)
+            slow = sum(1 for _, _, elapsed in self._calls if elapsed >= self.slow_call_seconds)
+            if failures / total >= self.failure_ratio or slow / total >= self.slow_call_ratio:
+                logger.warning(
+                    f"Circuit '{self.name}' opened: {failures}/{total} failed, {slow}/{total} slow"
+                )
+                self._open(now)
+
+    def release(self, permit: Optional[Permit] = None) -> None:
+        """Lần gọi bị hủy giữa chừng (không có kết quả): lần gọi thử thì cho phép thử lại"""
+        if permit is not None and permit is self._probe:
+            self._probe = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "calls": len(self._calls),
+            "failures": sum(1 for _, ok, _ in self._calls if not ok),
+            "rejected": self.rejected,
+            "opened": self.opened,
+        }
+
+    def _open(self, now: float) -> None:
+        self.state = OPEN
+        self._opened_at = now
+        self.opened += 1
+
+    def _close(self) -> None:
+        logger.info(f"Circuit '{self.name}' closed")
+        self.state = CLOSED
+        self._calls.clear()
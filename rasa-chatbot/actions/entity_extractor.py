@@ -0,0 +1,78 @@
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .text_normalize import fold_preserving_length, fold_text, to_nfc
+
+
+class EntityMatch(NamedTuple):
+    entity: str   # 'movie_name' hoặc 'cinema_name'
+    value: str    # tên chuẩn (tên trong catalog, hoặc đoạn text khớp)
+    start: int    # vị trí trong text (đã NFC normalize)
+    end: int
+
+
+def _trie_pattern(node: Dict[str, dict]) -> str:
+    """Regex từ trie ký tự: các term chung tiền tố dùng chung nhánh"""
+    branches = []
+    for ch in sorted(k for k in node if k):
+        char_pattern = r'\s+' if ch == ' ' else re.escape(ch)
+        branches.append(char_pattern + _trie_pattern(node[ch]))
+
+    if not branches:
+        return ''
+
+    pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if '' in node:
+        # Term kết thúc tại đây nhưng vẫn ưu tiên khớp term dài hơn
+        pattern = ('(?:' + pattern + ')' if len(branches) == 1 else pattern) + '?'
+    return pattern
+
+
+class EntityExtractor:
+    """
+    Tìm tên phim/rạp trong câu user khi NLU bỏ sót entity.
+
+    Mọi tên được gộp thành MỘT regex dựng sẵn (theo trie ký tự, không phân
+    biệt dấu) nên mỗi câu chỉ quét một lượt, không compile regex lúc chạy,
+    và chi phí không tăng tuyến tính theo số tên trong catalog.
+    """
+
+    def __init__(self, movie_terms: Iterable[Tuple[str, Optional[str]]],
+                 cinema_terms: Iterable[Tuple[str, Optional[str]]]):
+        # term đã chuẩn hóa -> (entity, tên chuẩn hoặc None nếu dùng đoạn text khớp)
+        self.terms: Dict[str, Tuple[str, Optional[str]]] = {}
+        for entity, terms in (('cinema_name', cinema_terms), ('movie_name', movie_terms)):
+            for term, canonical in terms:
+                key = fold_text(term)
+                if key:
+                    self.terms.setdefault(key, (entity, canonical))
+
+        trie: Dict[str, dict] = {}
+        for key in self.terms:
+            node = trie
+            for ch in key:
+                node = node.setdefault(ch, {})
+            node[''] = {}
+
+        self.pattern = re.compile(
+            r'(?<![0-9a-z])(' + (_trie_pattern(trie) or r'(?!)') + r')(?![0-9a-z])'
+            r'(\s+\d+(?![0-9a-z]))?'
+        )
+
+    def extract(self, text: str) -> List[EntityMatch]:
+        """Mọi tên phim/rạp xuất hiện trong text, theo thứ tự xuất hiện"""
+        text = to_nfc(text)
+        folded = fold_preserving_length(text)
+
+        matches = []
+        for match in self.pattern.finditer(folded):
+            entity, canonical = self.terms[' '.join(match.group(1).split())]
+            end = match.end(1)
+
+            # Số phần phía sau chỉ có nghĩa với tên phim ("avatar 2")
+            if entity == 'movie_name' and match.group(2) and canonical is None:
+                end = match.end(2)
+
+            value = canonical or ' '.join(text[match.start(1):end].lower().split())
+            matches.append(EntityMatch(entity, value, match.start(1), end))
+        return matches
@@ -0,0 +1,110 @@
+import math
+from typing import Dict, FrozenSet, List, Tuple
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """Tập trigram ký tự của text đã chuẩn hóa (có đệm khoảng trắng hai đầu)"""
+    padded = f" {text} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def _bitset(positions: List[int], size: int) -> int:
+    buf = bytearray(size // 8 + 1)
+    for pos in positions:
+        buf[pos >> 3] |= 1 << (pos & 7)
+    return int.from_bytes(buf, 'little')
+
+
+class TrigramIndex:
+    """
+    Index trigram ký tự dùng để sửa lỗi gõ sai ("spidermen", "avatr").
+
+    Input là các chuỗi ĐÃ chuẩn hóa (lowercase, bỏ dấu). Điểm của một tên là
+    tỉ lệ trigram của query có trong tên; cùng điểm thì ưu tiên tên có độ
+    tương đồng Dice cao hơn (độ dài gần với query hơn).
+
+    Mỗi trigram lưu một bitset (int Python) các vị trí tên chứa nó. Khi search,
+    số trigram trùng của MỌI tên được cộng song song bằng bộ cộng bit-sliced,
+    nên chi phí gần như không phụ thuộc số tên trong catalog và không phải
+    duyệt từng ứng viên.
+    """
+
+    def __init__(self, keys: List[str]):
+        self.keys = keys
+        self.sizes: List[int] = []
+
+        postings: Dict[str, List[int]] = {}
+        for pos, key in enumerate(keys):
+            grams = trigrams(key)
+            self.sizes.append(len(grams))
+            for gram in grams:
+                postings.setdefault(gram, []).append(pos)
+
+        self.bitsets: Dict[str, int] = {
+            gram: _bitset(positions, len(keys)) for gram, positions in postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def search(self, query: str, limit: int = 5,
+               min_score: float = 0.5) -> List[Tuple[int, float]]:
+        """Trả về [(vị trí, điểm)] sắp xếp theo điểm giảm dần"""
+        if not query:
+            return []
+
+        query_grams = trigrams(query)
+        total = len(query_grams)
+        min_common = max(1, math.ceil(min_score * total))
+
+        # planes[i] = bit thứ i của số trigram trùng, cho mọi tên cùng lúc
+        planes: List[int] = []
+        for gram in query_grams:
+            carry = self.bitsets.get(gram, 0)
+            i = 0
+            while carry:
+                if i == len(planes):
+                    planes.append(carry)
+                    break
+                plane = planes[i]
+                planes[i] = plane ^ carry
+                carry = plane & carry
+                i += 1
+
+        results: List[Tuple[int, float]] = []
+        seen = 0
+        # Duyệt từ số trigram trùng cao nhất xuống, dừng khi đủ limit kết quả
+        for common in range(total, min_common - 1, -1):
+            level = self._at_least(planes, common) & ~seen
+            if not level:
+                continue
+            seen |= level
+
+            ranked = []
+            while level:
+                low = level & -level
+                pos = low.bit_length() - 1
+                level ^= low
+                ranked.append((2 * common / (total + self.sizes[pos]), pos))
+
+            ranked.sort(reverse=True)
+            score = round(common / total, 3)
+            results.extend((pos, score) for _, pos in ranked)
+            if len(results) >= limit:
+                break
+
+        return results[:limit]
+
+    @staticmethod
+    def _at_least(planes: List[int], threshold: int) -> int:
+        """Bitset các tên có số trigram trùng >= threshold (so sánh bit-sliced)"""
+        greater = 0
+        equal = -1
+        for i in range(max(len(planes), threshold.bit_length()) - 1, -1, -1):
+            plane = planes[i] if i < len(planes) else 0
+            if (threshold >> i) & 1:
+                equal &= plane
+            else:
+                greater |= equal & plane
+                equal &= ~plane
+        return greater | equal
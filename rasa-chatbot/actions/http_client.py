@@ -0,0 +1,292 @@
+import asyncio
+import codecs
+import json
+import logging
+import os
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from . import metrics
+from .circuit_breaker import CircuitBreaker
+from .json_stream import ItemStream
+from .latency_budget import clamp_timeout, detached
+
+# aiohttp chỉ được import khi gửi request đầu tiên (xem get_session), để
+# import action không phải trả thời gian nạp aiohttp lúc khởi động
+if TYPE_CHECKING:
+    import aiohttp
+
+logger = logging.getLogger(__name__)
+
+API_BASE_URL = os.getenv("API_BASE_URL", "/api")
+
+# Giới hạn connection pool dùng chung cho mọi action
+HTTP_POOL_LIMIT = int(os.getenv("HTTP_POOL_LIMIT", "100"))
+HTTP_POOL_LIMIT_PER_HOST = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "50"))
+HTTP_KEEPALIVE_TIMEOUT = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30"))
+
+# Kích thước mỗi đoạn body khi parse theo luồng (get_items)
+STREAM_CHUNK_SIZE = int(os.getenv("STREAM_CHUNK_SIZE", str(64 * 1024)))
+
+
+class BackendError(Exception):
+    """Lỗi kết nối tới backend (DNS, connection refused, ...)"""
+
+
+class BackendTimeout(BackendError):
+    """Backend không trả lời trong thời gian timeout"""
+
+
+class CircuitOpenError(BackendError):
+    """Circuit breaker của nhóm endpoint đang mở, không gọi backend"""
+
+
+# Nhóm endpoint theo prefix (prefix dài/cụ thể trước), mỗi nhóm một circuit breaker
+ENDPOINT_FAMILIES = (
+    ("/showtimes/seats-status", "seats"),
+    ("/showtimes", "showtimes"),
+    ("/movies", "catalog"),
+    ("/cinemas", "catalog"),
+    ("/ticket-prices", "prices"),
+    ("/bookings", "bookings"),
+)
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def endpoint_family(path: str) -> str:
+    for prefix, family in ENDPOINT_FAMILIES:
+        if path.startswith(prefix):
+            return family
+    return "other"
+
+
+def breaker_for(path: str) -> CircuitBreaker:
+    family = endpoint_family(path)
+    breaker = _breakers.get(family)
+    if breaker is None:
+        breaker = _breakers[family] = CircuitBreaker(family)
+    return breaker
+
+
+class BackendResponse:
+    """
+    Response đã đọc xong body, dùng giống requests.Response (status_code, json(), text).
+    JSON chỉ parse một lần; response có thể được nhiều request dùng chung
+    (xem get()) nên không sửa trực tiếp object trả về từ json().
+    """
+
+    _UNPARSED = object()
+
+    def __init__(self, status_code: int, text: str):
+        self.status_code = status_code
+        self.text = text
+        self._data = self._UNPARSED
+
+    def json(self) -> Any:
+        if self._data is self._UNPARSED:
+            self._data = json.loads(self.text)
+        return self._data
+
+
+class ItemsResponse:
+    """Kết quả get_items(): items là None nếu HTTP lỗi hoặc body không phải JSON hợp lệ"""
+
+    def __init__(self, status_code: int, items: Optional[List[Any]]):
+        self.status_code = status_code
+        self.items = items
+
+
+_session: Optional["aiohttp.ClientSession"] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# GET đang chạy theo path, để các request giống nhau dùng chung (single-flight)
+_inflight: Dict[str, asyncio.Future] = {}
+_stats = {"requests": 0, "coalesced": 0}
+
+
+def get_session() -> "aiohttp.ClientSession":
+    """
+    ClientSession dùng chung (keep-alive, giới hạn connection mỗi host).
+    Session gắn với event loop nên sẽ tạo lại nếu loop thay đổi.
+    """
+    global _session, _session_loop
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_POOL_LIMIT,
+            limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+        )
+        _session = aiohttp.ClientSession(connector=connector)
+        _session_loop = loop
+    return _session
+
+
+async def close_session() -> None:
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+async def request(method: str, path: str, timeout: float = 5, **kwargs) -> BackendResponse:
+    """
+    Gọi API backend, path tính từ API_BASE_URL (vd: "/movies").
+    Timeout bị cắt theo latency budget còn lại của action; nếu circuit
+    breaker của nhóm endpoint đang mở thì báo lỗi ngay, không gọi backend.
+    """
+    status, text = await _send(method, path, timeout, _read_text, **kwargs)
+    return BackendResponse(status, text)
+
+
+async def get_items(path: str, keys: Iterable[str] = ('data',),
+                    fields: Optional[Mapping[str, Optional[int]]] = None,
+                    timeout: float = 5) -> ItemsResponse:
+    """
+    GET một danh sách lớn (vd: /movies) và parse theo luồng: đọc body từng
+    đoạn STREAM_CHUNK_SIZE, chỉ giữ các item của mảng `keys` với các field
+    trong `fields`. Không bao giờ giữ cả document trong bộ nhớ.
+    """
+    async def read_items(response):
+        if response.status != 200:
+            text = await response.text()
+            return None, len(text)
+
+        decoder = codecs.getincrementaldecoder(response.charset or 'utf-8')(errors='replace')
+        stream = ItemStream(keys, fields)
+        items: List[Any] = []
+        size = 0
+        try:
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                size += len(chunk)
+                items.extend(stream.feed(decoder.decode(chunk)))
+                if stream.done:
+                    break
+            items.extend(stream.feed(decoder.decode(b'', final=True), final=not stream.done))
+        except ValueError as e:
+            logger.warning(f"GET {path}: invalid JSON body: {str(e)}")
+            return None, size
+        return items, size
+
+    status, items = await _send("GET", path, timeout, read_items)
+    return ItemsResponse(status, items)
+
+
+async def _read_text(response) -> Tuple[str, int]:
+    text = await response.text()
+    return text, len(text)
+
+
+async def _send(method: str, path: str, timeout: float,
+                read_body: Callable[[Any], Awaitable[Tuple[Any, int]]], **kwargs) -> Tuple[int, Any]:
+    """Gửi request qua budget + circuit breaker, ghi metrics; read_body đọc body -> (body, kích thước)"""
+    timeout = clamp_timeout(timeout)
+    if timeout <= 0:
+        metrics.count_error("backend", "budget_exhausted")
+        raise BackendTimeout(f"{method} {path}: action latency budget exhausted")
+
+    breaker = breaker_for(path)
+    permit = breaker.allow()
+    if permit is None:
+        metrics.count_error("backend", f"circuit_open_{breaker.name}")
+        raise CircuitOpenError(f"{method} {path}: circuit '{breaker.name}' is open")
+
+    import aiohttp
+
+    _stats["requests"] += 1
+    started = time.monotonic()
+    try:
+        async with get_session().request(
+            method,
+            f"{API_BASE_URL}{path}",
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            **kwargs
+        ) as response:
+            body, size = await read_body(response)
+    except asyncio.CancelledError:
+        breaker.release(permit)
+        raise
+    except asyncio.TimeoutError as e:
+        elapsed = time.monotonic() - started
+        breaker.record(False, elapsed, permit)
+        metrics.observe_backend(method, path, elapsed)
+        metrics.count_error("backend", "timeout")
+        raise BackendTimeout(f"{method} {path} timed out after {timeout:.1f}s") from e
+    except aiohttp.ClientError as e:
+        elapsed = time.monotonic() - started
+        breaker.record(False, elapsed, permit)
+        metrics.observe_backend(method, path, elapsed)
+        metrics.count_error("backend", "connection")
+        raise BackendError(f"{method} {path} failed: {str(e)}") from e
+    except Exception:
+        # Lỗi khác (vd: body không decode được): vẫn phải ghi kết quả, nếu
+        # không lần gọi thử ở trạng thái half open giữ breaker mở mãi
+        elapsed = time.monotonic() - started
+        breaker.record(False, elapsed, permit)
+        metrics.observe_backend(method, path, elapsed)
+        metrics.count_error("backend", "unexpected")
+        raise
+
+    elapsed = time.monotonic() - started
+    breaker.record(response.status < 500, elapsed, permit)
+    metrics.observe_backend(method, path, elapsed, response.status, size)
+    if response.status >= 500:
+        metrics.count_error("backend", f"http_{response.status}")
+    return response.status, body
+
+
+async def get(path: str, timeout: float = 5, **kwargs) -> BackendResponse:
+    """
+    GET có single-flight: nếu đang có một GET cùng path chưa xong thì chờ và
+    dùng chung kết quả của nó thay vì gọi backend thêm lần nữa.
+
+    Lời gọi dùng chung chỉ bị giới hạn bởi timeout của nó, không theo budget
+    của request đã tạo ra nó; mỗi request chờ tối đa theo budget của chính mình.
+    """
+    if kwargs:
+        return await request("GET", path, timeout=timeout, **kwargs)
+
+    wait = clamp_timeout(timeout)
+    if wait <= 0:
+        metrics.count_error("backend", "budget_exhausted")
+        raise BackendTimeout(f"GET {path}: action latency budget exhausted")
+
+    future = _inflight.get(path)
+    if future is None:
+        with detached():
+            future = asyncio.ensure_future(request("GET", path, timeout=timeout))
+        _inflight[path] = future
+        future.add_done_callback(lambda f: _finish_inflight(path, f))
+    else:
+        _stats["coalesced"] += 1
+
+    # shield: một request bị hủy / hết budget không làm hủy lời gọi mà request khác đang chờ
+    try:
+        return await asyncio.wait_for(asyncio.shield(future), wait)
+    except asyncio.TimeoutError as e:
+        metrics.count_error("backend", "budget_exhausted")
+        raise BackendTimeout(f"GET {path}: gave up after {wait:.1f}s (action latency budget)") from e
+
+
+def _finish_inflight(path: str, future: asyncio.Future) -> None:
+    if _inflight.get(path) is future:
+        del _inflight[path]
+    # Lấy exception để asyncio không cảnh báo khi mọi request chờ đều đã bị hủy
+    if not future.cancelled():
+        future.exception()
+
+
+def stats() -> Dict[str, Any]:
+    """Số request thật sự gửi tới backend, số GET được gộp và trạng thái circuit breaker"""
+    return {
+        **_stats,
+        "inflight": len(_inflight),
+        "breakers": {family: breaker.stats() for family, breaker in _breakers.items()},
+    }
+
+
+async def post(path: str, timeout: float = 10, **kwargs) -> BackendResponse:
+    return await request("POST", path, timeout=timeout, **kwargs)
@@ -0,0 +1,154 @@
+import json
+import re
+from typing import Any, Iterable, List, Mapping, Optional
+
+# Field các action thực sự dùng (None = giữ nguyên, số = cắt chuỗi còn tối đa
+# bấy nhiêu ký tự). Mô tả phim chỉ hiển thị 200 ký tự đầu nên giữ 201 ký tự
+# là đủ để vẫn biết có cần thêm "..." hay không
+MOVIE_FIELDS: Mapping[str, Optional[int]] = {
+    'id': None, 'movie_id': None, 'title': None, 'movie_name': None,
+    'release_date': None, 'runtime': None, 'duration': None,
+    'genre': None, 'genres': None, 'vote_average': None,
+    'description': 201, 'overview': 201,
+    'updated_at': None, 'updatedAt': None,
+}
+
+CINEMA_FIELDS: Mapping[str, Optional[int]] = {
+    'id': None, 'cinema_id': None, 'name': None, 'cinema_name': None,
+    'address': None, 'phone': None, 'cinema_phone': None,
+    'updated_at': None, 'updatedAt': None,
+}
+
+# Khoảng trắng và dấu phẩy giữa các phần tử
+_SEPARATORS = re.compile(r'[\s,]*')
+_KEY_SEPARATOR = re.compile(r'\s*:\s*')
+# Ký tự có thể nối tiếp một số JSON
+_NUMBER_CHARS = frozenset('0123456789.eE+-')
+
+_decoder = json.JSONDecoder()
+
+
+def project(item: Any, fields: Optional[Mapping[str, Optional[int]]]) -> Any:
+    """Chỉ giữ các field trong whitelist của một item (item không phải dict giữ nguyên)"""
+    if fields is None or not isinstance(item, dict):
+        return item
+    projected = {}
+    for field, max_length in fields.items():
+        if field in item:
+            value = item[field]
+            if max_length is not None and isinstance(value, str):
+                value = value[:max_length]
+            projected[field] = value
+    return projected
+
+
+class ItemStream:
+    """
+    Parser JSON tăng dần: nhận body theo từng đoạn (feed) và trả về từng
+    phần tử của mảng cần lấy ngay khi đọc đủ, đã lọc field.
+
+    Body có thể là một mảng, hoặc một object mà mảng nằm ở một trong các
+    key `keys` (vd: {"success": true, "movies": [...]}). Mỗi lần chỉ giải mã
+    một phần tử (bằng json C decoder), nên bộ nhớ không tăng theo kích thước
+    cả document.
+    """
+
+    def __init__(self, keys: Iterable[str] = ('data',),
+                 fields: Optional[Mapping[str, Optional[int]]] = None):
+        self.keys = frozenset(keys)
+        self.fields = fields
+        self.done = False
+        self._buffer = ''
+        self._state = 'start'
+        self._in_object = False
+
+    def feed(self, text: str, final: bool = False) -> List[Any]:
+        """Thêm một đoạn body; trả các item đọc xong. final=True ở đoạn cuối cùng"""
+        self._buffer += text
+        items: List[Any] = []
+        pos = 0
+
+        while not self.done:
+            pos = _SEPARATORS.match(self._buffer, pos).end()
+            if pos >= len(self._buffer):
+                break
+            char = self._buffer[pos]
+
+            if self._state == 'start':
+                if char == '[':
+                    self._state = 'array'
+                elif char == '{':
+                    self._state = 'object'
+                    self._in_object = True
+                else:
+                    raise ValueError(f"Unexpected JSON document start: {char!r}")
+                pos += 1
+
+            elif self._state == 'array':
+                if char == ']':
+                    pos += 1
+                    self._state = 'object' if self._in_object else 'end'
+                    self.done = not self._in_object
+                    continue
+                value, end = self._decode(pos, final)
+                if end is None:
+                    break
+                items.append(project(value, self.fields))
+                pos = end
+
+            else:  # object: "key": value, ...
+                if char == '}':
+                    self.done = True
+                    break
+                key, key_end = self._decode(pos, final)
+                if key_end is None:
+                    break
+                value_start = self._value_start(key_end)
+                if value_start is None:
+                    break
+                if key in self.keys and self._buffer[value_start] == '[':
+                    self._state = 'array'
+                    pos = value_start + 1
+                    continue
+                # Giá trị không cần: giải mã rồi bỏ (thường chỉ là "success": true)
+                _, end = self._decode(value_start, final)
+                if end is None:
+                    break
+                pos = end
+
+        self._buffer = self._buffer[pos:]
+        if final and not self.done:
+            raise ValueError("Truncated JSON document")
+        return items
+
+    def _value_start(self, pos: int) -> Optional[int]:
+        """Vị trí bắt đầu giá trị sau dấu ':', None nếu buffer chưa tới đó"""
+        match = _KEY_SEPARATOR.match(self._buffer, pos)
+        if match is None:
+            if self._buffer[pos:].strip():
+                raise ValueError(f"Expected ':' at offset {pos}")
+            return None
+        if match.end() >= len(self._buffer):
+            return None
+        return match.end()
+
+    def _decode(self, pos: int, final: bool):
+        """(value, vị trí kết thúc), hoặc (None, None) nếu cần thêm dữ liệu"""
+        try:
+            value, end = _decoder.raw_decode(self._buffer, pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return None, None
+        # Số có thể chưa đọc hết: "12" của "123" hay "12." của "12.5"
+        if not final and isinstance(value, (int, float)) and not isinstance(value, bool):
+            if end == len(self._buffer) or self._buffer[end] in _NUMBER_CHARS:
+                return None, None
+        return value, end
+
+
+def parse_items(text: str, keys: Iterable[str] = ('data',),
+                fields: Optional[Mapping[str, Optional[int]]] = None) -> List[Any]:
+    """Như ItemStream nhưng cho body đã có sẵn"""
+    return ItemStream(keys, fields).feed(text, final=True)
+
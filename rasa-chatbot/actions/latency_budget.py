@@ -0,0 +1,64 @@
+import contextvars
+import functools
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Iterator, Optional
+
+# Tổng thời gian tối đa một action được chờ backend (mọi lần gọi cộng lại)
+ACTION_LATENCY_BUDGET = float(os.getenv("ACTION_LATENCY_BUDGET", "8"))
+BOOKING_LATENCY_BUDGET = float(os.getenv("BOOKING_LATENCY_BUDGET", "20"))
+
+# Deadline (time.monotonic) của action đang chạy; task con tạo bằng
+# ensure_future/create_task nhận bản sao context nên dùng chung deadline
+_deadline: "contextvars.ContextVar[Optional[float]]" = contextvars.ContextVar(
+    "action_deadline", default=None
+)
+
+
+@contextmanager
+def latency_budget(seconds: float = ACTION_LATENCY_BUDGET) -> Iterator[None]:
+    """Giới hạn tổng thời gian chờ backend của đoạn code bên trong"""
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    # Budget lồng nhau không được dài hơn budget bên ngoài
+    token = _deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def detached() -> Iterator[None]:
+    """Bỏ budget của action hiện tại (vd: task refresh chạy nền sau khi action đã trả lời)"""
+    token = _deadline.set(None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def budgeted(seconds: Optional[float] = None):
+    """Decorator cho Action.run: cả action chỉ được chờ backend tối đa `seconds` giây"""
+    def decorator(func: Callable[..., Awaitable[Any]]):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with latency_budget(ACTION_LATENCY_BUDGET if seconds is None else seconds):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def remaining() -> Optional[float]:
+    """Số giây còn lại của budget hiện tại, None nếu không có budget"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def clamp_timeout(timeout: float) -> float:
+    """Timeout của một lần gọi không vượt quá phần budget còn lại"""
+    left = remaining()
+    return timeout if left is None else min(timeout, left)
@@ -0,0 +1,235 @@
+import asyncio
+import bisect
+import functools
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Chu kỳ ghi metrics (giây), 0 = tắt. Có METRICS_FILE thì ghi file text format
+# Prometheus (node_exporter textfile collector), không thì ghi ra log
+METRICS_DUMP_INTERVAL = float(os.getenv("METRICS_DUMP_INTERVAL", "60"))
+METRICS_FILE = os.getenv("METRICS_FILE", "")
+METRICS_PREFIX = "rasa_actions_"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+Labels = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: Labels, extra: str = "") -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Histogram:
+    """Histogram theo bucket cố định, một series cho mỗi bộ label"""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str],
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        # labels -> [đếm theo bucket (không cộng dồn, phần tử cuối là +Inf), tổng, số lần]
+        self._series: Dict[Labels, List[Any]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def quantile(self, q: float, *labels: str) -> Optional[float]:
+        """Ước lượng quantile bằng cận trên của bucket (đủ cho log/dump)"""
+        series = self._series.get(labels)
+        if not series or not series[2]:
+            return None
+        target = q * series[2]
+        seen = 0
+        for bound, count in zip(self.buckets, series[0]):
+            seen += count
+            if seen >= target:
+                return bound
+        return float("inf")
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for labels, (counts, total, count) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                le = _format_labels(self.label_names, labels, f'le="{bound}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            le = _format_labels(self.label_names, labels, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{le} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, labels)} {total:.6f}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, labels)} {count}")
+        return lines
+
+    def clear(self) -> None:
+        self._series.clear()
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._values: Dict[Labels, int] = {}
+
+    def inc(self, *labels: str) -> None:
+        self._values[labels] = self._values.get(labels, 0) + 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.label_names, labels)} {value}")
+        return lines
+
+    def clear(self) -> None:
+        self._values.clear()
+
+
+ACTION_LATENCY = Histogram(
+    METRICS_PREFIX + "action_duration_seconds", "Thời gian chạy Action.run",
+    ("action",)
+)
+BACKEND_LATENCY = Histogram(
+    METRICS_PREFIX + "backend_request_seconds", "Thời gian gọi API backend",
+    ("method", "endpoint", "status")
+)
+BACKEND_PAYLOAD = Histogram(
+    METRICS_PREFIX + "backend_response_size", "Kích thước body response backend (ký tự, hoặc byte nếu đọc theo luồng)",
+    ("method", "endpoint"), SIZE_BUCKETS
+)
+ERRORS = Counter(
+    METRICS_PREFIX + "errors_total", "Số lỗi theo nơi xảy ra và loại lỗi",
+    ("source", "kind")
+)
+
+# Tên -> hàm trả stats() của một cache; đọc lúc render nên không tốn gì trên hot path
+_collectors: Dict[str, Callable[[], Dict[str, Any]]] = {}
+_dump_task: Optional[asyncio.Task] = None
+
+
+def endpoint_label(path: str) -> str:
+    """Gộp path theo mẫu để số series không tăng theo id: /showtimes/seats-status/12 -> /showtimes/seats-status/:id"""
+    segments = path.split("?", 1)[0].split("/")
+    return "/".join(":id" if any(c.isdigit() for c in segment) else segment for segment in segments)
+
+
+def observe_backend(method: str, path: str, seconds: float,
+                    status: Optional[int] = None, size: Optional[int] = None) -> None:
+    endpoint = endpoint_label(path)
+    BACKEND_LATENCY.observe(seconds, method, endpoint, str(status) if status else "error")
+    if size is not None:
+        BACKEND_PAYLOAD.observe(size, method, endpoint)
+
+
+def count_error(source: str, kind: str) -> None:
+    ERRORS.inc(source, kind)
+
+
+def register_collector(name: str, collector: Callable[[], Dict[str, Any]]) -> None:
+    _collectors[name] = collector
+
+
+def instrumented(func: Callable[..., Awaitable[Any]]):
+    """Decorator cho Action.run: đo thời gian và đếm exception theo tên action"""
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        ensure_dump_task()
+        action = self.name()
+        started = time.perf_counter()
+        try:
+            return await func(self, *args, **kwargs)
+        except Exception as e:
+            count_error(action, type(e).__name__)
+            raise
+        finally:
+            ACTION_LATENCY.observe(time.perf_counter() - started, action)
+    return wrapper
+
+
+def render() -> str:
+    """Toàn bộ metrics dạng text format của Prometheus"""
+    lines: List[str] = []
+    for metric in (ACTION_LATENCY, BACKEND_LATENCY, BACKEND_PAYLOAD, ERRORS):
+        lines.extend(metric.render())
+
+    stat_name = METRICS_PREFIX + "cache_stat"
+    ratio_name = METRICS_PREFIX + "cache_hit_ratio"
+    stat_lines = [f"# HELP {stat_name} Các bộ đếm trong stats() của cache",
+                  f"# TYPE {stat_name} gauge"]
+    ratio_lines = [f"# HELP {ratio_name} hits / (hits + misses) từ lúc khởi động",
+                   f"# TYPE {ratio_name} gauge"]
+    for name, collector in sorted(_collectors.items()):
+        try:
+            stats = collector()
+        except Exception as e:
+            logger.warning(f"Metrics collector '{name}' failed: {str(e)}")
+            continue
+        for key, value in stats.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                stat_lines.append(f'{stat_name}{{cache="{name}",stat="{key}"}} {value}')
+        lookups = stats.get("hits", 0) + stats.get("misses", 0)
+        if lookups:
+            ratio_lines.append(f'{ratio_name}{{cache="{name}"}} {stats["hits"] / lookups:.4f}')
+
+    lines.extend(stat_lines)
+    lines.extend(ratio_lines)
+    return "\n".join(lines) + "\n"
+
+
+def summary() -> str:
+    """Một dòng/action: số lần, p50/p95 (cận trên bucket) - dùng khi ghi ra log"""
+    parts = []
+    for (action,), (_, total, count) in sorted(ACTION_LATENCY._series.items()):
+        p50 = ACTION_LATENCY.quantile(0.5, action)
+        p95 = ACTION_LATENCY.quantile(0.95, action)
+        parts.append(f"{action}: n={count} avg={total / count * 1000:.0f}ms p50<={p50}s p95<={p95}s")
+    return "; ".join(parts) or "no actions yet"
+
+
+def dump() -> None:
+    if not METRICS_FILE:
+        logger.info(f"Metrics: {summary()}")
+        return
+    # Ghi file tạm rồi rename để collector không đọc phải file ghi dở
+    tmp_path = f"{METRICS_FILE}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(render())
+    os.replace(tmp_path, METRICS_FILE)
+
+
+async def _dump_periodically(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            dump()
+        except OSError as e:
+            logger.warning(f"Could not write metrics to {METRICS_FILE}: {str(e)}")
+        except Exception:
+            # Lỗi khác (vd: collector hỏng) không được làm chết task ghi định kỳ
+            logger.exception("Could not dump metrics")
+
+
+def ensure_dump_task() -> None:
+    """Khởi động task ghi metrics định kỳ trên event loop đang chạy (một lần)"""
+    global _dump_task
+    if METRICS_DUMP_INTERVAL <= 0 or (_dump_task is not None and not _dump_task.done()):
+        return
+    _dump_task = asyncio.ensure_future(_dump_periodically(METRICS_DUMP_INTERVAL))
+
+
+def clear() -> None:
+    for metric in (ACTION_LATENCY, BACKEND_LATENCY, BACKEND_PAYLOAD, ERRORS):
+        metric.clear()
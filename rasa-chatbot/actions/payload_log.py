@@ -0,0 +1,20 @@
+import logging
+import os
+import random
+from typing import Any
+
+# Tỉ lệ request được ghi nguyên payload (0..1) ở mức DEBUG. Mặc định 0: không
+# format payload nào, tránh tốn thời gian serialize trên hot path
+PAYLOAD_LOG_SAMPLE_RATE = float(os.getenv("PAYLOAD_LOG_SAMPLE_RATE", "0"))
+
+
+def payload_logging_enabled(logger: logging.Logger) -> bool:
+    return (PAYLOAD_LOG_SAMPLE_RATE > 0
+            and logger.isEnabledFor(logging.DEBUG)
+            and random.random() < PAYLOAD_LOG_SAMPLE_RATE)
+
+
+def log_payload(logger: logging.Logger, label: str, payload: Any) -> None:
+    """Ghi payload ở mức DEBUG theo tỉ lệ lấy mẫu; không được chọn thì không format gì cả"""
+    if payload_logging_enabled(logger):
+        logger.debug("%s: %s", label, payload)
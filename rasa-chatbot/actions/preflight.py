@@ -0,0 +1,29 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class Preflight:
+    """
+    Các bước fetch trước khi tạo booking.
+
+    fetch(key, factory) khởi chạy ngay coroutine của factory dưới dạng task và
+    ghi nhớ theo key: các bước độc lập chạy song song, gọi lại cùng key chỉ trả
+    về task cũ nên mỗi resource được fetch tối đa một lần. Bước phụ thuộc chỉ
+    cần await task của bước nó cần rồi mới fetch.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+
+    def fetch(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._tasks[key] = task
+        return task
+
+    def cancel(self) -> None:
+        """Hủy các bước chưa xong (vd: khi dừng sớm vì ghế không hợp lệ)"""
+        for task in self._tasks.values():
+            if not task.done():
+                task.cancel()
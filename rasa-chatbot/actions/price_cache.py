@@ -0,0 +1,136 @@
+import logging
+import os
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PRICE_CACHE_TTL = float(os.getenv("PRICE_CACHE_TTL", "1800"))
+# Số bảng giá (rạp x ngày) tối đa giữ trong cache, bỏ bảng dùng lâu nhất trước
+PRICE_CACHE_SIZE = int(os.getenv("PRICE_CACHE_SIZE", "1024"))
+
+# Giá mặc định khi không lấy được bảng giá của rạp
+DEFAULT_TICKET_PRICES: Mapping[str, float] = MappingProxyType({
+    'standard': 50000.0,
+    'normal': 50000.0,
+    'vip': 80000.0,
+    'couple': 150000.0,
+    'sweetbox': 150000.0,
+})
+
+
+class PriceTable:
+    """Bảng giá seat_type -> giá (chỉ đọc) của một rạp trong một ngày"""
+
+    __slots__ = ('prices', 'is_default')
+
+    def __init__(self, prices: Mapping[str, float], is_default: bool = False):
+        self.prices = prices
+        self.is_default = is_default
+
+    def price_for(self, seat_type: str) -> Tuple[float, bool]:
+        """Trả (giá, có_dùng_fallback): loại ghế không có giá thì lấy giá standard"""
+        price = self.prices.get(seat_type)
+        if price:
+            return price, self.is_default
+        return self.prices.get('standard', DEFAULT_TICKET_PRICES['standard']), True
+
+
+DEFAULT_PRICE_TABLE = PriceTable(DEFAULT_TICKET_PRICES, is_default=True)
+
+
+class PriceCache:
+    """
+    Cache bảng giá vé theo (cinema_id, date).
+
+    Giá mỗi rạp chỉ đổi vài lần một ngày nên bảng giá dựng sẵn được giữ trong
+    TTL; khi admin đổi giá thì gọi invalidate(). Bảng hết hạn bị xóa mỗi lần
+    lưu bảng mới và cache là LRU tối đa max_size bảng, nên server chạy lâu
+    không tích lũy bảng giá của các ngày đã qua. Lần nào phải báo giá mặc định
+    (không lấy được bảng giá hoặc thiếu loại ghế) đều được đếm trong stats().
+    """
+
+    def __init__(self, fetcher: Callable[[Any, str], Awaitable[Optional[Dict[str, float]]]],
+                 ttl: float = PRICE_CACHE_TTL, max_size: int = PRICE_CACHE_SIZE):
+        self.fetcher = fetcher
+        self.ttl = ttl
+        self.max_size = max_size
+        self._tables: "OrderedDict[Tuple[str, str], Tuple[float, PriceTable]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.fetch_errors = 0
+        self.default_tables = 0
+        self.type_fallbacks = 0
+
+    async def get(self, cinema_id: Any, date: str) -> PriceTable:
+        key = (str(cinema_id), date)
+        entry = self._tables.get(key)
+
+        if entry and time.monotonic() - entry[0] < self.ttl:
+            self.hits += 1
+            self._tables.move_to_end(key)
+            return entry[1]
+
+        self.misses += 1
+        try:
+            prices = await self.fetcher(cinema_id, date)
+        except Exception as e:
+            prices = None
+            logger.error(f"Error getting ticket prices: {e}")
+
+        if not prices:
+            # Không cache giá mặc định để lần sau thử lấy lại
+            self.fetch_errors += 1
+            self.default_tables += 1
+            logger.warning(f"Using default prices for cinema {cinema_id} on {date}")
+            return DEFAULT_PRICE_TABLE
+
+        return self._store(key, prices)
+
+    async def prefetch(self, cinema_id: Any, date: str) -> bool:
+        """
+        Nạp sẵn bảng giá (warm-up). Không tính vào hits/misses/giá mặc định,
+        vì các số đó đo những gì user thực sự nhận được; lỗi fetch ném ra.
+        """
+        prices = await self.fetcher(cinema_id, date)
+        if not prices:
+            return False
+        self._store((str(cinema_id), date), prices)
+        return True
+
+    def _store(self, key: Tuple[str, str], prices: Dict[str, float]) -> PriceTable:
+        table = PriceTable(MappingProxyType(dict(prices)))
+        now = time.monotonic()
+        for expired in [k for k, (stored_at, _) in self._tables.items() if now - stored_at >= self.ttl]:
+            del self._tables[expired]
+        self._tables[key] = (now, table)
+        self._tables.move_to_end(key)
+        while len(self._tables) > self.max_size:
+            self._tables.popitem(last=False)
+        return table
+
+    def record_fallback(self) -> None:
+        """Gọi khi một vé phải dùng giá fallback vì thiếu loại ghế trong bảng giá"""
+        self.type_fallbacks += 1
+
+    def invalidate(self, cinema_id: Any = None, date: Optional[str] = None) -> None:
+        """Xóa bảng giá theo rạp và/hoặc ngày; không truyền gì thì xóa hết"""
+        for key in list(self._tables):
+            if cinema_id is not None and key[0] != str(cinema_id):
+                continue
+            if date is not None and key[1] != date:
+                continue
+            del self._tables[key]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "fetch_errors": self.fetch_errors,
+            "default_tables": self.default_tables,
+            "type_fallbacks": self.type_fallbacks,
+            "size": len(self._tables),
+        }
@@ -0,0 +1,184 @@
+"""
+Record gọn (__slots__) cho dữ liệu backend được giữ trong cache.
+
+Mỗi loại có from_payload() giải quyết tên field khác nhau giữa các API
+(title/movie_name, id/cinema_id, ...) một lần lúc nạp, nên code dùng chỉ
+đọc attribute, không phải đoán key. from_payload trả None nếu payload
+không dùng được (không phải dict, thiếu id).
+"""
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+def _first(data: Dict[str, Any], *keys: str) -> Any:
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return None
+
+
+def build_records(record_type: Any, payloads: Iterable[Any]) -> List[Any]:
+    """Dựng record từ danh sách payload, bỏ các payload không dùng được"""
+    records = (record_type.from_payload(payload) for payload in payloads)
+    return [record for record in records if record is not None]
+
+
+class Movie:
+    __slots__ = ('id', 'title', 'release_date', 'runtime', 'genres',
+                 'vote_average', 'description', 'updated_at')
+
+    def __init__(self, id: str, title: str, release_date: Optional[str] = None,
+                 runtime: Any = None, genres: Tuple[str, ...] = (),
+                 vote_average: Any = None, description: str = '',
+                 updated_at: Optional[str] = None):
+        self.id = id
+        self.title = title
+        self.release_date = release_date
+        self.runtime = runtime
+        self.genres = genres
+        self.vote_average = vote_average
+        self.description = description
+        self.updated_at = updated_at
+
+    @classmethod
+    def from_payload(cls, data: Any) -> Optional['Movie']:
+        if not isinstance(data, dict):
+            return None
+        movie_id = _first(data, 'movie_id', 'id')
+        if movie_id is None:
+            return None
+
+        genres = _first(data, 'genre', 'genres') or ()
+        if isinstance(genres, str):
+            genres = (genres,)
+        return cls(
+            id=str(movie_id),
+            title=str(_first(data, 'title', 'movie_name') or ''),
+            release_date=data.get('release_date'),
+            runtime=_first(data, 'duration', 'runtime'),
+            genres=tuple(str(g) for g in genres),
+            vote_average=data.get('vote_average'),
+            description=str(_first(data, 'description', 'overview') or ''),
+            updated_at=_first(data, 'updated_at', 'updatedAt'),
+        )
+
+
+class Cinema:
+    __slots__ = ('id', 'name', 'address', 'phone', 'updated_at')
+
+    def __init__(self, id: str, name: str, address: Optional[str] = None,
+                 phone: Optional[str] = None, updated_at: Optional[str] = None):
+        self.id = id
+        self.name = name
+        self.address = address
+        self.phone = phone
+        self.updated_at = updated_at
+
+    @classmethod
+    def from_payload(cls, data: Any) -> Optional['Cinema']:
+        if not isinstance(data, dict):
+            return None
+        cinema_id = _first(data, 'id', 'cinema_id')
+        if cinema_id is None:
+            return None
+        return cls(
+            id=str(cinema_id),
+            name=str(_first(data, 'cinema_name', 'name') or ''),
+            address=data.get('address'),
+            phone=_first(data, 'cinema_phone', 'phone'),
+            updated_at=_first(data, 'updated_at', 'updatedAt'),
+        )
+
+
+class Showtime:
+    __slots__ = ('id', 'cinema_id', 'cinema_name', 'room_name', 'start_time',
+                 'movie_id', 'movie_title')
+
+    FIELDS = __slots__
+
+    def __init__(self, id: str, cinema_id: Any = None, cinema_name: Optional[str] = None,
+                 room_name: Optional[str] = None, start_time: Optional[str] = None,
+                 movie_id: Any = None, movie_title: Optional[str] = None):
+        self.id = id
+        self.cinema_id = cinema_id
+        self.cinema_name = cinema_name
+        self.room_name = room_name
+        self.start_time = start_time
+        self.movie_id = movie_id
+        self.movie_title = movie_title
+
+    @classmethod
+    def from_payload(cls, data: Any, **defaults) -> Optional['Showtime']:
+        """defaults: giá trị cho field mà payload không có (vd: movie_id của response theo phim)"""
+        if not isinstance(data, dict):
+            return None
+        showtime_id = _first(data, 'id', 'showtime_id')
+        if showtime_id is None:
+            return None
+
+        showtime = cls(
+            id=str(showtime_id),
+            cinema_id=_first(data, 'cinema_id', 'cinemaId', 'cinema_cluster_id', 'cinema_clusters_id'),
+            cinema_name=data.get('cinema_name'),
+            room_name=data.get('room_name'),
+            start_time=_first(data, 'start_time', 'show_time'),
+            movie_id=data.get('movie_id'),
+            movie_title=_first(data, 'movie_title', 'title'),
+        )
+        for field, value in defaults.items():
+            if getattr(showtime, field) is None:
+                setattr(showtime, field, value)
+        return showtime
+
+    def fill_missing(self, other: 'Showtime') -> None:
+        """Field nào của record này còn None thì lấy từ other (record cũ hơn)"""
+        for field in self.FIELDS:
+            if getattr(self, field) is None:
+                setattr(self, field, getattr(other, field))
+
+    @property
+    def start(self) -> Optional[datetime]:
+        if not self.start_time:
+            return None
+        try:
+            return datetime.fromisoformat(str(self.start_time).replace('Z', '+00:00'))
+        except ValueError:
+            return None
+
+
+class Seat:
+    __slots__ = ('number', 'seat_type', 'seat_id')
+
+    def __init__(self, number: str, seat_type: str = 'standard', seat_id: Any = None):
+        self.number = number
+        self.seat_type = seat_type
+        self.seat_id = seat_id
+
+    @classmethod
+    def from_payload(cls, data: Any) -> Optional['Seat']:
+        if not isinstance(data, dict):
+            return None
+        number = str(data.get('seat_number', '')).upper()
+        if not number:
+            return None
+        seat_type = _first(data, 'seat_type', 'type', 'seat_type_name') or 'standard'
+        return cls(number, str(seat_type).lower(), data.get('seat_id'))
+
+
+class PriceRule:
+    __slots__ = ('seat_type', 'price')
+
+    def __init__(self, seat_type: str, price: float):
+        self.seat_type = seat_type
+        self.price = price
+
+    @classmethod
+    def from_payload(cls, data: Any) -> Optional['PriceRule']:
+        if not isinstance(data, dict):
+            return None
+        seat_type = _first(data, 'seat_type', 'seat_type_name', 'type')
+        price = _first(data, 'base_price', 'price')
+        if not seat_type or not price:
+            return None
+        return cls(str(seat_type).lower(), float(price))
@@ -0,0 +1,194 @@
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+RENDER_CACHE_SIZE = int(os.getenv("RENDER_CACHE_SIZE", "512"))
+RENDER_CACHE_TTL = float(os.getenv("RENDER_CACHE_TTL", "60"))
+# Message tình trạng ghế đổi theo từng lượt đặt vé nên giữ riêng, không đẩy
+# message lịch chiếu / catalog ra khỏi cache chung
+SEAT_RENDER_CACHE_SIZE = int(os.getenv("SEAT_RENDER_CACHE_SIZE", "128"))
+
+SEAT_TYPE_EMOJI = {
+    'standard': '🪑',
+    'normal': '🪑',
+    'vip': '⭐',
+    'couple': '💑',
+    'sweetbox': '💑'
+}
+
+
+def seat_type_emoji(type_name: str) -> str:
+    return SEAT_TYPE_EMOJI.get(type_name.lower(), '🪑')
+
+
+def data_version(text: str) -> Tuple[int, int]:
+    """Version của một response theo nội dung (hash của str được Python cache sẵn)"""
+    return len(text), hash(text)
+
+
+class FragmentCache:
+    """
+    Cache message đã render theo (loại, entity, ngày, ..., version dữ liệu).
+
+    Cùng một phim/rạp/suất chiếu mà dữ liệu chưa đổi thì chỉ render một lần
+    cho mọi user; dữ liệu đổi thì version đổi nên key cũ tự hết được dùng.
+    LRU theo số message, kèm TTL để không giữ message quá lâu.
+    """
+
+    def __init__(self, max_size: int = RENDER_CACHE_SIZE, ttl: float = RENDER_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._fragments: "OrderedDict[Hashable, Tuple[float, str]]" = OrderedDict()
+        # nhóm (key không có version) -> key mới nhất, để trả message cũ khi backend lỗi
+        self._latest: Dict[Hashable, Hashable] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[str]:
+        entry = self._fragments.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self.ttl:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._fragments.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: Hashable, text: str, group: Optional[Hashable] = None) -> str:
+        self._fragments[key] = (time.monotonic(), text)
+        self._fragments.move_to_end(key)
+        if group is not None:
+            self._latest[group] = key
+        while len(self._fragments) > self.max_size:
+            self._fragments.popitem(last=False)
+        if len(self._latest) > 2 * self.max_size:
+            self._latest = {g: k for g, k in self._latest.items() if k in self._fragments}
+        return text
+
+    def latest(self, group: Hashable) -> Optional[str]:
+        """Message render gần nhất của nhóm, bỏ qua TTL (dùng khi không gọi được backend)"""
+        entry = self._fragments.get(self._latest.get(group))
+        return entry[1] if entry else None
+
+    def clear(self) -> None:
+        self._fragments.clear()
+        self._latest.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._fragments)}
+
+
+def render_movie_showtimes(movie_data: Dict[str, Any], grouped: Dict[str, List[Any]]) -> str:
+    """grouped: rạp -> các ShowtimeEntry (giờ chiếu, Showtime) đã sắp theo giờ (ShowtimeIndex.group)"""
+    title = movie_data.get('title', 'N/A')
+    runtime = movie_data.get('runtime', 'N/A')
+    genres = movie_data.get('genres', [])
+    vote_avg = movie_data.get('vote_average', 'N/A')
+
+    parts = [f"🎬 **{title}**\n", f"⏱️ Thời lượng: {runtime} phút\n"]
+    if genres:
+        parts.append(f"🎭 Thể loại: {', '.join(genres)}\n")
+    if vote_avg != 'N/A':
+        parts.append(f"⭐ Đánh giá: {vote_avg}/10\n")
+    parts.append("\n📅 **LỊCH CHIẾU:**\n\n")
+
+    for cinema, entries in grouped.items():
+        parts.append(f"🏢 **{cinema}**\n")
+        parts.extend(
+            f"   • {start.strftime('%d/%m')} - {start.strftime('%H:%M')} | "
+            f"Phòng {st.room_name or 'N/A'} | ID: {st.id}\n"
+            for start, st in entries[:10]
+        )
+        parts.append("\n")
+
+    parts.append(
+        "💡 **Để đặt vé:**\n"
+        "Vui lòng nhớ **ID suất chiếu** (ví dụ: ID: 5)\n"
+        "Sau đó bạn có thể xem ghế trống hoặc đặt vé ngay!"
+    )
+    return ''.join(parts)
+
+
+def _cinema_showtime_line(st: Dict[str, Any]) -> str:
+    show_time = st.get('show_time', '') or st.get('time', 'N/A')
+    line = f"   • {show_time} | Phòng {st.get('room_name', 'N/A')} | ID: {st.get('id', 'N/A')}"
+    price = st.get('ticket_price', '')
+    if price:
+        line += f" | {price} VND"
+    return line + "\n"
+
+
+def render_cinema_showtimes(cinema_name: str, showtimes: Iterable[Dict[str, Any]], date: str) -> str:
+    grouped_by_movie: Dict[str, List[Dict[str, Any]]] = {}
+    for st in showtimes:
+        movie = st.get('movie_title', '') or st.get('title', 'Phim không xác định')
+        grouped_by_movie.setdefault(movie, []).append(st)
+
+    parts = [f"🏢 **Lịch chiếu tại {cinema_name}**\n", f"📅 Ngày {date}\n\n"]
+    for movie, times in grouped_by_movie.items():
+        parts.append(f"🎬 **{movie}**\n")
+        parts.extend(_cinema_showtime_line(st) for st in times[:8])
+        parts.append("\n")
+
+    parts.append("💡 Để đặt vé, hãy nhớ ID suất chiếu bạn muốn xem!")
+    return ''.join(parts)
+
+
+def render_seat_status(showtime_id: Any, data: Dict[str, Any]) -> str:
+    """Tình trạng ghế của một suất chiếu từ payload /seats-status"""
+    summary = data.get('summary', {})
+    room_info = data.get('roomInfo', {})
+    available_by_type = data.get('availableByType', {})
+    occupied = summary.get('booked', 0) + summary.get('reserved', 0)
+
+    parts = [
+        f"🎫 **Suất chiếu ID: {showtime_id}**\n",
+        f"🏢 Phòng: {room_info.get('room_name', 'N/A')}\n\n",
+        "📊 **Tình trạng ghế:**\n",
+        f"• Tổng số ghế: {summary.get('total', 0)}\n",
+        f"• ✅ Còn trống: **{summary.get('available', 0)} ghế**\n",
+        f"• ❌ Đã đặt: {occupied} ghế\n\n",
+    ]
+
+    if summary.get('available', 0) > 0:
+        parts.append("🪑 **GHẾ CÒN TRỐNG:**\n\n")
+
+        for type_name, seats in available_by_type.items():
+            parts.append(f"{seat_type_emoji(type_name)} **{type_name.capitalize()}** ({len(seats)} ghế):\n")
+
+            seat_numbers = [s.get('seat_number', '') for s in seats]
+            seat_numbers = [s for s in seat_numbers if s]
+
+            parts.append(f"   {', '.join(seat_numbers[:30])}\n")
+            if len(seat_numbers) > 30:
+                parts.append(f"   ... và {len(seat_numbers) - 30} ghế khác\n")
+            parts.append("\n")
+
+        parts.append(
+            "💡 **Để đặt vé:**\n"
+            f"Nói: 'Đặt vé suất {showtime_id}, ghế A1 A2'\n"
+            "(Thay A1, A2 bằng ghế bạn muốn từ danh sách trên)"
+        )
+    else:
+        parts.append(
+            "😢 **Rất tiếc, suất chiếu này đã HẾT GHẾ!**\n\n"
+            "Vui lòng chọn suất chiếu khác."
+        )
+
+    return ''.join(parts)
+
+
+def render_seat_suggestions(showtime_id: Any, count: int, blocks: List[Any]) -> str:
+    """Gợi ý các block ghế liền nhau (SeatGrid.recommend) cho `count` người"""
+    if not blocks:
+        return f"\n\n🤔 Không còn {count} ghế liền nhau cùng loại, bạn có thể chọn ghế lẻ ở danh sách trên."
+
+    parts = [f"\n\n✨ **GỢI Ý {count} GHẾ LIỀN NHAU:**\n"]
+    parts.extend(
+        f"{seat_type_emoji(block.seat_type)} {block.label} ({block.seat_type.capitalize()})\n"
+        for block in blocks
+    )
+    parts.append(f"Nói: 'Đặt vé suất {showtime_id}, ghế {blocks[0].label}' để đặt nhanh")
+    return ''.join(parts)
@@ -0,0 +1,83 @@
+import os
+import re
+from typing import List, NamedTuple
+
+from .text_normalize import strip_diacritics, to_nfc
+
+# Số ghế tối đa một lần đặt (chặn các range lỡ tay như "A1-A500")
+MAX_SEATS_PER_BOOKING = int(os.getenv("MAX_SEATS_PER_BOOKING", "50"))
+
+_RANGE_WORD = r'(?:-|~|\.\.|\bDEN\b|\bTOI\b|\bTO\b)'
+
+# Text đã bỏ dấu + viết hoa. Thứ tự nhánh: hàng + khoảng số, range mã ghế, mã ghế lẻ
+_SEAT_EXPRESSION = re.compile(
+    r'\b(?:HANG|DAY|ROW)\s+(?P<row>[A-Z]{1,2})\s+(?:(?:TU|SO|GHE)\s+)*'
+    r'(?P<row_from>\d{1,3})\s*' + _RANGE_WORD + r'\s*(?:SO\s+)?(?P<row_to>\d{1,3})\b'
+    r'|'
+    r'\b(?P<from_row>[A-Z]{1,2})(?P<from_col>\d{1,3})\s*' + _RANGE_WORD +
+    r'\s*(?P<to_row>[A-Z]{1,2})?(?P<to_col>\d{1,3})\b'
+    r'|'
+    r'\b(?P<single_row>[A-Z]{1,2})(?P<single_col>\d{1,3})\b'
+)
+
+
+class SeatSelection(NamedTuple):
+    seats: List[str]        # mã ghế theo thứ tự user nói, không trùng
+    duplicates: List[str]   # ghế được nhắc lại nhiều lần
+    invalid: List[str]      # biểu thức không hợp lệ (range khác hàng, quá dài, ...)
+
+
+def parse_seat_expression(text: str) -> SeatSelection:
+    """
+    Đọc danh sách ghế từ câu user, hỗ trợ:
+    "A1 A2", "A1, A2", "A1-A8", "A1-8", "C5 đến C10", "hàng C từ 5 đến 10", "AA12"
+    """
+    normalized = _normalize(text)
+
+    seats: List[str] = []
+    seen = set()
+    duplicates: List[str] = []
+    invalid: List[str] = []
+
+    for match in _SEAT_EXPRESSION.finditer(normalized):
+        if match.group('row'):
+            row = match.group('row')
+            start, end = int(match.group('row_from')), int(match.group('row_to'))
+        elif match.group('from_row'):
+            row = match.group('from_row')
+            if match.group('to_row') and match.group('to_row') != row:
+                invalid.append(match.group(0))
+                continue
+            start, end = int(match.group('from_col')), int(match.group('to_col'))
+        else:
+            row = match.group('single_row')
+            start = end = int(match.group('single_col'))
+
+        if start > end:
+            start, end = end, start
+        if end - start + 1 > MAX_SEATS_PER_BOOKING:
+            invalid.append(match.group(0))
+            continue
+
+        for col in range(start, end + 1):
+            seat = f"{row}{col}"
+            if seat in seen:
+                if seat not in duplicates:
+                    duplicates.append(seat)
+            else:
+                seen.add(seat)
+                seats.append(seat)
+
+    return SeatSelection(seats, duplicates, invalid)
+
+
+def has_range_syntax(text: str) -> bool:
+    """Câu có range ("A1-A8", "C5 đến C10") hoặc chọn theo hàng ("hàng C từ 5 đến 10")"""
+    return any(
+        match.group('row') or match.group('to_col')
+        for match in _SEAT_EXPRESSION.finditer(_normalize(text))
+    )
+
+
+def _normalize(text: str) -> str:
+    return strip_diacritics(to_nfc(text)).upper()
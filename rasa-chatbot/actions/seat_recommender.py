@@ -0,0 +1,142 @@
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .seat_snapshot import seat_type_of
+
+SEAT_CODE = re.compile(r'^([A-Z]+)(\d+)$')
+
+# Loại ghế đôi: một block không được tách đôi ghế (1-2, 3-4, ...)
+COUPLE_TYPES = frozenset({'couple', 'sweetbox'})
+
+# Bit ở các cột lẻ (1, 3, 5, ...): điểm bắt đầu hợp lệ của ghế đôi
+_ODD_COLUMNS = int('10' * 256, 2)
+
+# Hàng "đẹp" nhất tính từ màn hình (0 = hàng đầu, 1 = hàng cuối)
+IDEAL_ROW_POSITION = 0.6
+ROW_WEIGHT = 0.5
+
+
+@lru_cache(maxsize=8192)
+def parse_seat_code(seat_number: Any) -> Optional[Tuple[str, int]]:
+    """"C12" -> ("C", 12), None nếu không đúng dạng hàng + số"""
+    match = SEAT_CODE.match(str(seat_number).strip().upper())
+    if not match:
+        return None
+    return match.group(1), int(match.group(2))
+
+
+def row_order(row: str) -> Tuple[int, str]:
+    """A..Z rồi AA, AB, ... (hàng hai chữ cái nằm sau)"""
+    return len(row), row
+
+
+class SeatBlock(NamedTuple):
+    row: str
+    start: int
+    end: int
+    seat_type: str
+    score: float
+
+    @property
+    def seat_numbers(self) -> List[str]:
+        return [f"{self.row}{col}" for col in range(self.start, self.end + 1)]
+
+    @property
+    def label(self) -> str:
+        if self.start == self.end:
+            return f"{self.row}{self.start}"
+        return f"{self.row}{self.start}-{self.row}{self.end}"
+
+
+class SeatGrid:
+    """
+    Phòng chiếu dạng lưới hàng x cột, dựng từ payload /seats-status.
+
+    Mỗi hàng lưu bitmask các cột còn trống theo từng loại ghế (bit c = ghế
+    số c), nên tìm mọi block N ghế liền nhau trong một hàng chỉ là N-1 phép
+    AND/shift trên số nguyên thay vì duyệt từng ghế.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        self.width: Dict[str, int] = {}
+        self.available: Dict[str, Dict[str, int]] = {}   # seat_type -> row -> bitmask
+
+        for seat in data.get('availableSeats', []):
+            parsed = parse_seat_code(seat.get('seat_number', ''))
+            if not parsed:
+                continue
+            row, col = parsed
+            self._extend(row, col)
+            rows = self.available.setdefault(seat_type_of(seat), {})
+            rows[row] = rows.get(row, 0) | (1 << col)
+
+        for seat in data.get('occupiedSeats', []):
+            parsed = parse_seat_code(seat.get('seat_number', ''))
+            if parsed:
+                self._extend(*parsed)
+
+        self.rows = sorted(self.width, key=row_order)
+        self._row_index = {row: i for i, row in enumerate(self.rows)}
+
+    def _extend(self, row: str, col: int) -> None:
+        if col > self.width.get(row, 0):
+            self.width[row] = col
+
+    @property
+    def seat_types(self) -> List[str]:
+        return list(self.available)
+
+    def recommend(self, count: int, seat_type: Optional[str] = None,
+                  limit: int = 3) -> List[SeatBlock]:
+        """
+        Tối đa `limit` block `count` ghế liền nhau cùng hàng, không chồng lên
+        nhau, ưu tiên giữa hàng và hàng gần vị trí lý tưởng. Không truyền
+        seat_type thì xét mọi loại ghế (mỗi block chỉ một loại). Ghế đôi bán
+        theo cặp nên block làm tròn lên số ghế chẵn (3 người -> 2 ghế đôi).
+        """
+        if count < 1 or not self.rows:
+            return []
+
+        types: Iterable[str] = [seat_type.lower()] if seat_type else self.available
+        last_row = max(len(self.rows) - 1, 1)
+
+        candidates = []
+        for type_name in types:
+            aligned = type_name in COUPLE_TYPES
+            # Ghế đôi: bắt đầu ở cột lẻ và đủ số ghế chẵn thì block kết thúc ở cột chẵn
+            size = count + count % 2 if aligned else count
+            for row, mask in self.available.get(type_name, {}).items():
+                # starts: bit c bật nếu các ghế c .. c+size-1 đều trống
+                starts = mask
+                for offset in range(1, size):
+                    starts &= mask >> offset
+                if aligned:
+                    starts &= _ODD_COLUMNS
+                if not starts:
+                    continue
+
+                width = self.width[row]
+                row_center = (width + 1) / 2
+                row_penalty = ROW_WEIGHT * abs(self._row_index[row] / last_row - IDEAL_ROW_POSITION)
+
+                while starts:
+                    low = starts & -starts
+                    start = low.bit_length() - 1
+                    starts ^= low
+
+                    block_center = start + (size - 1) / 2
+                    score = abs(block_center - row_center) / width + row_penalty
+                    candidates.append((score, row, start, size, type_name))
+
+        chosen: List[SeatBlock] = []
+        taken: Dict[str, int] = {}
+        for score, row, start, size, type_name in sorted(candidates):
+            block_bits = ((1 << size) - 1) << start
+            if taken.get(row, 0) & block_bits:
+                continue
+            taken[row] = taken.get(row, 0) | block_bits
+            chosen.append(SeatBlock(row, start, start + size - 1, type_name, round(score, 4)))
+            if len(chosen) >= limit:
+                break
+        return chosen
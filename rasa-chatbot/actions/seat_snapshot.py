@@ -0,0 +1,144 @@
+import itertools
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .records import Seat
+from .rendering import data_version
+
+logger = logging.getLogger(__name__)
+
+# User thường xem ghế rồi đặt trong vài giây nên chỉ giữ snapshot rất ngắn
+SEAT_SNAPSHOT_TTL = float(os.getenv("SEAT_SNAPSHOT_TTL", "5"))
+
+
+def seat_type_of(seat: Dict[str, Any]) -> str:
+    return (
+        seat.get('seat_type') or
+        seat.get('type') or
+        seat.get('seat_type_name') or
+        'standard'
+    ).lower()
+
+
+class SeatSnapshot:
+    """
+    Trạng thái ghế của một suất chiếu tại một thời điểm (payload /seats-status).
+
+    - seats:        seat_number (viết hoa) -> Seat còn trống
+    - positions:    seat_number -> vị trí bit, cho mọi ghế trong phòng
+    - available:    bitset các ghế còn trống
+    - type_bitsets: loại ghế -> bitset các ghế trống thuộc loại đó
+    - version:      tăng theo mỗi lần fetch
+    - content:      version theo nội dung payload (như data_version): fetch lại mà
+                    ghế không đổi thì giữ nguyên, dùng làm key cho message đã render
+    Kiểm tra N ghế chỉ là N lần tra dict, không phụ thuộc kích thước phòng.
+    """
+
+    __slots__ = ('showtime_id', 'data', 'version', 'content', 'seats', 'positions', 'available', 'type_bitsets')
+
+    _versions = itertools.count(1)
+
+    def __init__(self, showtime_id: str, data: Dict[str, Any], content: Optional[Any] = None):
+        self.showtime_id = showtime_id
+        self.data = data
+        self.version = next(self._versions)
+        self.content = content if content is not None else self.version
+        self.seats: Dict[str, Seat] = {}
+        self.positions: Dict[str, int] = {}
+        self.available = 0
+        self.type_bitsets: Dict[str, int] = {}
+
+        for payload in data.get('availableSeats', []):
+            seat = Seat.from_payload(payload)
+            if seat is None:
+                continue
+            bit = 1 << self._position(seat.number)
+            self.seats[seat.number] = seat
+            self.available |= bit
+            self.type_bitsets[seat.seat_type] = self.type_bitsets.get(seat.seat_type, 0) | bit
+
+        for seat in data.get('occupiedSeats', []):
+            seat_number = str(seat.get('seat_number', '')).upper()
+            if seat_number:
+                self._position(seat_number)
+
+    def _position(self, seat_number: str) -> int:
+        position = self.positions.get(seat_number)
+        if position is None:
+            position = len(self.positions)
+            self.positions[seat_number] = position
+        return position
+
+    def get_available(self, seat_number: str) -> Optional[Seat]:
+        """Thông tin ghế nếu còn trống, None nếu đã đặt hoặc không tồn tại"""
+        return self.seats.get(str(seat_number).upper())
+
+    def validate(self, seat_numbers: List[str]) -> Tuple[List[Seat], List[str]]:
+        """Trả (ghế hợp lệ, mã ghế không khả dụng)"""
+        found, missing = [], []
+        for seat_number in seat_numbers:
+            seat = self.get_available(seat_number)
+            if seat is None:
+                missing.append(seat_number)
+            else:
+                found.append(seat)
+        return found, missing
+
+    def count_available(self, seat_type: Optional[str] = None) -> int:
+        bits = self.type_bitsets.get(seat_type.lower(), 0) if seat_type else self.available
+        return bin(bits).count('1')
+
+
+class SeatSnapshotCache:
+    """
+    Snapshot ghế theo suất chiếu với TTL ngắn, để bước xem ghế và bước đặt vé
+    ngay sau đó dùng chung một lần gọi /seats-status. Xóa khi có booking.
+    """
+
+    def __init__(self, fetcher: Callable[[str], Awaitable[Any]],
+                 ttl: float = SEAT_SNAPSHOT_TTL):
+        self.fetcher = fetcher
+        self.ttl = ttl
+        self._snapshots: Dict[str, Tuple[float, SeatSnapshot]] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, showtime_id: Any) -> Tuple[int, Optional[SeatSnapshot]]:
+        """
+        Trả (HTTP status, snapshot). snapshot là None nếu backend trả lỗi
+        hoặc success = false.
+        """
+        key = str(showtime_id)
+        entry = self._snapshots.get(key)
+
+        if entry and time.monotonic() - entry[0] < self.ttl:
+            self.hits += 1
+            return 200, entry[1]
+
+        self.misses += 1
+        response = await self.fetcher(key)
+        if response.status_code != 200:
+            return response.status_code, None
+
+        data = response.json()
+        if not data.get('success'):
+            return response.status_code, None
+
+        snapshot = SeatSnapshot(key, data, content=data_version(response.text))
+        self._snapshots[key] = (time.monotonic(), snapshot)
+        self._evict_expired()
+        return 200, snapshot
+
+    def invalidate(self, showtime_id: Any) -> None:
+        self._snapshots.pop(str(showtime_id), None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._snapshots)}
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        for key in [k for k, (stored_at, _) in self._snapshots.items() if now - stored_at >= self.ttl]:
+            del self._snapshots[key]
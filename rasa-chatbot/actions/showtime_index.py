@@ -0,0 +1,87 @@
+import logging
+from array import array
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+from .records import Showtime
+
+logger = logging.getLogger(__name__)
+
+UNKNOWN_CINEMA = 'Rạp không xác định'
+
+
+class ShowtimeEntry(NamedTuple):
+    start: datetime
+    showtime: Showtime
+
+
+def parse_start_time(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        logger.warning(f"Cannot parse date: {value}")
+        return None
+
+
+class ShowtimeIndex:
+    """
+    Lịch chiếu của một response, dựng một lần.
+
+    Payload được chuyển thành Showtime record (start_time chỉ parse một lần)
+    rồi xếp theo giờ thành các cột song song: ids, starts, records. Mỗi
+    bucket (ngày, rạp) chỉ là một array vị trí trỏ vào các cột đó, nên lọc
+    theo ngày, fallback "mọi ngày" và nhóm theo rạp không phải sắp xếp lại.
+    Rạp giữ theo thứ tự xuất hiện trong response.
+    """
+
+    def __init__(self, showtimes: Iterable[Dict[str, Any]], **defaults):
+        """defaults: field chung cho mọi suất chiếu (vd: movie_id, movie_title)"""
+        self.cinemas: List[str] = []
+        self._all: Dict[str, array] = {}
+        self._by_date: Dict[str, Dict[str, array]] = {}
+
+        entries = []
+        for order, payload in enumerate(showtimes):
+            record = Showtime.from_payload(payload, **defaults)
+            if record is None:
+                continue
+            cinema = record.cinema_name or UNKNOWN_CINEMA
+            if cinema not in self._all:
+                self._all[cinema] = array('I')
+                self.cinemas.append(cinema)
+
+            start = parse_start_time(record.start_time)
+            if start is not None:
+                entries.append((start, order, cinema, record))
+
+        entries.sort(key=lambda e: (e[0], e[1]))
+        self.starts: List[datetime] = [start for start, _, _, _ in entries]
+        self.ids: List[str] = [record.id for _, _, _, record in entries]
+        self.records: List[Showtime] = [record for _, _, _, record in entries]
+
+        for position, (start, _, cinema, _) in enumerate(entries):
+            self._all[cinema].append(position)
+            date_buckets = self._by_date.setdefault(start.strftime('%Y-%m-%d'), {})
+            date_buckets.setdefault(cinema, array('I')).append(position)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def dates(self) -> List[str]:
+        return sorted(self._by_date)
+
+    def group(self, date: Optional[str] = None,
+              cinemas: Optional[Iterable[str]] = None) -> Dict[str, List[ShowtimeEntry]]:
+        """
+        Suất chiếu theo rạp (đã sắp theo giờ) cho một ngày, hoặc mọi ngày nếu
+        date là None. Chỉ lấy các rạp trong cinemas nếu có truyền.
+        """
+        buckets = self._by_date.get(date, {}) if date is not None else self._all
+        names = self.cinemas if cinemas is None else cinemas
+        return {
+            name: [ShowtimeEntry(self.starts[p], self.records[p]) for p in buckets[name]]
+            for name in names if buckets.get(name)
+        }
@@ -0,0 +1,101 @@
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+from .records import Showtime
+
+logger = logging.getLogger(__name__)
+
+SHOWTIME_STORE_TTL = float(os.getenv("SHOWTIME_STORE_TTL", "600"))
+SHOWTIME_STORE_MAX_SIZE = int(os.getenv("SHOWTIME_STORE_MAX_SIZE", "20000"))
+
+
+class ShowtimeStore:
+    """
+    Thông tin suất chiếu theo showtime_id (rạp, phòng, giờ chiếu, phim).
+
+    Được nạp từ mọi response lịch chiếu mà action đã nhận (ingest), có TTL.
+    Khi thiếu key (hoặc record thiếu field cần dùng) thì chỉ fetch đúng một
+    suất chiếu qua fetcher, không bao giờ tải cả bảng /showtimes/all.
+    """
+
+    def __init__(self, fetcher: Callable[[str], Awaitable[Optional[Dict[str, Any]]]],
+                 ttl: float = SHOWTIME_STORE_TTL,
+                 max_size: int = SHOWTIME_STORE_MAX_SIZE):
+        self.fetcher = fetcher
+        self.ttl = ttl
+        self.max_size = max_size
+        self._records: Dict[str, Tuple[float, Showtime]] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.fetch_errors = 0
+
+    def put(self, showtime: Dict[str, Any], **defaults) -> None:
+        """Nạp một suất chiếu từ payload bất kỳ; defaults cho field payload không có"""
+        record = Showtime.from_payload(showtime, **defaults)
+        if record is not None:
+            self.put_record(record)
+
+    def put_record(self, record: Showtime) -> None:
+        # Gộp với record cũ còn hạn: giữ các field mà response mới không có
+        existing = self._peek(record.id)
+        if existing:
+            record.fill_missing(existing)
+
+        self._records.pop(record.id, None)
+        self._records[record.id] = (time.monotonic(), record)
+
+        if len(self._records) > self.max_size:
+            # dict giữ thứ tự chèn -> key đầu tiên là record cũ nhất
+            self._records.pop(next(iter(self._records)))
+
+    def ingest(self, showtimes: Iterable[Dict[str, Any]], **defaults) -> None:
+        for showtime in showtimes:
+            self.put(showtime, **defaults)
+
+    def invalidate(self, showtime_id: Any) -> None:
+        self._records.pop(str(showtime_id), None)
+
+    async def get(self, showtime_id: Any,
+                  required: Sequence[str] = ('cinema_id', 'start_time')) -> Optional[Showtime]:
+        key = str(showtime_id)
+        record = self._peek(key)
+
+        if record and all(getattr(record, field) for field in required):
+            self.hits += 1
+            return record
+
+        self.misses += 1
+        try:
+            showtime = await self.fetcher(key)
+        except Exception as e:
+            showtime = None
+            logger.warning(f"Could not fetch showtime {key}: {e}")
+
+        if not showtime:
+            self.fetch_errors += 1
+            return record
+
+        self.put(showtime)
+        return self._peek(key)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "fetch_errors": self.fetch_errors,
+            "size": len(self._records),
+        }
+
+    def _peek(self, key: str) -> Optional[Showtime]:
+        entry = self._records.get(key)
+        if entry is None:
+            return None
+
+        stored_at, record = entry
+        if time.monotonic() - stored_at >= self.ttl:
+            del self._records[key]
+            return None
+        return record
@@ -0,0 +1,109 @@
+"""
+Cache dữ liệu backend theo suất chiếu / rạp dùng chung giữa các action:
+thông tin suất chiếu, bảng giá, snapshot ghế, booking đang gửi và message
+đã render.
+"""
+import logging
+from typing import Any, Dict, Optional, Text
+
+from . import http_client, metrics
+from .booking_submissions import PendingSubmissions
+from .payload_log import log_payload
+from .price_cache import PriceCache
+from .records import PriceRule, build_records
+from .rendering import SEAT_RENDER_CACHE_SIZE, FragmentCache
+from .seat_snapshot import SeatSnapshotCache
+from .showtime_store import ShowtimeStore
+
+logger = logging.getLogger(__name__)
+
+
+async def fetch_showtime_detail(showtime_id) -> Optional[Dict[Text, Any]]:
+    """Thông tin một suất chiếu từ /showtimes/detail/:id, None nếu lỗi"""
+    response = await http_client.get(f"/showtimes/detail/{showtime_id}", timeout=5)
+    
+    if response.status_code != 200:
+        logger.warning(f"Could not load showtime {showtime_id}: HTTP {response.status_code}")
+        return None
+    
+    data = response.json()
+    if isinstance(data, dict):
+        return data.get('showtime') or data.get('data')
+    return None
+
+
+async def load_ticket_prices(cinema_id, showtime_date) -> Optional[Dict[Text, float]]:
+    """Map seat_type → giá vé từ /ticket-prices/getprice, None nếu lỗi"""
+    price_response = await http_client.get(
+        f"/ticket-prices/getprice/{cinema_id}/{showtime_date}",
+        timeout=5
+    )
+    
+    logger.info(f"Ticket prices API status: {price_response.status_code}")
+    
+    if price_response.status_code != 200:
+        logger.warning(f"Could not get ticket prices: HTTP {price_response.status_code}")
+        return None
+    
+    price_data = price_response.json()
+    log_payload(logger, "Price data", price_data)
+    
+    # Parse response (có thể là list hoặc dict)
+    prices = []
+    if isinstance(price_data, dict):
+        prices = price_data.get('prices', []) or price_data.get('data', [])
+    elif isinstance(price_data, list):
+        prices = price_data
+    
+    # Map seat_type → price
+    ticket_prices_map = {rule.seat_type: rule.price for rule in build_records(PriceRule, prices)}
+    
+    log_payload(logger, "Ticket prices map", ticket_prices_map)
+    return ticket_prices_map
+
+
+# Thông tin suất chiếu theo ID, nạp từ các response lịch chiếu
+showtime_store = ShowtimeStore(fetch_showtime_detail)
+
+# Bảng giá vé theo (cinema_id, date)
+price_cache = PriceCache(load_ticket_prices)
+
+
+def cinema_showtimes_of(payload):
+    """Danh sách suất chiếu trong response /showtimes/datve (list hoặc dict data/showtimes)"""
+    if isinstance(payload, dict):
+        return payload.get('data', []) or payload.get('showtimes', [])
+    return payload
+
+
+async def fetch_seat_status(showtime_id):
+    """Trạng thái ghế của suất chiếu (để validate showtime tồn tại)"""
+    return await http_client.get(
+        f"/showtimes/seats-status/{showtime_id}",
+        timeout=5
+    )
+
+
+# Snapshot ghế ngắn hạn dùng chung giữa xem ghế và đặt vé
+seat_snapshots = SeatSnapshotCache(fetch_seat_status)
+
+# Các lần gửi booking theo idempotency key (chống tạo đơn trùng khi retry)
+booking_submissions = PendingSubmissions()
+
+# Message lịch chiếu đã render, dùng chung giữa các user
+rendered_messages = FragmentCache()
+
+# Message tình trạng ghế đã render, theo nội dung snapshot ghế
+seat_messages = FragmentCache(max_size=SEAT_RENDER_CACHE_SIZE)
+
+# Hit ratio / kích thước các cache, đọc khi xuất metrics
+for _name, _collector in (
+    ("showtime_store", showtime_store.stats),
+    ("price_cache", price_cache.stats),
+    ("seat_snapshots", seat_snapshots.stats),
+    ("rendered_messages", rendered_messages.stats),
+    ("seat_messages", seat_messages.stats),
+    ("booking_submissions", booking_submissions.stats),
+    ("http_client", http_client.stats),
+):
+    metrics.register_collector(_name, _collector)
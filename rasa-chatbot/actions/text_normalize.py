@@ -0,0 +1,62 @@
+import os
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Any
+
+# Số chuỗi đã chuẩn hóa được nhớ lại (tên phim/rạp và câu user lặp lại rất nhiều)
+NORMALIZE_CACHE_SIZE = int(os.getenv("NORMALIZE_CACHE_SIZE", "8192"))
+
+_NON_WORD = re.compile(r'[^0-9a-z]+')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def to_nfc(text: Any) -> str:
+    """Gộp ký tự tổ hợp (bàn phím/IME gõ dấu rời) về dạng dựng sẵn"""
+    return unicodedata.normalize('NFC', str(text or ''))
+
+
+def strip_diacritics(text: Any) -> str:
+    """Bỏ dấu tiếng Việt, giữ nguyên hoa/thường: "Gò Vấp" -> "Go Vap" """
+    text = unicodedata.normalize('NFD', str(text or ''))
+    text = ''.join(ch for ch in text if unicodedata.category(ch) != 'Mn')
+    return text.replace('đ', 'd').replace('Đ', 'D')
+
+
+def collapse_whitespace(text: Any) -> str:
+    return _WHITESPACE.sub(' ', str(text or '')).strip()
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _fold(text: str) -> str:
+    return _NON_WORD.sub(' ', strip_diacritics(text.lower())).strip()
+
+
+def fold_text(text: Any) -> str:
+    """
+    Chuẩn hóa text để so khớp: lowercase, bỏ dấu tiếng Việt, bỏ ký tự đặc biệt.
+    Ví dụ: "Lotte Gò Vấp" -> "lotte go vap", "Spider-Man" -> "spider man"
+    """
+    return _fold(text if isinstance(text, str) else str(text or ''))
+
+
+@lru_cache(maxsize=None)
+def fold_char(ch: str) -> str:
+    """Bỏ dấu một ký tự nhưng giữ nguyên độ dài, để span trên text gốc không bị lệch"""
+    base = unicodedata.normalize('NFD', ch.lower())[0]
+    if base == 'đ':
+        return 'd'
+    return base if base.isascii() and base.isalnum() else ' '
+
+
+def fold_preserving_length(text: str) -> str:
+    """Như fold_text nhưng không gộp khoảng trắng: ký tự thứ i ứng với ký tự thứ i của text"""
+    return ''.join(map(fold_char, text))
+
+
+def cache_info():
+    return _fold.cache_info()
+
+
+def clear_cache() -> None:
+    _fold.cache_clear()
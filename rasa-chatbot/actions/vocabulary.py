@@ -0,0 +1,141 @@
+import logging
+import re
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .text_normalize import fold_text
+
+logger = logging.getLogger(__name__)
+
+_SUBTITLE_SEPARATOR = re.compile(r'\s*(?::|\s-\s|\()')
+_CINEMA_PREFIX = re.compile(r'^(?:cum\s+rap|rap)\s+')
+
+
+def movie_variants(title: str) -> List[str]:
+    """
+    Cách user hay gọi một phim, sinh từ tên trong catalog:
+    "The Bad Guys 2: ..." -> "the bad guys 2", "bad guys 2"
+    """
+    short_title = _SUBTITLE_SEPARATOR.split(title, maxsplit=1)[0]
+    variants = []
+    for name in (fold_text(title), fold_text(short_title)):
+        if name:
+            variants.append(name)
+            if name.startswith('the ') and len(name) > 4:
+                variants.append(name[4:])
+    return variants
+
+
+def cinema_variants(cinema_name: str) -> List[str]:
+    """
+    Cách user hay gọi một rạp: "Lotte Gò Vấp" -> "lotte go vap", "go vap".
+    Chỉ bỏ tên chuỗi rạp khi phần còn lại đủ dài (>= 2 từ) để không mơ hồ.
+    """
+    name = _CINEMA_PREFIX.sub('', fold_text(cinema_name))
+    if not name:
+        return []
+
+    variants = [name]
+    location = name.split()[1:]
+    if len(location) >= 2:
+        variants.append(' '.join(location))
+    return variants
+
+
+class Vocabulary:
+    """
+    Bộ từ vựng (chỉ đọc) để extract và normalize tên phim/rạp.
+
+    - terms:    (term, tên chuẩn hoặc None) để dựng EntityExtractor
+    - mappings: biến thể đã chuẩn hóa -> tên chuẩn (alias của CatalogIndex,
+                nên resolve() normalize tên user nói về tên trong catalog)
+    - version:  tăng mỗi khi nội dung thay đổi
+    """
+
+    __slots__ = ('terms', 'mappings', 'version')
+
+    def __init__(self, terms: Tuple[Tuple[str, Optional[str]], ...],
+                 mappings: Mapping[str, str], version: int):
+        self.terms = terms
+        self.mappings = mappings
+        self.version = version
+
+
+class VocabularyBuilder:
+    """
+    Sinh Vocabulary từ catalog, cập nhật tăng dần.
+
+    Biến thể của từng item được giữ lại theo ID; khi catalog load lại chỉ
+    item mới hoặc có updated_at/tên thay đổi mới phải sinh lại. Nếu không
+    có gì thay đổi thì trả lại đúng Vocabulary cũ, nên các cấu trúc dựng từ
+    nó (regex extractor, ...) không phải build lại.
+
+    Biến thể sinh ra trỏ tới nhiều item khác nhau thì bị bỏ vì mơ hồ;
+    keyword/mapping viết tay luôn được ưu tiên.
+    """
+
+    def __init__(self, id_getter: Callable[[Any], Any],
+                 name_getter: Callable[[Any], Any],
+                 variants: Callable[[str], Iterable[str]],
+                 keywords: Iterable[str] = (),
+                 mappings: Optional[Dict[str, str]] = None, *,
+                 updated_getter: Callable[[Any], Any]):
+        self.id_of = id_getter
+        self.name_of = name_getter
+        self.updated_of = updated_getter
+        self.variants = variants
+        self.keywords = tuple(keywords)
+        self.static_mappings = {fold_text(k): v for k, v in (mappings or {}).items()}
+
+        # item_id -> (signature, tên, các biến thể)
+        self._entries: Dict[str, Tuple[Tuple[Any, str], str, Tuple[str, ...]]] = {}
+        self.vocabulary: Optional[Vocabulary] = None
+        self.vocabulary = self._compile()
+
+    def update(self, items: List[Any]) -> Vocabulary:
+        entries = {}
+        changed = 0
+
+        for item in items:
+            item_id = self.id_of(item)
+            name = str(self.name_of(item) or '').strip()
+            if item_id is None or not name:
+                continue
+
+            key = str(item_id)
+            signature = (self.updated_of(item), name)
+            previous = self._entries.get(key)
+            if previous and previous[0] == signature:
+                entries[key] = previous
+            else:
+                entries[key] = (signature, name, tuple(dict.fromkeys(self.variants(name))))
+                changed += 1
+
+        removed = len(self._entries.keys() - entries.keys())
+        self._entries = entries
+
+        if changed or removed:
+            logger.info(f"Vocabulary rebuilt: {changed} changed, {removed} removed, {len(entries)} items")
+            self.vocabulary = self._compile()
+        return self.vocabulary
+
+    def _compile(self) -> Vocabulary:
+        owners: Dict[str, set] = {}
+        for _, name, variants in self._entries.values():
+            for variant in variants:
+                owners.setdefault(variant, set()).add(name)
+
+        mappings = {
+            variant: next(iter(names))
+            for variant, names in owners.items()
+            if len(names) == 1
+        }
+        mappings.update(self.static_mappings)
+
+        terms = tuple(
+            [(variant, name) for variant, name in mappings.items()] +
+            [(keyword, None) for keyword in self.keywords]
+        )
+
+        version = self.vocabulary.version + 1 if self.vocabulary else 0
+        return Vocabulary(terms, MappingProxyType(mappings), version)
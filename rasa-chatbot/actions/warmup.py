@@ -0,0 +1,118 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence
+
+from .latency_budget import latency_budget
+
+logger = logging.getLogger(__name__)
+
+# Nạp sẵn cache khi action server khởi động (0 = tắt, cache nạp lúc có request đầu tiên)
+WARMUP_ON_STARTUP = os.getenv("WARMUP_ON_STARTUP", "1") == "1"
+# Tổng thời gian tối đa cho warm-up (server chờ tối đa chừng này trước khi nhận
+# request); hết giờ thì phần còn lại nạp lazy như cũ
+WARMUP_TIMEOUT = float(os.getenv("WARMUP_TIMEOUT", "10"))
+# File chỉ được tạo khi warm-up nạp đủ mọi bước (dùng cho readiness probe), để trống = không tạo
+WARMUP_READY_FILE = os.getenv("WARMUP_READY_FILE", "")
+# Số rạp tối đa được nạp sẵn lịch chiếu / bảng giá hôm nay
+WARMUP_MAX_CINEMAS = int(os.getenv("WARMUP_MAX_CINEMAS", "50"))
+
+Step = Callable[[], Awaitable[Any]]
+
+
+class Warmup:
+    """
+    Nạp sẵn dữ liệu theo từng giai đoạn (stage).
+
+    Các bước trong cùng một stage chạy song song; stage sau chỉ chạy khi
+    mọi bước của stage trước thành công (vd: không lấy được danh sách rạp
+    thì không nạp lịch chiếu theo rạp). Backend lỗi hay hết WARMUP_TIMEOUT
+    thì dừng, phần chưa nạp sẽ được nạp lazy khi có request.
+
+    Trạng thái cuối (status): "complete" khi mọi bước thành công, "partial"
+    khi có bước lỗi, "timeout" khi hết giờ. Chỉ "complete" mới đánh dấu
+    ready và tạo ready file; hai trạng thái còn lại được log và hiện trong
+    stats() để readiness probe / dashboard phân biệt cache nóng với warm-up
+    thất bại (server vẫn phục vụ được, cache nạp lazy).
+    """
+
+    def __init__(self, timeout: float = WARMUP_TIMEOUT, ready_file: str = WARMUP_READY_FILE):
+        self.timeout = timeout
+        self.ready_file = ready_file
+        self.status = "pending"
+        # threading.Event: không gắn với event loop nào; chỉ set khi "complete"
+        self.ready = threading.Event()
+        self.report: Dict[str, Dict[str, Any]] = {}
+        self.elapsed = 0.0
+        # Giữ tham chiếu tới task để không bị garbage collect khi đang chạy
+        self.task: Optional[asyncio.Task] = None
+
+    async def run(self, stages: Sequence[Dict[str, Step]]) -> Dict[str, Dict[str, Any]]:
+        started = time.perf_counter()
+        self.status = "running"
+        try:
+            # latency_budget cắt ngắn timeout của các request HTTP bên trong,
+            # wait_for chặn cứng trường hợp còn lại
+            with latency_budget(self.timeout):
+                self.status = await asyncio.wait_for(self._run_stages(stages), self.timeout)
+        except asyncio.TimeoutError:
+            self.status = "timeout"
+        finally:
+            self.elapsed = time.perf_counter() - started
+            self._finish()
+        return self.report
+
+    async def _run_stages(self, stages: Sequence[Dict[str, Step]]) -> str:
+        for stage in stages:
+            results = await asyncio.gather(*(self._run_step(name, step) for name, step in stage.items()))
+            if not all(results):
+                return "partial"
+        return "complete"
+
+    def start(self, stages: Sequence[Dict[str, Step]]) -> asyncio.Task:
+        """Tạo task warm-up trên event loop đang chạy (gọi lại thì dùng task cũ)"""
+        if self.task is None:
+            self.task = asyncio.get_running_loop().create_task(self.run(stages))
+        return self.task
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "ready": int(self.status == "complete"),
+            "partial": int(self.status == "partial"),
+            "timeout": int(self.status == "timeout"),
+            "seconds": round(self.elapsed, 3),
+        }
+
+    def summary(self) -> str:
+        steps = ", ".join(
+            f"{name}={entry['seconds'] * 1000:.0f}ms" + ("" if entry["ok"] else f" ({entry['error']})")
+            for name, entry in self.report.items()
+        )
+        return f"Warm-up {self.status} in {self.elapsed * 1000:.0f}ms: {steps or 'no steps'}"
+
+    async def _run_step(self, name: str, step: Step) -> bool:
+        started = time.perf_counter()
+        try:
+            await step()
+            ok, error = True, None
+        except Exception as e:
+            ok, error = False, str(e) or type(e).__name__
+        self.report[name] = {"ok": ok, "seconds": time.perf_counter() - started, "error": error}
+        return ok
+
+    def _finish(self) -> None:
+        if self.status != "complete":
+            logger.warning(self.summary() + " - falling back to lazy loading")
+            return
+
+        logger.info(self.summary())
+        if self.ready_file:
+            try:
+                with open(self.ready_file, "w", encoding="utf-8") as f:
+                    f.write(self.summary() + "\n")
+            except OSError as e:
+                logger.warning(f"Could not write ready file {self.ready_file}: {str(e)}")
+        self.ready.set()
+
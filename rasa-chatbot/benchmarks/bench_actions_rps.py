@@ -0,0 +1,106 @@
+"""
+Đo throughput (requests/giây) của action server trên backend giả lập.
+
+Chạy từ thư mục rasa-chatbot:
+    python -m benchmarks.bench_actions_rps [--requests 200] [--concurrency 50] [--latency-ms 100]
+
+Action có run() thường (sync) được gọi thẳng trên event loop, giống cách
+rasa_sdk xử lý, nên chạy cùng script trên một revision cũ cho ra số liệu
+"trước" để so sánh với "sau".
+"""
+import argparse
+import asyncio
+import inspect
+import time
+
+from rasa_sdk import Tracker
+from rasa_sdk.executor import CollectingDispatcher
+
+from actions import actions as actions_module
+from benchmarks.fake_backend import FakeBackend
+
+
+def make_tracker(slots, text=''):
+    return Tracker.from_dict({
+        'sender_id': 'bench',
+        'slots': slots,
+        'latest_message': {'text': text, 'intent': {}, 'entities': []},
+        'events': [],
+        'paused': False,
+        'followup_action': None,
+        'active_loop': {},
+        'latest_action_name': None,
+    })
+
+
+async def call_action(action, tracker):
+    """Chạy action, trả (tin nhắn gửi user, events trả về)"""
+    dispatcher = CollectingDispatcher()
+    if inspect.iscoroutinefunction(action.run):
+        events = await action.run(dispatcher, tracker, {})
+    else:
+        events = action.run(dispatcher, tracker, {})
+    return dispatcher.messages, events or []
+
+
+async def drive(scenarios, total, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(i):
+        action, tracker = scenarios[i % len(scenarios)]
+        async with semaphore:
+            started = time.perf_counter()
+            await call_action(action, tracker)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    return time.perf_counter() - started, sorted(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--latency-ms', type=float, default=100.0)
+    args = parser.parse_args()
+
+    backend = FakeBackend(latency_ms=args.latency_ms)
+    url = backend.start()
+
+    # Revision cũ đọc API_BASE_URL trong actions.actions, revision mới trong http_client
+    actions_module.API_BASE_URL = url
+    http_client = getattr(actions_module, 'http_client', None)
+    if http_client is not None:
+        http_client.API_BASE_URL = url
+
+    scenarios = [
+        (actions_module.ActionGetShowtimes(), make_tracker({'movie_name': f"Phim Thử Nghiệm {n}"}))
+        for n in range(1, 11)
+    ] + [
+        (actions_module.ActionGetAvailableSeats(), make_tracker({'showtime_id': str(n)}))
+        for n in range(1, 11)
+    ]
+
+    async def run():
+        # Một lượt làm nóng để cache catalog (nếu có) không tính vào kết quả
+        await drive(scenarios, len(scenarios), args.concurrency)
+        result = await drive(scenarios, args.requests, args.concurrency)
+        if http_client is not None:
+            await http_client.close_session()
+        return result
+
+    elapsed, latencies = asyncio.run(run())
+    backend.stop()
+
+    p50 = latencies[len(latencies) // 2] * 1000
+    p95 = latencies[int(len(latencies) * 0.95) - 1] * 1000
+    print(f"requests={args.requests} concurrency={args.concurrency} backend_latency={args.latency_ms}ms")
+    print(f"elapsed={elapsed:.2f}s throughput={args.requests / elapsed:.1f} req/s "
+          f"p50={p50:.1f}ms p95={p95:.1f}ms")
+    print(f"backend hits: {backend.hits}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark fuzzy matcher trên catalog 10k tên phim tổng hợp.
+
+Chạy từ thư mục rasa-chatbot:
+    python -m benchmarks.bench_fuzzy [--titles 10000] [--queries 2000]
+
+Thoát với mã 1 nếu p99 latency mỗi query vượt quá --budget-ms (mặc định 1ms).
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+
+from actions.catalog_index import CatalogIndex, fold_text
+
+ONSETS = ['', 'b', 'c', 'ch', 'd', 'đ', 'g', 'gi', 'h', 'k', 'kh', 'l', 'm', 'n',
+          'ng', 'nh', 'ph', 'qu', 'r', 's', 't', 'th', 'tr', 'v', 'x']
+RHYMES = ['a', 'ai', 'am', 'an', 'ang', 'anh', 'ao', 'ăn', 'âm', 'ên', 'ết', 'i',
+          'iên', 'im', 'inh', 'o', 'oa', 'oan', 'ôi', 'ông', 'ơi', 'u', 'ung', 'ương',
+          'ưa', 'ước', 'ây', 'ê', 'ia', 'ình', 'ọc', 'úp', 'ắt']
+ENGLISH = ['spider', 'man', 'venom', 'avatar', 'the', 'bad', 'guys', 'kung', 'fu',
+           'panda', 'frozen', 'inception', 'dune', 'batman', 'return', 'of', 'king']
+
+
+def make_words(rng, count=600):
+    words = set(ENGLISH)
+    while len(words) < count:
+        words.add(rng.choice(ONSETS) + rng.choice(RHYMES))
+    return sorted(words)
+
+
+def make_titles(count, rng):
+    vocabulary = make_words(rng)
+    titles = set()
+    while len(titles) < count:
+        words = rng.sample(vocabulary, rng.randint(1, 4))
+        if rng.random() < 0.3:
+            words.append(str(rng.randint(2, 9)))
+        titles.add(' '.join(words).title())
+    return sorted(titles)
+
+
+def misspell(title, rng):
+    chars = list(title.lower())
+    for _ in range(rng.randint(1, 2)):
+        pos = rng.randrange(len(chars))
+        op = rng.random()
+        if op < 0.4 and len(chars) > 3:
+            del chars[pos]
+        elif op < 0.7:
+            chars.insert(pos, rng.choice('aeioumn'))
+        else:
+            chars[pos] = rng.choice('aeioumn')
+    return ''.join(chars)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--titles', type=int, default=10000)
+    parser.add_argument('--queries', type=int, default=2000)
+    parser.add_argument('--budget-ms', type=float, default=1.0)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    movies = [{'id': i, 'title': t} for i, t in enumerate(make_titles(args.titles, rng), 1)]
+
+    started = time.perf_counter()
+    index = CatalogIndex(movies, lambda m: m['id'], lambda m: m['title'])
+    build_ms = (time.perf_counter() - started) * 1000
+
+    queries = [misspell(rng.choice(movies)['title'], rng) for _ in range(args.queries)]
+
+    latencies = []
+    found = 0
+    for query in queries:
+        started = time.perf_counter()
+        results = index.fuzzy.search(fold_text(query), limit=5, min_score=0.34)
+        latencies.append((time.perf_counter() - started) * 1000)
+        found += bool(results)
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2]
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+
+    print(f"titles={len(movies)} queries={len(queries)} build={build_ms:.1f}ms")
+    print(f"mean={statistics.mean(latencies):.3f}ms p50={p50:.3f}ms "
+          f"p99={p99:.3f}ms max={latencies[-1]:.3f}ms")
+    print(f"queries with candidates: {found}/{len(queries)}")
+
+    if p99 > args.budget_ms:
+        print(f"FAIL: p99 {p99:.3f}ms > budget {args.budget_ms}ms")
+        sys.exit(1)
+    print(f"OK: p99 within {args.budget_ms}ms budget")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""
+Đo thời gian cold start của action server: import từng module action và
+đăng ký cả package như `rasa run actions` (ActionExecutor.register_package),
+mỗi lần trong một interpreter mới. Pod action server mới chỉ nhận request
+sau bước này, nên nó quyết định autoscale phản ứng nhanh hay chậm.
+
+Warm-up cache chạy trong before_server_start, sau bước import, nên không
+nằm trong số đo này. Mỗi dòng in median / max thời gian, số action đã đăng ký và các thư
+viện nặng đã bị nạp theo. --profile in các module tốn thời gian nhất (python -X importtime).
+
+Chạy từ thư mục rasa-chatbot:
+    python -m benchmarks.bench_import [--runs 10] [--profile server]
+
+Target không có ở revision cũ (module action_* riêng) được bỏ qua, nên chạy
+cùng script trên revision cũ cho ra số liệu "trước" để so sánh.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Thư viện nặng mà action server không cần lúc import
+HEAVY_MODULES = ('aiohttp', 'requests')
+
+# Tên target -> code chạy trong interpreter mới, gán `registered` = số action
+TARGETS = {
+    'server': (
+        "from rasa_sdk.executor import ActionExecutor\n"
+        "executor = ActionExecutor()\n"
+        "executor.register_package('actions')\n"
+        "registered = len([n for n in executor.actions if n.startswith('action_')])\n"
+    ),
+    'actions.actions': "import actions.actions\nregistered = None\n",
+    'action_get_showtimes': "import actions.action_get_showtimes\nregistered = None\n",
+    'action_get_available_seats': "import actions.action_get_available_seats\nregistered = None\n",
+    'action_create_booking': "import actions.action_create_booking\nregistered = None\n",
+    'action_redirect_to_payment': "import actions.action_redirect_to_payment\nregistered = None\n",
+    'action_get_cinema_info': "import actions.action_get_cinema_info\nregistered = None\n",
+    'action_get_movie_info': "import actions.action_get_movie_info\nregistered = None\n",
+}
+
+# rasa_sdk được nạp trước khi bấm giờ: server nào cũng phải trả phần này
+MEASURE = """
+import json, sys, time
+import rasa_sdk, rasa_sdk.executor
+started = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - started
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{"seconds": elapsed, "registered": registered, "heavy": heavy}}))
+"""
+
+
+def run_python(args, env):
+    return subprocess.run(
+        [sys.executable, *args], env=env, capture_output=True, text=True, check=False
+    )
+
+
+def measure(code, env):
+    result = run_python(['-c', MEASURE.format(code=code, heavy=HEAVY_MODULES)], env)
+    if result.returncode != 0:
+        return None, result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'failed'
+    return json.loads(result.stdout.strip().splitlines()[-1]), None
+
+
+def profile(code, env, top):
+    """Các module có thời gian import (cumulative) lớn nhất, theo -X importtime"""
+    result = run_python(['-X', 'importtime', '-c', code], env)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        # "import time:       226 |        1043 |   actions.catalog"
+        self_part, cumulative_us, name = line.split('|')
+        self_us = self_part.split(':', 1)[1]
+        rows.append((int(cumulative_us), int(self_us), name.strip()))
+    rows.sort(reverse=True)
+    print(f"\n{'cumulative ms':>14}{'self ms':>10}  module")
+    for cumulative_us, self_us, name in rows[:top]:
+        print(f"{cumulative_us / 1000:>14.1f}{self_us / 1000:>10.1f}  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--only', nargs='+', choices=sorted(TARGETS))
+    parser.add_argument('--profile', choices=sorted(TARGETS),
+                        help="in các module import chậm nhất của target này")
+    parser.add_argument('--top', type=int, default=15)
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [os.getcwd(), env.get('PYTHONPATH')]))
+
+    print(f"{'target':<28}{'median ms':>11}{'max ms':>9}{'actions':>9}  heavy modules loaded")
+    for name in args.only or TARGETS:
+        samples, error = [], None
+        for _ in range(args.runs):
+            sample, error = measure(TARGETS[name], env)
+            if sample is None:
+                break
+            samples.append(sample)
+
+        if not samples:
+            print(f"{name:<28}  skipped: {error}")
+            continue
+
+        seconds = [s['seconds'] for s in samples]
+        registered = samples[-1]['registered']
+        print(f"{name:<28}{statistics.median(seconds) * 1000:>11.1f}{max(seconds) * 1000:>9.1f}"
+              f"{'-' if registered is None else registered:>9}  {', '.join(samples[-1]['heavy']) or '-'}")
+
+    if args.profile:
+        profile(TARGETS[args.profile], env, args.top)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+So sánh bộ nhớ đỉnh khi đọc danh sách phim lớn: json.loads cả document
+và ItemStream (parse theo đoạn 64KB, chỉ giữ field cần dùng).
+
+Mỗi phim có mô tả dài, cast, poster..., giống payload /movies thật. Bộ nhớ
+tạm để parse (đỉnh trừ phần item giữ lại) đo bằng tracemalloc; body được
+sinh từng đoạn như khi đọc từ socket.
+
+Chạy từ thư mục rasa-chatbot:
+    python -m benchmarks.bench_json_stream [--sizes 1000 5000 20000]
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+from actions.json_stream import MOVIE_FIELDS, ItemStream, project
+
+CHUNK_SIZE = 64 * 1024
+
+
+def make_movie(i):
+    return {
+        'id': i,
+        'title': f"Phim Thử Nghiệm {i}",
+        'runtime': 120,
+        'genres': ['Hành động', 'Phiêu lưu'],
+        'vote_average': 7.5,
+        'release_date': '2025-10-01T00:00:00.000Z',
+        'description': "Một bộ phim rất dài dòng. " * 40,
+        'poster_url': f"https://cdn.example.com/posters/{i}.jpg",
+        'trailer_url': f"https://cdn.example.com/trailers/{i}.mp4",
+        'cast': [{'name': f"Diễn viên {n}", 'role': f"Vai {n}"} for n in range(10)],
+        'updated_at': '2025-10-01T00:00:00.000Z',
+    }
+
+
+def body_chunks(count):
+    """Body {"success": true, "movies": [...]} sinh dần từng đoạn ~CHUNK_SIZE"""
+    pending = ['{"success": true, "movies": [']
+    size = len(pending[0])
+    for i in range(count):
+        part = (',' if i else '') + json.dumps(make_movie(i), ensure_ascii=False)
+        pending.append(part)
+        size += len(part)
+        if size >= CHUNK_SIZE:
+            yield ''.join(pending)
+            pending, size = [], 0
+    pending.append(']}')
+    yield ''.join(pending)
+
+
+def measure(func):
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # peak - retained: bộ nhớ tạm để parse, ngoài danh sách item giữ lại
+    return result, peak - retained, elapsed
+
+
+def full_parse(count):
+    # Cách cũ: đọc hết body rồi json.loads cả document
+    data = json.loads(''.join(body_chunks(count)))
+    return [project(m, MOVIE_FIELDS) for m in data['movies']]
+
+
+def stream_parse(count):
+    stream = ItemStream(('data', 'movies'), MOVIE_FIELDS)
+    items = []
+    for chunk in body_chunks(count):
+        items.extend(stream.feed(chunk))
+    items.extend(stream.feed('', final=True))
+    return items
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 5000, 20000])
+    args = parser.parse_args()
+
+    print(f"{'movies':>8}{'full parse MB':>15}{'stream parse MB':>17}{'full s':>9}{'stream s':>10}")
+    for count in args.sizes:
+        full_items, full_overhead, full_time = measure(lambda: full_parse(count))
+        stream_items, stream_overhead, stream_time = measure(lambda: stream_parse(count))
+        assert full_items == stream_items
+
+        print(f"{count:>8}{full_overhead / 1e6:>15.1f}{stream_overhead / 1e6:>17.1f}"
+              f"{full_time:>9.2f}{stream_time:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,196 @@
+"""
+Load test toàn bộ action trên backend giả lập, để ước lượng sức chịu tải
+của action server trước các đợt phim bom tấn.
+
+Mỗi request chọn lần lượt một kịch bản trong danh sách (lịch chiếu theo
+phim / theo rạp, xem ghế + gợi ý, đặt vé, thanh toán, thông tin rạp/phim),
+tối đa --concurrency request chạy cùng lúc. Kết quả theo từng action:
+số request, số lần thất bại, p50/p95/p99 latency và throughput, kèm các
+lý do thất bại thường gặp nhất.
+
+Action tự bắt exception và trả tin nhắn lỗi cho user, nên một lần chạy
+được tính là thất bại khi: có exception, không trả lời gì, trả lời bằng
+tin nhắn lỗi (mở đầu bằng ERROR_MARKERS), hoặc thiếu slot phải có khi thành công
+(SUCCESS_SLOTS, vd đặt vé phải có order_id).
+
+Chạy từ thư mục rasa-chatbot:
+    python -m benchmarks.bench_load [--requests 2000] [--concurrency 100]
+        [--latency-ms 50] [--jitter-ms 20] [--movies 200] [--cinemas 20]
+        [--only action_create_booking]
+
+Backend giả không đánh dấu ghế đã đặt, nên các lần đặt vé lặp lại cùng ghế
+vẫn thành công (mỗi lần một user_id khác để không bị gộp theo idempotency key).
+"""
+import argparse
+import asyncio
+import time
+from collections import Counter
+from datetime import datetime
+
+from actions import actions as actions_module
+from actions import http_client
+from benchmarks.bench_actions_rps import call_action, make_tracker
+from benchmarks.fake_backend import FakeBackend
+
+
+# Mở đầu tin nhắn báo lỗi của các action (timeout, lỗi backend, không tìm thấy dữ liệu)
+ERROR_MARKERS = ('❌', '⏱️', 'Xin lỗi, có lỗi', 'Có lỗi xảy ra', 'Không thể lấy', 'Không có dữ liệu')
+
+# Action -> slot phải được set khi chạy thành công
+SUCCESS_SLOTS = {
+    'action_create_booking': 'order_id',
+}
+
+
+def failure_reason(name, messages, events):
+    """Lý do lần chạy thất bại (dòng đầu tin nhắn lỗi), None nếu thành công"""
+    texts = [message.get('text') or '' for message in messages]
+    if not texts:
+        return 'no response'
+    for text in texts:
+        if text.startswith(ERROR_MARKERS):
+            return text.splitlines()[0][:60]
+
+    slot = SUCCESS_SLOTS.get(name)
+    if slot and not any(
+        event.get('event') == 'slot' and event.get('name') == slot and event.get('value')
+        for event in events
+    ):
+        return f"missing slot {slot}"
+    return None
+
+
+def make_scenarios(backend, num_targets):
+    """Danh sách (action, hàm i -> tracker), xếp xen kẽ các action"""
+    today = datetime.now().strftime('%Y-%m-%d')
+    movies = backend.movies[:num_targets]
+    cinemas = backend.cinemas[:num_targets]
+    showtimes = [st for st in backend.showtimes if st['start_time'].startswith(today)][:num_targets]
+
+    bookings = []
+    for st in showtimes:
+        available, _ = backend.make_room(st['id'])
+        bookings.append((st['id'], ' '.join(seat['seat_number'] for seat in available[:2])))
+
+    def fixed(slots):
+        tracker = make_tracker(slots)
+        return lambda i: tracker
+
+    def booking(showtime_id, seats):
+        return lambda i: make_tracker({
+            'showtime_id': str(showtime_id),
+            'seat_numbers': seats,
+            'user_id': f"load-{i}",
+        })
+
+    per_action = [
+        [(actions_module.ActionGetShowtimes(), fixed({'movie_name': m['title'], 'date': today}))
+         for m in movies],
+        [(actions_module.ActionGetShowtimes(), fixed({'cinema_name': c['name'], 'date': today}))
+         for c in cinemas],
+        [(actions_module.ActionGetAvailableSeats(), fixed({'showtime_id': str(st['id']), 'num_tickets': 2}))
+         for st in showtimes],
+        [(actions_module.ActionCreateBooking(), booking(showtime_id, seats))
+         for showtime_id, seats in bookings],
+        [(actions_module.ActionRedirectToPayment(), fixed({'order_id': n, 'grand_total': 150000.0}))
+         for n in range(1, num_targets + 1)],
+        [(actions_module.ActionGetCinemaInfo(), fixed({'cinema_name': c['name']}))
+         for c in cinemas],
+        [(actions_module.ActionGetMovieInfo(), fixed({'movie_name': m['title']}))
+         for m in movies],
+    ]
+
+    scenarios = []
+    for n in range(max(len(group) for group in per_action)):
+        scenarios.extend(group[n % len(group)] for group in per_action if group)
+    return scenarios
+
+
+async def drive(scenarios, total, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = {}
+    failures = {}   # action -> Counter(lý do)
+
+    async def one(i):
+        action, make = scenarios[i % len(scenarios)]
+        name = action.name()
+        tracker = make(i)
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                messages, events = await call_action(action, tracker)
+                reason = failure_reason(name, messages, events)
+            except Exception as e:
+                reason = type(e).__name__
+            latencies.setdefault(name, []).append(time.perf_counter() - started)
+        if reason:
+            failures.setdefault(name, Counter())[reason] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    return time.perf_counter() - started, latencies, failures
+
+
+def percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=100)
+    parser.add_argument('--latency-ms', type=float, default=50.0)
+    parser.add_argument('--jitter-ms', type=float, default=20.0)
+    parser.add_argument('--movies', type=int, default=200)
+    parser.add_argument('--cinemas', type=int, default=20)
+    parser.add_argument('--showtimes-per-movie', type=int, default=8)
+    parser.add_argument('--targets', type=int, default=20, help='số phim/rạp/suất khác nhau mỗi kịch bản')
+    parser.add_argument('--only', help='chỉ chạy một action (vd: action_create_booking)')
+    args = parser.parse_args()
+
+    backend = FakeBackend(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        num_movies=args.movies, num_cinemas=args.cinemas,
+        showtimes_per_movie=args.showtimes_per_movie,
+    )
+    http_client.API_BASE_URL = backend.start()
+
+    scenarios = make_scenarios(backend, args.targets)
+    if args.only:
+        scenarios = [s for s in scenarios if s[0].name() == args.only]
+        if not scenarios:
+            parser.error(f"unknown action: {args.only}")
+
+    async def run():
+        # Một lượt làm nóng để cache catalog / bảng giá không tính vào kết quả
+        await drive(scenarios, len(scenarios), args.concurrency)
+        result = await drive(scenarios, args.requests, args.concurrency)
+        await http_client.close_session()
+        return result
+
+    elapsed, latencies, failures = asyncio.run(run())
+    backend.stop()
+
+    print(f"requests={args.requests} concurrency={args.concurrency} "
+          f"backend_latency={args.latency_ms}ms+{args.jitter_ms}ms jitter "
+          f"catalog={args.movies} movies/{args.cinemas} cinemas/{len(backend.showtimes)} showtimes")
+    print(f"elapsed={elapsed:.2f}s total throughput={args.requests / elapsed:.1f} req/s\n")
+    print(f"{'action':<30}{'count':>7}{'failed':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>9}")
+    for name in sorted(latencies):
+        values = sorted(latencies[name])
+        failed = sum(failures.get(name, Counter()).values())
+        print(f"{name:<30}{len(values):>7}{failed:>8}"
+              f"{percentile(values, 0.50) * 1000:>9.1f}{percentile(values, 0.95) * 1000:>9.1f}"
+              f"{percentile(values, 0.99) * 1000:>9.1f}{len(values) / elapsed:>9.1f}")
+
+    if failures:
+        print("\nfailure reasons:")
+        for name in sorted(failures):
+            for reason, count in failures[name].most_common(3):
+                print(f"  {name:<28}{count:>7}  {reason}")
+    print(f"\nbackend hits: {backend.hits}")
+    print(f"http client: {http_client.stats()}")
+
+
+if __name__ == '__main__':
+    main()
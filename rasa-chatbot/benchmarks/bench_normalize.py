@@ -0,0 +1,92 @@
+"""
+Benchmark chuẩn hóa text tiếng Việt trên các câu mẫu trong data/nlu.yml.
+
+Mỗi câu được dùng ở 4 dạng user hay gõ: có dấu (NFC), dấu rời (NFD),
+không dấu và viết hoa. So sánh .lower() với fold_text khi chưa cache và
+khi đã cache (LRU), kèm tỉ lệ entity vẫn khớp được sau khi user bỏ dấu.
+
+Chạy từ thư mục rasa-chatbot:
+    python -m benchmarks.bench_normalize [--rounds 20]
+"""
+import argparse
+import os
+import re
+import time
+import unicodedata
+
+from actions import text_normalize
+from actions.text_normalize import fold_text, strip_diacritics
+
+NLU_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'nlu.yml')
+
+_ANNOTATION = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+
+
+def load_corpus(path=NLU_PATH):
+    """Trả (câu, [entity]) cho mọi example, bỏ annotation [text](entity)"""
+    corpus = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line.startswith('- ') or line.startswith('- intent:'):
+                continue
+            example = line[2:]
+            entities = _ANNOTATION.findall(example)
+            corpus.append((_ANNOTATION.sub(r'\1', example), entities))
+    return corpus
+
+
+def variants(text):
+    return [
+        unicodedata.normalize('NFC', text),
+        unicodedata.normalize('NFD', text),
+        strip_diacritics(text),
+        text.upper(),
+    ]
+
+
+def timed(func, texts, rounds):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for text in texts:
+            func(text)
+    return (time.perf_counter() - started) * 1e6 / (rounds * len(texts))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    texts = [v for text, _ in corpus for v in variants(text)]
+
+    lower_us = timed(str.lower, texts, args.rounds)
+    uncached_us = timed(text_normalize._fold.__wrapped__, texts, args.rounds)
+
+    text_normalize.clear_cache()
+    timed(fold_text, texts, 1)
+    cached_us = timed(fold_text, texts, args.rounds)
+    info = text_normalize.cache_info()
+
+    # Entity còn khớp được không khi user gõ không dấu / dấu rời / viết hoa
+    total = lower_hits = fold_hits = 0
+    for text, entities in corpus:
+        for variant in variants(text)[1:]:
+            for entity in entities:
+                total += 1
+                lower_hits += entity.lower() in variant.lower()
+                fold_hits += fold_text(entity) in fold_text(variant)
+
+    print(f"examples={len(corpus)} texts={len(texts)} rounds={args.rounds}")
+    print(f"str.lower          {lower_us:7.2f} us/text")
+    print(f"fold_text uncached {uncached_us:7.2f} us/text")
+    print(f"fold_text cached   {cached_us:7.2f} us/text  "
+          f"(hits={info.hits} misses={info.misses} size={info.currsize})")
+    if total:
+        print(f"entity matches on variant spellings: lower={lower_hits}/{total} "
+              f"fold={fold_hits}/{total}")
+
+
+if __name__ == '__main__':
+    main()
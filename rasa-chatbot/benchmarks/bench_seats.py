@@ -0,0 +1,86 @@
+"""
+Benchmark gợi ý ghế liền nhau trên phòng chiếu 500 ghế (20 hàng x 25 ghế).
+
+Mỗi lần đo gồm dựng SeatGrid từ payload /seats-status và lấy 3 block tốt
+nhất cho N người (N ngẫu nhiên 1..8, có hoặc không chỉ định loại ghế).
+
+Chạy từ thư mục rasa-chatbot:
+    python -m benchmarks.bench_seats [--rooms 200] [--rows 20] [--cols 25]
+
+Thoát với mã 1 nếu p99 latency vượt quá --budget-ms (mặc định 1ms).
+"""
+import argparse
+import random
+import statistics
+import string
+import sys
+import time
+
+from actions.seat_recommender import SeatGrid
+
+SEAT_TYPES = [None, 'standard', 'vip', 'couple']
+
+
+def make_room(rng, rows, cols):
+    """Payload giống /seats-status: 2 hàng đầu standard, 2 hàng cuối couple, còn lại vip/standard"""
+    occupancy = rng.uniform(0.2, 0.8)
+    row_labels = list(string.ascii_uppercase[:rows])
+    available, occupied = [], []
+
+    for index, row in enumerate(row_labels):
+        if index >= rows - 2:
+            seat_type = 'couple'
+        elif rows // 3 <= index < rows * 2 // 3:
+            seat_type = 'vip'
+        else:
+            seat_type = 'standard'
+
+        for col in range(1, cols + 1):
+            seat = {'seat_number': f"{row}{col}", 'seat_type_name': seat_type}
+            (occupied if rng.random() < occupancy else available).append(seat)
+
+    return {'availableSeats': available, 'occupiedSeats': occupied}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rooms', type=int, default=200)
+    parser.add_argument('--queries', type=int, default=10, help='số lần gợi ý mỗi phòng')
+    parser.add_argument('--rows', type=int, default=20)
+    parser.add_argument('--cols', type=int, default=25)
+    parser.add_argument('--budget-ms', type=float, default=1.0)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    rooms = [make_room(rng, args.rows, args.cols) for _ in range(args.rooms)]
+
+    latencies = []
+    found = 0
+    for room in rooms:
+        for _ in range(args.queries):
+            count = rng.randint(1, 8)
+            seat_type = rng.choice(SEAT_TYPES)
+
+            started = time.perf_counter()
+            blocks = SeatGrid(room).recommend(count, seat_type, limit=3)
+            latencies.append((time.perf_counter() - started) * 1000)
+            found += bool(blocks)
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2]
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+
+    print(f"rooms={len(rooms)} seats/room={args.rows * args.cols} suggestions={len(latencies)}")
+    print(f"mean={statistics.mean(latencies):.3f}ms p50={p50:.3f}ms "
+          f"p99={p99:.3f}ms max={latencies[-1]:.3f}ms")
+    print(f"requests with at least one block: {found}/{len(latencies)}")
+
+    if p99 > args.budget_ms:
+        print(f"FAIL: p99 {p99:.3f}ms > budget {args.budget_ms}ms")
+        sys.exit(1)
+    print(f"OK: p99 within {args.budget_ms}ms budget")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,246 @@
+"""
+Backend giả lập (aiohttp.web) cho benchmark action server.
+
+Chạy trong thread riêng với event loop riêng, để cả action sync (chặn loop
+của action server) lẫn action async đều đo được trên cùng một backend.
+
+Dữ liệu sinh tất định theo seed: catalog phim/rạp, lịch chiếu hôm nay và
+ngày mai, phòng chiếu rows x cols ghế. Mọi endpoint chờ latency_ms
+(cộng ngẫu nhiên 0..jitter_ms) trước khi trả lời.
+"""
+import asyncio
+import random
+import string
+import threading
+from datetime import datetime, timedelta
+
+from aiohttp import web
+
+PRICES = {'standard': 75000, 'vip': 95000, 'couple': 180000}
+
+
+def make_catalog(num_movies=200, num_cinemas=20, seed=7):
+    rng = random.Random(seed)
+    movies = [
+        {
+            'id': i,
+            'title': f"Phim Thử Nghiệm {i}",
+            'runtime': rng.randint(90, 180),
+            'vote_average': round(rng.uniform(5, 9), 1),
+            'genres': ['Hành động'],
+            'release_date': '2025-10-01T00:00:00.000Z',
+        }
+        for i in range(1, num_movies + 1)
+    ]
+    cinemas = [
+        {'id': i, 'name': f"Rạp Thử Nghiệm {i}", 'address': f"{i} Quang Trung", 'phone': '0900000000'}
+        for i in range(1, num_cinemas + 1)
+    ]
+    return movies, cinemas
+
+
+def make_showtimes(movies, cinemas, per_movie=8, days=2):
+    """per_movie suất mỗi phim mỗi ngày, xoay vòng qua các rạp; id = movie_id * 1000 + n"""
+    today = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0)
+    showtimes = []
+    for movie in movies:
+        for day in range(days):
+            for slot in range(per_movie):
+                n = day * per_movie + slot
+                cinema = cinemas[(movie['id'] + n) % len(cinemas)]
+                start = today + timedelta(days=day, minutes=slot * 90)
+                showtimes.append({
+                    'id': movie['id'] * 1000 + n,
+                    'movie_id': movie['id'],
+                    'movie_title': movie['title'],
+                    'cinema_id': cinema['id'],
+                    'cinema_name': cinema['name'],
+                    'room_name': f"P{slot % 5 + 1}",
+                    'start_time': start.isoformat() + '.000Z',
+                    'show_time': start.strftime('%H:%M'),
+                })
+    return showtimes
+
+
+class FakeBackend:
+    def __init__(self, latency_ms=50.0, num_movies=200, num_cinemas=20,
+                 jitter_ms=0.0, showtimes_per_movie=8, rows=12, cols=10, seed=7):
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.movies, self.cinemas = make_catalog(num_movies, num_cinemas, seed)
+        self.showtimes = make_showtimes(self.movies, self.cinemas, showtimes_per_movie)
+        self.rows = rows
+        self.cols = cols
+        self.seed = seed
+
+        self._showtimes_by_id = {st['id']: st for st in self.showtimes}
+        self._showtimes_by_movie = {}
+        self._showtimes_by_cinema_date = {}
+        for st in self.showtimes:
+            self._showtimes_by_movie.setdefault(st['movie_id'], []).append(st)
+            key = (st['cinema_id'], st['start_time'][:10])
+            self._showtimes_by_cinema_date.setdefault(key, []).append(st)
+
+        self._orders = {}
+        self._rng = random.Random(seed)
+        self.hits = {}
+        self.url = None
+        self._loop = None
+        self._runner = None
+        self._started = threading.Event()
+
+    async def _delay(self, name):
+        self.hits[name] = self.hits.get(name, 0) + 1
+        delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            await asyncio.sleep(delay)
+
+    async def movies_handler(self, request):
+        await self._delay('movies')
+        return web.json_response({'success': True, 'movies': self.movies})
+
+    async def cinemas_handler(self, request):
+        await self._delay('cinemas')
+        return web.json_response({'success': True, 'cinemas': self.cinemas})
+
+    async def showtimes_by_movie(self, request):
+        await self._delay('showtimes_by_movie')
+        movie_id = int(request.match_info['movie_id'])
+        movie = next((m for m in self.movies if m['id'] == movie_id), {})
+        return web.json_response({
+            'success': True,
+            'movie': movie,
+            'dateTime': self._showtimes_by_movie.get(movie_id, []),
+        })
+
+    async def showtimes_by_cinema(self, request):
+        await self._delay('showtimes_by_cinema')
+        key = (int(request.match_info['cinema_id']), request.match_info['date'])
+        return web.json_response({'success': True, 'data': self._showtimes_by_cinema_date.get(key, [])})
+
+    async def showtimes_all(self, request):
+        await self._delay('showtimes_all')
+        return web.json_response({'success': True, 'data': self.showtimes})
+
+    async def showtime_detail(self, request):
+        await self._delay('showtime_detail')
+        showtime = self._showtimes_by_id.get(int(request.match_info['showtime_id']))
+        if showtime is None:
+            return web.json_response({'success': False, 'message': 'Showtime not found'}, status=404)
+        return web.json_response({'success': True, 'showtime': showtime})
+
+    def make_room(self, showtime_id):
+        """Phòng rows x cols: 2 hàng cuối couple, 1/3 giữa vip; ghế đã đặt tất định theo showtime_id"""
+        rng = random.Random(self.seed * 100003 + showtime_id)
+        occupancy = rng.uniform(0.1, 0.6)
+        available, occupied = [], []
+        for index, row in enumerate(string.ascii_uppercase[:self.rows]):
+            if index >= self.rows - 2:
+                seat_type = 'couple'
+            elif self.rows // 3 <= index < self.rows * 2 // 3:
+                seat_type = 'vip'
+            else:
+                seat_type = 'standard'
+            for col in range(1, self.cols + 1):
+                seat = {
+                    'seat_id': index * self.cols + col,
+                    'seat_number': f"{row}{col}",
+                    'seat_type_name': seat_type,
+                }
+                (occupied if rng.random() < occupancy else available).append(seat)
+        return available, occupied
+
+    async def seats_status(self, request):
+        await self._delay('seats_status')
+        showtime_id = int(request.match_info['showtime_id'])
+        showtime = self._showtimes_by_id.get(showtime_id, {})
+        available, occupied = self.make_room(showtime_id)
+        by_type = {}
+        for seat in available:
+            by_type.setdefault(seat['seat_type_name'], []).append(seat)
+        return web.json_response({
+            'success': True,
+            'showtimeId': showtime_id,
+            'roomInfo': {
+                'room_id': 1,
+                'room_name': showtime.get('room_name', 'P1'),
+                'cinema_id': showtime.get('cinema_id'),
+                'total_seats': len(available) + len(occupied),
+            },
+            'summary': {
+                'total': len(available) + len(occupied),
+                'available': len(available),
+                'reserved': 0,
+                'booked': len(occupied),
+            },
+            'availableSeats': available,
+            'availableByType': by_type,
+            'occupiedSeats': occupied,
+        })
+
+    async def ticket_prices(self, request):
+        await self._delay('ticket_prices')
+        return web.json_response({
+            'success': True,
+            'prices': [{'seat_type': seat_type, 'base_price': price} for seat_type, price in PRICES.items()],
+        })
+
+    async def create_booking(self, request):
+        await self._delay('create_booking')
+        body = await request.json()
+        # Như backend thật: key chỉ có nghĩa trong phạm vi một user
+        key = request.headers.get('Idempotency-Key')
+        if key:
+            key = (body.get('user_id'), key)
+        if key and key in self._orders:
+            return web.json_response(self._orders[key], status=201)
+
+        tickets = body.get('tickets', [])
+        if not tickets:
+            return web.json_response({'success': False, 'message': 'No tickets'}, status=400)
+
+        order = {
+            'success': True,
+            'data': {
+                'order_id': len(self._orders) + 1,
+                'grand_total': sum(t.get('ticket_price', 0) for t in tickets),
+            },
+        }
+        if key:
+            self._orders[key] = order
+        return web.json_response(order, status=201)
+
+    def make_app(self):
+        app = web.Application()
+        app.router.add_get('/api/movies', self.movies_handler)
+        app.router.add_get('/api/cinemas', self.cinemas_handler)
+        app.router.add_get('/api/showtimes/all', self.showtimes_all)
+        app.router.add_get('/api/showtimes/movies/{movie_id}', self.showtimes_by_movie)
+        app.router.add_get('/api/showtimes/datve/{cinema_id}/{date}', self.showtimes_by_cinema)
+        app.router.add_get('/api/showtimes/detail/{showtime_id}', self.showtime_detail)
+        app.router.add_get('/api/showtimes/seats-status/{showtime_id}', self.seats_status)
+        app.router.add_get('/api/ticket-prices/getprice/{cinema_id}/{date}', self.ticket_prices)
+        app.router.add_post('/api/bookings/create-booking', self.create_booking)
+        return app
+
+    def start(self):
+        threading.Thread(target=self._serve, name='fake-backend', daemon=True).start()
+        self._started.wait()
+        return self.url
+
+    def stop(self):
+        if self._loop:
+            asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+    def _serve(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._runner = web.AppRunner(self.make_app())
+        self._loop.run_until_complete(self._runner.setup())
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        self._loop.run_until_complete(site.start())
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/api"
+        self._started.set()
+        self._loop.run_forever()
@@ -0,0 +1 @@
+# Để pytest import được package actions khi chạy từ bất kỳ thư mục nào
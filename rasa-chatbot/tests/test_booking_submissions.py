@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+
+from actions.booking_submissions import (
+    PendingSubmissions, idempotency_key, is_successful, post_with_retry,
+)
+from actions.http_client import BackendError, BackendResponse
+
+OK = BackendResponse(201, '{"success": true, "order_id": 7}')
+FAILED = BackendResponse(400, '{"success": false}')
+
+
+def scripted(*results, delay=0):
+    """send() trả lần lượt từng kết quả (response hoặc exception)"""
+    calls = []
+
+    async def send():
+        calls.append(len(calls))
+        await asyncio.sleep(delay)
+        result = results[min(len(calls), len(results)) - 1]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return send, calls
+
+
+def test_idempotency_key_ignores_seat_order_case_and_repeats():
+    key = idempotency_key('s1', 1, 10, ['A1', 'a2'])
+    assert key == idempotency_key('s1', 1, 10, ['A2', 'A1', 'a1'])
+    assert len(key) == 32
+    assert key != idempotency_key('s1', 1, 10, ['A1', 'A3'])
+    assert key != idempotency_key('s1', 2, 10, ['A1', 'A2'])
+    assert key != idempotency_key('s1', 1, 11, ['A1', 'A2'])
+
+
+def test_idempotency_key_is_scoped_to_the_conversation():
+    # Hai khách cùng user_id mặc định đặt cùng ghế không được dùng chung đơn
+    assert idempotency_key('s1', 'guest_user', 10, ['A1']) != idempotency_key('s2', 'guest_user', 10, ['A1'])
+
+
+def test_is_successful():
+    assert is_successful(OK)
+    assert is_successful(BackendResponse(200, '{"success": true}'))
+    assert not is_successful(FAILED)
+    assert not is_successful(BackendResponse(200, '{"success": false}'))
+    assert not is_successful(BackendResponse(200, 'not json'))
+    assert not is_successful(BackendResponse(200, '[1, 2]'))
+
+
+def test_retries_retryable_status_then_succeeds():
+    send, calls = scripted(BackendResponse(503, ''), BackendResponse(409, ''), OK)
+    response = asyncio.run(post_with_retry(send, attempts=3, base_delay=0))
+    assert response is OK
+    assert len(calls) == 3
+
+
+def test_retries_backend_errors_then_raises():
+    send, calls = scripted(BackendError('down'))
+    with pytest.raises(BackendError):
+        asyncio.run(post_with_retry(send, attempts=3, base_delay=0))
+    assert len(calls) == 3
+
+
+def test_returns_last_retryable_response_when_attempts_run_out():
+    send, calls = scripted(BackendResponse(502, ''))
+    response = asyncio.run(post_with_retry(send, attempts=2, base_delay=0))
+    assert response.status_code == 502
+    assert len(calls) == 2
+
+
+def test_does_not_retry_client_errors():
+    send, calls = scripted(FAILED, OK)
+    response = asyncio.run(post_with_retry(send, attempts=3, base_delay=0))
+    assert response is FAILED
+    assert len(calls) == 1
+
+
+def test_concurrent_submissions_share_one_post():
+    send, calls = scripted(OK, delay=0.05)
+    submissions = PendingSubmissions()
+
+    async def main():
+        return await asyncio.gather(*(submissions.submit('key', send) for _ in range(3)))
+
+    assert asyncio.run(main()) == [OK] * 3
+    assert len(calls) == 1
+    assert submissions.stats() == {"submitted": 1, "deduplicated": 2, "size": 1}
+
+
+def test_successful_submission_is_reused():
+    send, calls = scripted(OK)
+    submissions = PendingSubmissions()
+
+    async def main():
+        first = await submissions.submit('key', send)
+        assert submissions.completed('key') is first
+        return await submissions.submit('key', send)
+
+    assert asyncio.run(main()) is OK
+    assert len(calls) == 1
+
+
+def test_failed_submission_can_be_retried():
+    send, calls = scripted(FAILED, OK)
+    submissions = PendingSubmissions()
+
+    async def main():
+        assert await submissions.submit('key', send) is FAILED
+        assert submissions.completed('key') is None
+        assert submissions.stats()['size'] == 0
+        return await submissions.submit('key', send)
+
+    assert asyncio.run(main()) is OK
+    assert len(calls) == 2
+
+
+def test_submission_expires_after_ttl():
+    send, calls = scripted(OK)
+    submissions = PendingSubmissions(ttl=0)
+
+    async def main():
+        await submissions.submit('key', send)
+        assert submissions.completed('key') is None
+        await submissions.submit('key', send)
+
+    asyncio.run(main())
+    assert len(calls) == 2
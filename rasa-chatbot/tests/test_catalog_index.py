@@ -0,0 +1,49 @@
+from actions.catalog_index import CatalogIndex
+
+MOVIES = [
+    {'id': 1, 'title': 'The Bad Guys 2'},
+    {'id': 2, 'title': 'The Bad Guys'},
+    {'id': 3, 'title': 'Avatar: Lửa Và Tro Tàn'},
+    {'id': 4, 'title': 'Spider-Man: No Way Home'},
+]
+
+ALIASES = {'bad guys': 'The Bad Guys', 'bad guys 2': 'The Bad Guys 2', 'spiderman': 'Spider-Man'}
+
+
+def make_index(items=MOVIES, aliases=ALIASES):
+    return CatalogIndex(items, lambda m: m['id'], lambda m: m['title'], aliases=aliases)
+
+
+def test_exact_name_without_diacritics():
+    assert make_index().resolve('avatar: lua va tro tan')['id'] == 3
+
+
+def test_alias_wins_over_ngram_match():
+    index = make_index()
+    assert index.resolve('bad guys')['id'] == 2
+    assert index.resolve('Bad Guys 2')['id'] == 1
+
+
+def test_alias_target_as_phrase():
+    # "spider-man" không phải tên đầy đủ, nhưng là cụm từ trong tên
+    assert make_index().resolve('spiderman')['id'] == 4
+
+
+def test_phrase_and_name_inside_query():
+    index = make_index()
+    assert index.resolve('lửa và tro tàn')['id'] == 3
+    assert index.resolve('lịch chiếu the bad guys tối nay')['id'] == 2
+
+
+def test_fuzzy_typo_and_unknown():
+    index = make_index()
+    assert index.resolve('avatr lua va tro tan')['id'] == 3
+    assert index.resolve('') is None
+    assert index.resolve('zzzz qqqq') is None
+
+
+def test_lookup_by_id_and_name():
+    index = make_index()
+    assert index.get(2)['title'] == 'The Bad Guys'
+    assert index.get_by_name('THE BAD GUYS 2')['id'] == 1
+    assert [m['id'] for m in index.find_all('bad guys')] == [1, 2]
@@ -0,0 +1,129 @@
+import pytest
+
+from actions import circuit_breaker
+from actions.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(circuit_breaker.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def make_breaker():
+    return CircuitBreaker('test', window=30, min_calls=4, failure_ratio=0.5,
+                          slow_call_seconds=2, slow_call_ratio=0.8, open_seconds=15)
+
+
+def trip(breaker):
+    for _ in range(4):
+        breaker.record(False, 0.1)
+    assert breaker.state == OPEN
+
+
+def test_stays_closed_below_min_calls(clock):
+    breaker = make_breaker()
+    for _ in range(3):
+        breaker.record(False, 0.1)
+    assert breaker.state == CLOSED
+    assert breaker.allow()
+
+
+def test_opens_on_failure_ratio_and_rejects(clock):
+    breaker = make_breaker()
+    breaker.record(True, 0.1)
+    breaker.record(True, 0.1)
+    breaker.record(False, 0.1)
+    assert breaker.state == CLOSED
+    breaker.record(False, 0.1)
+    assert breaker.state == OPEN
+
+    assert not breaker.allow()
+    assert breaker.stats()['rejected'] == 1
+    assert breaker.stats()['opened'] == 1
+
+
+def test_opens_on_slow_call_ratio(clock):
+    breaker = make_breaker()
+    for _ in range(4):
+        breaker.record(True, 2.5)
+    assert breaker.state == OPEN
+
+
+def test_old_calls_leave_the_window(clock):
+    breaker = make_breaker()
+    for _ in range(3):
+        breaker.record(False, 0.1)
+    clock[0] += 31
+    breaker.record(False, 0.1)
+    assert breaker.state == CLOSED
+    assert breaker.stats()['calls'] == 1
+
+
+def test_half_open_allows_a_single_probe(clock):
+    breaker = make_breaker()
+    trip(breaker)
+    clock[0] += 14
+    assert not breaker.allow()
+
+    clock[0] += 1
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()
+
+
+def test_successful_probe_closes(clock):
+    breaker = make_breaker()
+    trip(breaker)
+    clock[0] += 15
+    probe = breaker.allow()
+    assert probe
+    breaker.record(True, 0.1, probe)
+
+    assert breaker.state == CLOSED
+    assert breaker.stats()['calls'] == 0
+    assert breaker.allow()
+
+
+@pytest.mark.parametrize('success, latency', [(False, 0.1), (True, 3.0)])
+def test_failed_or_slow_probe_reopens(clock, success, latency):
+    breaker = make_breaker()
+    trip(breaker)
+    clock[0] += 15
+    probe = breaker.allow()
+    breaker.record(success, latency, probe)
+
+    assert breaker.state == OPEN
+    assert breaker.stats()['opened'] == 2
+    assert not breaker.allow()
+
+
+def test_release_lets_another_probe_through(clock):
+    breaker = make_breaker()
+    trip(breaker)
+    clock[0] += 15
+    probe = breaker.allow()
+    assert probe
+    assert not breaker.allow()
+
+    breaker.release(probe)
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+
+
+def test_stale_results_do_not_decide_the_probe(clock):
+    breaker = make_breaker()
+    # Lần gọi bắt đầu khi breaker còn đóng, xong sau khi breaker đã half open
+    stale = breaker.allow()
+    trip(breaker)
+    clock[0] += 15
+    probe = breaker.allow()
+
+    breaker.record(True, 0.1, stale)
+    breaker.release(stale)
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()
+
+    breaker.record(False, 0.1, probe)
+    assert breaker.state == OPEN
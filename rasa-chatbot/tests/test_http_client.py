@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from actions import http_client
+from actions.http_client import BackendResponse, BackendTimeout
+from actions.latency_budget import latency_budget
+
+
+@pytest.fixture
+def slow_backend(monkeypatch):
+    calls = []
+
+    async def request(method, path, timeout=5, **kwargs):
+        calls.append((path, timeout))
+        await asyncio.sleep(0.2)
+        return BackendResponse(200, '{"ok": true}')
+
+    monkeypatch.setattr(http_client, 'request', request)
+    return calls
+
+
+def test_identical_gets_share_one_request(slow_backend):
+    async def main():
+        return await asyncio.gather(*(http_client.get('/movies') for _ in range(5)))
+
+    responses = asyncio.run(main())
+    assert [r.json() for r in responses] == [{'ok': True}] * 5
+    assert len(slow_backend) == 1
+
+
+def test_small_budget_of_first_caller_does_not_fail_other_waiters(slow_backend):
+    async def tight():
+        with latency_budget(0.05):
+            return await http_client.get('/movies')
+
+    async def relaxed():
+        await asyncio.sleep(0.01)
+        with latency_budget(5):
+            return await http_client.get('/movies')
+
+    async def main():
+        return await asyncio.gather(tight(), relaxed(), return_exceptions=True)
+
+    first, second = asyncio.run(main())
+    assert isinstance(first, BackendTimeout)
+    assert second.json() == {'ok': True}
+    assert len(slow_backend) == 1
+
+
+def test_exhausted_budget_fails_without_calling_backend(slow_backend):
+    async def main():
+        with latency_budget(0):
+            return await http_client.get('/movies')
+
+    with pytest.raises(BackendTimeout):
+        asyncio.run(main())
+    assert slow_backend == []
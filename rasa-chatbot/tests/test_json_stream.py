@@ -0,0 +1,66 @@
+import json
+import random
+
+import pytest
+
+from actions.json_stream import MOVIE_FIELDS, ItemStream, parse_items, project
+
+PAYLOAD = json.dumps({
+    'success': True,
+    'total': 3,
+    'took_ms': 12.5e-1,
+    'movies': [
+        {'id': 1, 'title': 'Avatar', 'runtime': 162, 'vote_average': 7.25,
+         'genres': ['Hành động', 'Viễn tưởng'], 'poster': 'x.jpg', 'description': 'Mô tả ' * 60},
+        {'id': 22, 'title': 'Mưa Đỏ', 'runtime': 124, 'vote_average': -1.5e-3,
+         'release_date': '2025-08-22T00:00:00.000Z', 'cast': [{'name': 'A'}]},
+        {'id': 333, 'title': 'Venom "The Last Dance"', 'vote_average': 10, 'updated_at': None},
+    ],
+}, ensure_ascii=False)
+
+
+def expected(payload=PAYLOAD, fields=MOVIE_FIELDS):
+    return [project(m, fields) for m in json.loads(payload)['movies']]
+
+
+def parse_chunks(chunks, fields=MOVIE_FIELDS):
+    stream = ItemStream(('data', 'movies'), fields)
+    items = []
+    for chunk in chunks:
+        items.extend(stream.feed(chunk))
+    items.extend(stream.feed('', final=True))
+    return items
+
+
+def test_parse_whole_document():
+    assert parse_items(PAYLOAD, ('movies',), MOVIE_FIELDS) == expected()
+
+
+@pytest.mark.parametrize('offset', range(len(PAYLOAD) + 1))
+def test_split_at_every_offset(offset):
+    assert parse_chunks([PAYLOAD[:offset], PAYLOAD[offset:]]) == expected()
+
+
+def test_number_split_before_fraction():
+    # "12." chưa phải số hoàn chỉnh, phải chờ đoạn sau
+    assert parse_chunks(['{"movies": [12.', '5, 3]}'], None) == [12.5, 3]
+    assert parse_chunks(['[1', 'e3, -', '2]'], None) == [1000.0, -2]
+
+
+def test_random_chunks():
+    rng = random.Random(0)
+    for _ in range(300):
+        cuts = sorted(rng.sample(range(1, len(PAYLOAD)), 5))
+        chunks = [PAYLOAD[a:b] for a, b in zip([0] + cuts, cuts + [len(PAYLOAD)])]
+        assert parse_chunks(chunks) == expected()
+
+
+def test_top_level_array_and_description_truncated():
+    items = parse_items(json.dumps([{'id': 1, 'description': 'x' * 500, 'cast': []}]), fields=MOVIE_FIELDS)
+    assert items == [{'id': 1, 'description': 'x' * 201}]
+
+
+@pytest.mark.parametrize('body', ['{"movies": [1, 2', '{"movies": [{"id": 1}', 'nope'])
+def test_invalid_documents_raise(body):
+    with pytest.raises(ValueError):
+        parse_chunks([body])
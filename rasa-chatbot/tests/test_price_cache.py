@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from actions import price_cache as price_cache_module
+from actions.price_cache import DEFAULT_PRICE_TABLE, PriceCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(price_cache_module.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def make_cache(**kwargs):
+    calls = []
+
+    async def fetch(cinema_id, date):
+        calls.append((cinema_id, date))
+        return {'standard': 60000.0, 'vip': 90000.0}
+
+    return PriceCache(fetch, **kwargs), calls
+
+
+def test_table_is_cached_per_cinema_and_date(clock):
+    cache, calls = make_cache()
+
+    async def main():
+        first = await cache.get(1, '2026-10-18')
+        again = await cache.get('1', '2026-10-18')
+        await cache.get(1, '2026-10-19')
+        return first, again
+
+    first, again = asyncio.run(main())
+    assert first is again
+    assert first.price_for('vip') == (90000.0, False)
+    assert len(calls) == 2
+    assert cache.stats()['hits'] == 1
+
+
+def test_expired_tables_are_dropped_on_store(clock):
+    cache, _ = make_cache(ttl=60)
+
+    async def main():
+        for day in range(1, 4):
+            await cache.get(1, f"2026-10-0{day}")
+            clock[0] += 61
+
+    asyncio.run(main())
+    assert cache.stats()['size'] == 1
+
+
+def test_cache_is_bounded_least_recently_used_first(clock):
+    cache, calls = make_cache(max_size=2)
+
+    async def main():
+        await cache.get(1, 'd1')
+        await cache.get(2, 'd1')
+        await cache.get(1, 'd1')
+        await cache.get(3, 'd1')
+        await cache.get(1, 'd1')
+        await cache.get(2, 'd1')
+
+    asyncio.run(main())
+    assert cache.stats()['size'] == 2
+    # Rạp 2 ít dùng nhất nên bị bỏ khi thêm rạp 3, rạp 1 vẫn còn
+    assert calls == [(1, 'd1'), (2, 'd1'), (3, 'd1'), (2, 'd1')]
+
+
+def test_missing_prices_fall_back_to_default_and_are_not_cached(clock):
+    async def fetch(cinema_id, date):
+        return None
+
+    cache = PriceCache(fetch)
+    assert asyncio.run(cache.get(1, 'd1')) is DEFAULT_PRICE_TABLE
+    assert cache.stats()['size'] == 0
+    assert cache.stats()['default_tables'] == 1
@@ -0,0 +1,59 @@
+import pytest
+
+from actions.seat_parser import MAX_SEATS_PER_BOOKING, has_range_syntax, parse_seat_expression
+
+
+@pytest.mark.parametrize('text, seats', [
+    ("A1 A2", ['A1', 'A2']),
+    ("a1, a2 và b3", ['A1', 'A2', 'B3']),
+    ("A1-A4", ['A1', 'A2', 'A3', 'A4']),
+    ("A1-4", ['A1', 'A2', 'A3', 'A4']),
+    ("C5 đến C7", ['C5', 'C6', 'C7']),
+    ("hàng C từ 5 đến 7", ['C5', 'C6', 'C7']),
+    ("dãy D số 1 tới 3", ['D1', 'D2', 'D3']),
+    ("AA12", ['AA12']),
+    ("A4-A2", ['A2', 'A3', 'A4']),
+])
+def test_parses_seat_expressions(text, seats):
+    selection = parse_seat_expression(text)
+    assert selection.seats == seats
+    assert selection.duplicates == []
+    assert selection.invalid == []
+
+
+def test_reports_duplicates_once_in_mention_order():
+    selection = parse_seat_expression("A1-A3, A2 và A2, A1")
+    assert selection.seats == ['A1', 'A2', 'A3']
+    assert selection.duplicates == ['A2', 'A1']
+
+
+def test_range_across_rows_is_invalid():
+    selection = parse_seat_expression("A1-B3 và C1")
+    assert selection.seats == ['C1']
+    assert selection.invalid == ['A1-B3']
+
+
+def test_range_longer_than_limit_is_invalid():
+    selection = parse_seat_expression(f"A1-A{MAX_SEATS_PER_BOOKING + 1}")
+    assert selection.seats == []
+    assert len(selection.invalid) == 1
+
+    selection = parse_seat_expression(f"A1-A{MAX_SEATS_PER_BOOKING}")
+    assert len(selection.seats) == MAX_SEATS_PER_BOOKING
+
+
+def test_text_without_seats():
+    assert parse_seat_expression("cho mình 2 vé nhé") == ([], [], [])
+
+
+@pytest.mark.parametrize('text, expected', [
+    ("đặt ghế A1-A8", True),
+    ("ghế A1-8", True),
+    ("C5 đến C10", True),
+    ("hàng C từ 5 đến 10", True),
+    ("A1 A2, B3", False),
+    ("đặt vé suất 7", False),
+    ("", False),
+])
+def test_has_range_syntax(text, expected):
+    assert has_range_syntax(text) is expected
@@ -0,0 +1,72 @@
+from actions.seat_recommender import SeatGrid, parse_seat_code
+
+
+def seats_status(available, occupied=(), seat_types=None):
+    """Payload dạng /showtimes/seats-status của backend"""
+    seat_types = seat_types or {}
+
+    def seat(number):
+        return {'seat_id': number, 'seat_number': number,
+                'seat_type_name': seat_types.get(number, 'Standard')}
+
+    return {
+        'availableSeats': [seat(n) for n in available],
+        'occupiedSeats': [seat(n) for n in occupied],
+    }
+
+
+def row(name, columns):
+    return [f"{name}{c}" for c in columns]
+
+
+def test_parse_seat_code():
+    assert parse_seat_code('c12') == ('C', 12)
+    assert parse_seat_code(' AA3 ') == ('AA', 3)
+    assert parse_seat_code('12') is None
+
+
+def test_recommend_skips_gaps_in_a_row():
+    # A1-A2 trống, A3 đã đặt, A4-A6 trống: block 3 ghế duy nhất là A4-A6
+    grid = SeatGrid(seats_status(row('A', [1, 2, 4, 5, 6]), occupied=['A3']))
+
+    blocks = grid.recommend(3)
+    assert [block.label for block in blocks] == ['A4-A6']
+    assert blocks[0].seat_numbers == ['A4', 'A5', 'A6']
+    assert grid.recommend(4) == []
+
+
+def test_recommend_prefers_row_center_and_does_not_overlap():
+    grid = SeatGrid(seats_status(row('A', range(1, 11))))
+
+    blocks = grid.recommend(2, limit=5)
+    assert blocks[0].label == 'A5-A6'
+    taken = [seat for block in blocks for seat in block.seat_numbers]
+    assert len(taken) == len(set(taken)) == 10
+
+
+def test_recommend_filters_by_seat_type():
+    data = seats_status(row('A', range(1, 5)) + row('B', range(1, 5)),
+                        seat_types={f"B{c}": 'VIP' for c in range(1, 5)})
+    grid = SeatGrid(data)
+
+    assert sorted(grid.seat_types) == ['standard', 'vip']
+    blocks = grid.recommend(2, seat_type='VIP')
+    assert blocks and all(block.row == 'B' and block.seat_type == 'vip' for block in blocks)
+
+
+def test_recommend_keeps_couple_seats_paired():
+    data = seats_status(row('H', range(1, 7)), seat_types={f"H{c}": 'Couple' for c in range(1, 7)})
+    grid = SeatGrid(data)
+
+    blocks = grid.recommend(2, limit=5)
+    assert sorted(block.label for block in blocks) == ['H1-H2', 'H3-H4', 'H5-H6']
+
+
+def test_recommend_rounds_couple_blocks_up_to_whole_pairs():
+    data = seats_status(row('H', range(1, 9)), seat_types={f"H{c}": 'Couple' for c in range(1, 9)})
+    grid = SeatGrid(data)
+
+    # 3 người -> 2 ghế đôi, không bao giờ dừng giữa một cặp
+    blocks = grid.recommend(3, limit=5)
+    assert [block.label for block in blocks] == ['H3-H6']
+    assert blocks[0].seat_numbers == ['H3', 'H4', 'H5', 'H6']
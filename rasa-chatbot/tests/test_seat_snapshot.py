@@ -0,0 +1,62 @@
+import asyncio
+import json
+
+from actions.http_client import BackendResponse
+from actions.seat_snapshot import SeatSnapshot, SeatSnapshotCache
+
+
+def seats_status(available, occupied=(), seat_types=None):
+    """Payload dạng /showtimes/seats-status của backend"""
+    seat_types = seat_types or {}
+
+    def seat(number):
+        return {'seat_id': number, 'seat_number': number,
+                'seat_type_name': seat_types.get(number, 'Standard')}
+
+    return {
+        'availableSeats': [seat(n) for n in available],
+        'occupiedSeats': [seat(n) for n in occupied],
+    }
+
+
+def test_snapshot_validates_against_available_seats():
+    snapshot = SeatSnapshot('1', seats_status(['A1', 'A2', 'B1'], occupied=['A3']))
+
+    found, missing = snapshot.validate(['a1', 'A3', 'Z9', 'B1'])
+    assert [seat.number for seat in found] == ['A1', 'B1']
+    assert missing == ['A3', 'Z9']
+    assert snapshot.get_available('a2').seat_type == 'standard'
+    assert len(snapshot.positions) == 4
+
+
+def test_snapshot_counts_by_seat_type():
+    data = seats_status(['A1', 'A2', 'B1', 'B2', 'B3'], occupied=['A3'],
+                        seat_types={'B1': 'VIP', 'B2': 'VIP'})
+    snapshot = SeatSnapshot('1', data)
+
+    assert snapshot.count_available() == 5
+    assert snapshot.count_available('vip') == 2
+    assert snapshot.count_available('VIP') == 2
+    assert snapshot.count_available('couple') == 0
+
+
+def test_snapshot_versions_increase():
+    first = SeatSnapshot('1', seats_status(['A1']))
+    second = SeatSnapshot('1', seats_status(['A1']))
+    assert second.version > first.version
+
+
+def test_snapshot_cache_keys_content_not_fetch_count():
+    payloads = [seats_status(['A1', 'A2']), seats_status(['A1', 'A2']), seats_status(['A1'])]
+
+    async def fetch(showtime_id):
+        return BackendResponse(200, json.dumps({'success': True, **payloads.pop(0)}))
+
+    async def main():
+        cache = SeatSnapshotCache(fetch, ttl=0)
+        return [(await cache.get('1'))[1] for _ in range(3)]
+
+    first, same, changed = asyncio.run(main())
+    assert first.version != same.version
+    assert first.content == same.content
+    assert changed.content != first.content
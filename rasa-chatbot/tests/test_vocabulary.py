@@ -0,0 +1,52 @@
+from operator import itemgetter
+
+from actions.catalog_index import CatalogIndex
+from actions.vocabulary import VocabularyBuilder, cinema_variants, movie_variants
+
+MOVIES = [
+    {'id': 1, 'title': 'The Bad Guys 2: Phi Vụ Mới', 'updated_at': 'v1'},
+    {'id': 2, 'title': 'Avatar: Lửa Và Tro Tàn', 'updated_at': 'v1'},
+]
+
+
+def make_builder(mappings=None):
+    return VocabularyBuilder(itemgetter('id'), itemgetter('title'), movie_variants,
+                             keywords=('phim',), mappings=mappings,
+                             updated_getter=itemgetter('updated_at'))
+
+
+def test_variants():
+    assert movie_variants('The Bad Guys 2: Phi Vụ Mới') == [
+        'the bad guys 2 phi vu moi', 'bad guys 2 phi vu moi', 'the bad guys 2', 'bad guys 2',
+    ]
+    assert cinema_variants('Rạp Lotte Gò Vấp') == ['lotte go vap', 'go vap']
+    assert cinema_variants('CGV Vincom') == ['cgv vincom']
+
+
+def test_mappings_normalize_user_names_through_the_index():
+    vocabulary = make_builder().update(MOVIES)
+    assert vocabulary.mappings['bad guys 2'] == 'The Bad Guys 2: Phi Vụ Mới'
+    assert ('phim', None) in vocabulary.terms
+
+    index = CatalogIndex(MOVIES, itemgetter('id'), itemgetter('title'), aliases=vocabulary.mappings)
+    assert index.resolve('Bad Guys 2')['id'] == 1
+    assert index.resolve('avatar')['id'] == 2
+
+
+def test_static_mappings_win_and_ambiguous_variants_are_dropped():
+    movies = MOVIES + [{'id': 3, 'title': 'The Bad Guys 2 (Lồng Tiếng)', 'updated_at': 'v1'}]
+    vocabulary = make_builder({'Bad Guys': 'The Bad Guys 2: Phi Vụ Mới'}).update(movies)
+
+    assert 'bad guys 2' not in vocabulary.mappings
+    assert vocabulary.mappings['bad guys'] == 'The Bad Guys 2: Phi Vụ Mới'
+
+
+def test_unchanged_catalog_keeps_the_same_vocabulary():
+    builder = make_builder()
+    first = builder.update(MOVIES)
+    assert builder.update([dict(m) for m in MOVIES]) is first
+
+    changed = builder.update([MOVIES[0], dict(MOVIES[1], updated_at='v2', title='Avatar 3')])
+    assert changed is not first
+    assert changed.version == first.version + 1
+    assert 'avatar 3' in changed.mappings
@@ -0,0 +1,64 @@
+import asyncio
+
+from actions.warmup import Warmup
+
+
+async def ok():
+    return True
+
+
+async def fail():
+    raise RuntimeError('backend down')
+
+
+async def slow():
+    await asyncio.sleep(1)
+
+
+def run(warmup, stages):
+    async def main():
+        warmup.start(stages)
+        return await warmup.task
+
+    return asyncio.run(main())
+
+
+def test_complete_warmup_marks_ready(tmp_path):
+    ready_file = tmp_path / 'ready'
+    warmup = Warmup(timeout=1, ready_file=str(ready_file))
+    run(warmup, [{'movies': ok, 'cinemas': ok}, {'showtimes': ok}])
+
+    assert warmup.status == 'complete'
+    assert warmup.ready.is_set()
+    assert ready_file.exists()
+    assert warmup.stats()['ready'] == 1
+
+
+def test_failed_step_stops_later_stages_and_is_not_ready(tmp_path):
+    ready_file = tmp_path / 'ready'
+    called = []
+
+    async def later():
+        called.append(True)
+
+    warmup = Warmup(timeout=1, ready_file=str(ready_file))
+    report = run(warmup, [{'movies': ok, 'cinemas': fail}, {'showtimes': later}])
+
+    assert warmup.status == 'partial'
+    assert report['cinemas'] == {'ok': False, 'seconds': report['cinemas']['seconds'], 'error': 'backend down'}
+    assert not called
+    assert not warmup.ready.is_set()
+    assert not ready_file.exists()
+    assert warmup.stats()['ready'] == 0
+    assert warmup.stats()['partial'] == 1
+
+
+def test_timeout_is_not_ready(tmp_path):
+    ready_file = tmp_path / 'ready'
+    warmup = Warmup(timeout=0.05, ready_file=str(ready_file))
+    run(warmup, [{'movies': slow}])
+
+    assert warmup.status == 'timeout'
+    assert not warmup.ready.is_set()
+    assert not ready_file.exists()
+    assert warmup.stats()['timeout'] == 1